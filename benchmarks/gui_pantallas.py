@@ -0,0 +1,324 @@
+"""Tiempo de construcción, widgets y memoria de cada pantalla con datos reales.
+
+Para cada escala de benchmarks.suite_db genera un hotel con
+database.generador y abre cada pantalla del dashboard en un proceso nuevo
+(así la memoria y las cachés de una pantalla no afectan a la siguiente).
+Por pantalla se mide:
+
+    construccion_ms  lo que tarda la llamada que la abre (abrir_habitaciones, ...)
+    asentado_ms      hasta que no quedan consultas del ejecutor ni after()
+                     pendientes y update_idletasks() terminó de dibujar
+    widgets          widgets vivos bajo la raíz
+    rss_mb           memoria residente del proceso con la pantalla abierta
+    rss_pantalla_mb  lo que agregó la pantalla sobre el dashboard vacío
+
+"inicio" es la construcción del dashboard completo (mostrar_inicio incluido).
+
+Necesita un servidor X: si DISPLAY no está definida se inicia Xvfb (debe
+estar instalado) y se detiene al terminar. Con --comparar termina con
+código 1 si alguna pantalla empeoró respecto de un JSON anterior.
+
+Uso:
+    python -m benchmarks.gui_pantallas [--escalas pequena,mediana] [--pantallas reservas,huespedes]
+                                       [--repeticiones 3] [--salida resultados_gui.json]
+                                       [--comparar anterior.json] [--umbral 1.5]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+
+from benchmarks.suite_db import ESCALAS
+from database import generador
+from database.db_manager import DatabaseManager
+
+VERSION_FORMATO = 1
+
+# Pantalla -> método de DashboardWindow que la abre (None: el propio dashboard)
+PANTALLAS = {
+    "inicio": None,
+    "habitaciones": "abrir_habitaciones",
+    "reservas": "abrir_reservas",
+    "huespedes": "abrir_huesped",
+    "empleados": "abrir_empleados",
+    "reportes": "abrir_reportes",
+}
+
+# Factor a partir del cual cada medida cuenta como regresión (--umbral cambia los de tiempo)
+UMBRALES = {"construccion_ms": 1.5, "asentado_ms": 1.5, "widgets": 1.1, "rss_pantalla_mb": 1.25}
+# Diferencias absolutas por debajo de las cuales no se avisa (ruido)
+MINIMOS = {"construccion_ms": 5.0, "asentado_ms": 5.0, "widgets": 5, "rss_pantalla_mb": 1.0}
+
+# Una pantalla que no se asienta en este tiempo se informa como tal
+ESPERA_MAXIMA = 60.0
+# after() de customtkinter que se reprograman para siempre (escala y tema): no son trabajo pendiente
+_CICLOS_CTK = ("check_dpi_scaling", "update")
+RESOLUCION_XVFB = "1600x900x24"
+
+
+# ==================== Proceso hijo: una pantalla ====================
+
+def _rss_mb():
+    """Memoria residente actual del proceso en MB"""
+    try:
+        with open("/proc/self/statm") as archivo:
+            return int(archivo.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        # Sin /proc (macOS): el máximo, no el actual
+        import resource
+        maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maximo / 2 ** 20 if sys.platform == "darwin" else maximo / 2 ** 10
+
+
+def _contar_widgets(widget):
+    return 1 + sum(_contar_widgets(hijo) for hijo in widget.winfo_children())
+
+
+def _after_pendientes(root):
+    """Eventos after() programados que no son los ciclos permanentes de customtkinter"""
+    pendientes = 0
+    for id_after in root.tk.splitlist(root.tk.call("after", "info")):
+        # El script es el comando registrado: id + nombre de la función
+        script = root.tk.splitlist(root.tk.call("after", "info", id_after))[0]
+        if not str(script).endswith(_CICLOS_CTK):
+            pendientes += 1
+    return pendientes
+
+
+def _esperar_asentado(root, gestor, desde):
+    """Procesa eventos hasta que no queda trabajo pendiente; devuelve segundos desde `desde`"""
+    while time.perf_counter() - desde < ESPERA_MAXIMA:
+        root.update()
+        ejecutor = gestor._ejecutor
+        ocupado = ejecutor is not None and (ejecutor._pendientes or ejecutor._revisando)
+        # Retardos, indicadores de carga, páginas siguientes
+        if not ocupado and not _after_pendientes(root):
+            root.update_idletasks()
+            return time.perf_counter() - desde
+        time.sleep(0.001)
+    return None
+
+
+def medir_pantalla(pantalla, ruta_db):
+    """Abre la pantalla sobre ruta_db y devuelve sus medidas (se ejecuta en el proceso hijo)"""
+    import tkinter as tk
+
+    from database.conexiones import GestorConexiones
+    from gui.dashboard_window import DashboardWindow
+
+    gestor = GestorConexiones(ruta_db)
+    root = tk.Tk()
+    try:
+        base_rss = _rss_mb()
+        inicio = time.perf_counter()
+        dashboard = DashboardWindow(root, "Prueba", "Suite", "Gerente", "Administrador",
+                                    db=gestor.db, precargar=False)
+        construccion = time.perf_counter() - inicio
+
+        metodo = PANTALLAS[pantalla]
+        if metodo is not None:
+            _esperar_asentado(root, gestor, time.perf_counter())
+            base_rss = _rss_mb()
+            inicio = time.perf_counter()
+            getattr(dashboard, metodo)()
+            construccion = time.perf_counter() - inicio
+
+        asentado = _esperar_asentado(root, gestor, inicio)
+        rss = _rss_mb()
+        return {
+            "construccion_ms": construccion * 1000,
+            "asentado_ms": None if asentado is None else asentado * 1000,
+            "widgets": _contar_widgets(root),
+            "rss_mb": rss,
+            "rss_pantalla_mb": rss - base_rss,
+        }
+    finally:
+        root.destroy()
+        gestor.cerrar()
+
+
+# ==================== Proceso principal ====================
+
+@contextmanager
+def pantalla_virtual():
+    """Asegura un servidor X: usa DISPLAY si existe, si no inicia Xvfb"""
+    if os.environ.get("DISPLAY"):
+        yield os.environ["DISPLAY"]
+        return
+
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        raise RuntimeError("No hay DISPLAY ni Xvfb instalado (apt install xvfb)")
+
+    numero = 99
+    while os.path.exists(f"/tmp/.X{numero}-lock"):
+        numero += 1
+    display = f":{numero}"
+    proceso = subprocess.Popen([xvfb, display, "-screen", "0", RESOLUCION_XVFB, "-nolisten", "tcp"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        # Listo cuando aparece el socket
+        limite = time.monotonic() + 10
+        while not os.path.exists(f"/tmp/.X11-unix/X{numero}"):
+            if proceso.poll() is not None or time.monotonic() > limite:
+                raise RuntimeError(f"Xvfb no arrancó en {display}")
+            time.sleep(0.05)
+
+        os.environ["DISPLAY"] = display
+        yield display
+    finally:
+        os.environ.pop("DISPLAY", None)
+        proceso.terminate()
+        proceso.wait()
+
+
+def _medir_en_proceso(pantalla, ruta_db):
+    """Lanza un proceso hijo que mide la pantalla y devuelve su resultado"""
+    salida = subprocess.run(
+        [sys.executable, "-m", "benchmarks.gui_pantallas", "--medir", pantalla, ruta_db],
+        capture_output=True, text=True, check=False
+    )
+    if salida.returncode != 0:
+        raise RuntimeError(f"Falló la pantalla {pantalla}:\n{salida.stderr.strip()}")
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+def _combinar(mediciones):
+    """Mejor tiempo de las repeticiones; widgets y memoria de la última"""
+    tiempos = lambda clave: [m[clave] for m in mediciones if m[clave] is not None]
+    resultado = dict(mediciones[-1])
+    for clave in ("construccion_ms", "asentado_ms"):
+        resultado[clave] = min(tiempos(clave), default=None)
+    resultado["rss_pantalla_mb"] = min(m["rss_pantalla_mb"] for m in mediciones)
+    resultado["repeticiones"] = len(mediciones)
+    return resultado
+
+
+def medir_escala(nombre, parametros, pantallas, repeticiones, semilla, al_avanzar=None):
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta_db = os.path.join(carpeta, "hotel.db")
+        db = DatabaseManager(ruta_db)
+        try:
+            filas = generador.generar(db, semilla=semilla, **parametros)
+            # Deja la matriz de ocupación generada, como en una base en uso
+            db.ocupacion_por_dia(date.today().isoformat(), date.today().isoformat())
+        finally:
+            db.cerrar()
+
+        resultados = {}
+        for pantalla in pantallas:
+            resultados[pantalla] = _combinar(
+                [_medir_en_proceso(pantalla, ruta_db) for _ in range(repeticiones)])
+            if al_avanzar is not None:
+                al_avanzar(nombre, pantalla, resultados[pantalla])
+
+    return {"parametros": parametros, "filas": filas, "pantallas": resultados}
+
+
+def ejecutar(escalas=None, pantallas=None, repeticiones=3, semilla=1, al_avanzar=None):
+    """Mide las pantallas en cada escala y devuelve el diccionario que se guarda como JSON"""
+    import customtkinter
+    with pantalla_virtual() as display:
+        return {
+            "version": VERSION_FORMATO,
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "entorno": {
+                "python": platform.python_version(),
+                "plataforma": platform.platform(),
+                "customtkinter": customtkinter.__version__,
+                "display": display,
+            },
+            "semilla": semilla,
+            "escalas": {
+                nombre: medir_escala(nombre, ESCALAS[nombre], pantallas or list(PANTALLAS),
+                                     repeticiones, semilla, al_avanzar)
+                for nombre in escalas or ESCALAS
+            },
+        }
+
+
+def comparar(anterior, actual, umbral=None):
+    """Medidas que crecieron más que su umbral: lista de (escala, pantalla, medida, antes, ahora)"""
+    umbrales = dict(UMBRALES)
+    if umbral is not None:
+        umbrales.update(construccion_ms=umbral, asentado_ms=umbral)
+
+    regresiones = []
+    for escala, resultado in actual["escalas"].items():
+        previas = anterior.get("escalas", {}).get(escala, {}).get("pantallas", {})
+        for pantalla, medidas in resultado["pantallas"].items():
+            for medida, factor in umbrales.items():
+                antes = previas.get(pantalla, {}).get(medida)
+                ahora = medidas.get(medida)
+                if antes is None or ahora is None:
+                    continue
+                if ahora > antes * factor and ahora - antes > MINIMOS[medida]:
+                    regresiones.append((escala, pantalla, medida, antes, ahora))
+    return regresiones
+
+
+def _mostrar(escala, pantalla, medidas):
+    asentado = medidas["asentado_ms"]
+    asentado = "sin asentar" if asentado is None else f"{asentado:8.1f} ms"
+    print(f"  {escala:<8} {pantalla:<13} construcción {medidas['construccion_ms']:8.1f} ms  "
+          f"asentado {asentado}  {medidas['widgets']:>6} widgets  "
+          f"+{medidas['rss_pantalla_mb']:.1f} MB (RSS {medidas['rss_mb']:.0f} MB)")
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Construcción de las pantallas con datos reales")
+    parser.add_argument("--escalas", default=",".join(ESCALAS))
+    parser.add_argument("--pantallas", default=",".join(PANTALLAS))
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--salida", default="resultados_gui.json")
+    parser.add_argument("--comparar", help="JSON de una corrida anterior")
+    parser.add_argument("--umbral", type=float, help="factor de tiempo a partir del cual hay regresión")
+    parser.add_argument("--semilla", type=int, default=1)
+    parser.add_argument("--medir", nargs=2, metavar=("PANTALLA", "DB"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argumentos)
+
+    if args.medir:
+        # Proceso hijo: una sola pantalla, resultado como JSON en stdout
+        print(json.dumps(medir_pantalla(*args.medir)))
+        return 0
+
+    escalas = [e.strip() for e in args.escalas.split(",") if e.strip()]
+    pantallas = [p.strip() for p in args.pantallas.split(",") if p.strip()]
+    desconocidas = [e for e in escalas if e not in ESCALAS] + [p for p in pantallas if p not in PANTALLAS]
+    if desconocidas:
+        parser.error(f"escalas o pantallas desconocidas: {', '.join(desconocidas)}")
+
+    try:
+        resultados = ejecutar(escalas, pantallas, args.repeticiones, args.semilla, _mostrar)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    with open(args.salida, "w", encoding="utf-8") as archivo:
+        json.dump(resultados, archivo, ensure_ascii=False, indent=2)
+    print(f"Resultados en {args.salida}")
+
+    if not args.comparar:
+        return 0
+
+    with open(args.comparar, encoding="utf-8") as archivo:
+        anterior = json.load(archivo)
+    regresiones = comparar(anterior, resultados, args.umbral)
+    if not regresiones:
+        print(f"Sin regresiones respecto de {args.comparar}")
+        return 0
+
+    for escala, pantalla, medida, antes, ahora in regresiones:
+        print(f"REGRESIÓN {escala} {pantalla} {medida}: {antes:.1f} -> {ahora:.1f}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
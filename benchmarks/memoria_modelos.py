@@ -0,0 +1,81 @@
+"""Memoria por cada 100k filas: tuplas vs dicts vs sqlite3.Row vs modelos con slots.
+
+Uso:
+    python -m benchmarks.memoria_modelos [filas]
+"""
+import sqlite3
+import sys
+import time
+import tracemalloc
+
+from models.reserva import ReservaDetalle
+
+CONSULTA = "SELECT * FROM reservas"
+
+
+def _crear_base(filas):
+    """Base en memoria con `filas` reservas de 10 columnas (como obtener_reservas)"""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("""
+        CREATE TABLE reservas (
+            id INTEGER PRIMARY KEY, huesped_id INTEGER, huesped TEXT,
+            habitacion_id INTEGER, habitacion TEXT, tipo TEXT,
+            fecha_entrada TEXT, fecha_salida TEXT, estado TEXT, total REAL
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO reservas VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        ((i, i % 5000, f"Huésped {i % 5000}", i % 200, str(100 + i % 200), "Doble",
+          "2025-01-10", "2025-01-12", "activa", 1500.0) for i in range(filas))
+    )
+    return conn
+
+
+def _como_dict(cursor, fila):
+    return {col[0]: valor for col, valor in zip(cursor.description, fila)}
+
+
+FORMAS = [
+    ("tuplas", None),
+    ("dicts", _como_dict),
+    ("sqlite3.Row", sqlite3.Row),
+    ("ReservaDetalle", ReservaDetalle.desde_fila),
+]
+
+
+def medir(conn, row_factory):
+    """Devuelve (bytes retenidos, segundos) de cargar todas las filas"""
+    cursor = conn.cursor()
+    if row_factory is not None:
+        cursor.row_factory = row_factory
+
+    # Tiempo sin tracemalloc (lo distorsiona)
+    inicio = time.perf_counter()
+    filas = cursor.execute(CONSULTA).fetchall()
+    segundos = time.perf_counter() - inicio
+    del filas
+
+    tracemalloc.start()
+    filas = cursor.execute(CONSULTA).fetchall()
+    retenidos, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del filas
+    return retenidos, segundos
+
+
+def main(filas=100_000):
+    conn = _crear_base(filas)
+    escala = 100_000 / filas
+
+    print(f"{'forma':<16}{'MB / 100k filas':>18}{'bytes / fila':>15}{'ms carga':>12}")
+    for nombre, row_factory in FORMAS:
+        retenidos, segundos = medir(conn, row_factory)
+        print(f"{nombre:<16}{retenidos * escala / 1e6:>18.1f}{retenidos / filas:>15.0f}{segundos * 1000:>12.0f}")
+
+    conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(a) for a in sys.argv[1:])))
@@ -0,0 +1,75 @@
+"""Tiempo de database.analitica.calcular_reporte con 200 habitaciones y 3 años.
+
+Uso:
+    python -m benchmarks.reportes_ocupacion [habitaciones] [años]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from database.analitica import calcular_reporte
+from database.db_manager import DatabaseManager
+
+TIPOS = ("Sencilla", "Doble", "Familiar", "Deluxe")
+
+
+def _crear_base(ruta, habitaciones, anios, semilla=7):
+    """Base con `habitaciones` y reservas consecutivas durante `anios` años"""
+    rng = random.Random(semilla)
+    db = DatabaseManager(ruta)
+    inicio = date.today().replace(month=1, day=1) - timedelta(days=365 * anios)
+    fin = inicio + timedelta(days=365 * anios)
+
+    with db.transaccion():
+        db.cursor.executemany(
+            "INSERT INTO habitaciones (numero, tipo, precio, estado) VALUES (?, ?, ?, 'disponible')",
+            [(f"B{i}", rng.choice(TIPOS), rng.choice((900, 1200, 1800, 2500))) for i in range(habitaciones)]
+        )
+        db.cursor.execute("INSERT INTO huespedes (nombre, apellido) VALUES ('Carga', 'Reportes')")
+        huesped_id = db.cursor.lastrowid
+
+        filas = []
+        for (habitacion_id,) in db.cursor.execute("SELECT id FROM habitaciones").fetchall():
+            dia = inicio
+            while dia < fin:
+                dia += timedelta(days=rng.randint(0, 3))
+                noches = rng.randint(1, 6)
+                filas.append((huesped_id, habitacion_id, dia.isoformat(),
+                              (dia + timedelta(days=noches)).isoformat(),
+                              1000.0 * noches, rng.choice(("finalizada", "finalizada", "cancelada"))))
+                dia += timedelta(days=noches)
+        db.cursor.executemany(
+            "INSERT INTO reservaciones (huesped_id, habitacion_id, fecha_entrada, fecha_salida, total, estado) "
+            "VALUES (?, ?, ?, ?, ?, ?)", filas
+        )
+    return db, inicio, fin - timedelta(days=1), len(filas)
+
+
+def main(habitaciones=200, anios=3, repeticiones=5):
+    with tempfile.TemporaryDirectory() as carpeta:
+        db, desde, hasta, reservas = _crear_base(os.path.join(carpeta, "hotel.db"), habitaciones, anios)
+        try:
+            tiempos = []
+            for _ in range(repeticiones):
+                inicio = time.perf_counter()
+                reporte = calcular_reporte(db, desde, hasta)
+                tiempos.append(time.perf_counter() - inicio)
+        finally:
+            db.cerrar()
+
+    total = reporte.resumen()["Total"]
+    print(f"{habitaciones} habitaciones, {anios} años, {reservas} reservas")
+    print(f"calcular_reporte: mejor {min(tiempos) * 1000:.0f} ms, peor {max(tiempos) * 1000:.0f} ms")
+    print(f"ocupación {total['ocupacion']:.1f}%  ADR {total['adr']:,.2f}  RevPAR {total['revpar']:,.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    argumentos = sys.argv[1:]
+    sys.exit(main(
+        int(argumentos[0]) if len(argumentos) > 0 else 200,
+        int(argumentos[1]) if len(argumentos) > 1 else 3,
+    ))
@@ -0,0 +1,124 @@
+"""Prueba de carga: muchas terminales reservando a la vez sobre el mismo hotel.db.
+
+Lanza varios procesos que intentan reservas al azar (habitación y fechas)
+contra una misma base y al final comprueba que ninguna habitación quedó con
+dos reservas activas solapadas. Informa reservas por segundo.
+
+Uso:
+    python -m benchmarks.reservas_concurrentes [procesos] [intentos_por_proceso] [ruta_db]
+
+Sin ruta_db usa un hotel.db nuevo en una carpeta temporal (no toca la base real).
+"""
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from database.db_manager import DatabaseManager
+
+HABITACIONES = 20
+DIAS = 60
+SEMILLA = 2024
+
+SOLAPAMIENTOS = """
+    SELECT COUNT(*)
+    FROM reservaciones a
+    JOIN reservaciones b ON a.habitacion_id = b.habitacion_id
+                         AND a.id < b.id
+                         AND a.fecha_entrada < b.fecha_salida
+                         AND b.fecha_entrada < a.fecha_salida
+    WHERE a.estado = 'activa' AND b.estado = 'activa'
+      AND a.habitacion_id IN ({})
+"""
+
+
+def _preparar(ruta):
+    """Crea habitaciones y un huésped propios de la prueba; devuelve (huésped, habitaciones).
+
+    No borra nada: con una base real solo se compite por estas habitaciones.
+    """
+    db = DatabaseManager(ruta)
+    with db.transaccion():
+        db.cursor.execute(
+            "INSERT INTO huespedes (nombre, apellido, telefono, email) VALUES ('Carga', 'Concurrente', NULL, '')"
+        )
+        huesped_id = db.cursor.lastrowid
+        habitaciones = []
+        for i in range(HABITACIONES):
+            db.cursor.execute(
+                "INSERT INTO habitaciones (numero, tipo, precio, estado) VALUES (?, 'Doble', 1000, 'disponible')",
+                (f"C{os.getpid()}-{i}",)
+            )
+            habitaciones.append(db.cursor.lastrowid)
+    db.cerrar()
+    return huesped_id, habitaciones
+
+
+def _terminal(ruta, huesped_id, habitaciones, intentos, semilla, inicio):
+    """Proceso de trabajo: devuelve cuántas reservas logró guardar"""
+    rng = random.Random(semilla)
+    db = DatabaseManager(ruta)
+    # Fechas futuras: no cambian el estado de la habitación, solo compiten por el rango
+    base = date.today() + timedelta(days=30)
+
+    inicio.wait()
+    guardadas = 0
+    for _ in range(intentos):
+        entrada = base + timedelta(days=rng.randrange(DIAS))
+        salida = entrada + timedelta(days=rng.randint(1, 4))
+        if db.agregar_reserva(huesped_id, rng.choice(habitaciones),
+                              entrada.isoformat(), salida.isoformat(), 1000):
+            guardadas += 1
+    db.cerrar()
+    return guardadas
+
+
+def main(procesos=8, intentos=500, ruta=None):
+    carpeta = None
+    if ruta is None:
+        carpeta = tempfile.TemporaryDirectory()
+        ruta = os.path.join(carpeta.name, "hotel.db")
+    ruta = os.path.abspath(ruta)
+
+    huesped_id, habitaciones = _preparar(ruta)
+
+    with multiprocessing.Manager() as gestor:
+        inicio = gestor.Event()
+        with multiprocessing.Pool(procesos) as pool:
+            resultados = [
+                pool.apply_async(_terminal, (ruta, huesped_id, habitaciones, intentos, SEMILLA + n, inicio))
+                for n in range(procesos)
+            ]
+            time.sleep(0.5)  # que todos los procesos estén listos antes de largar
+            t0 = time.perf_counter()
+            inicio.set()
+            guardadas = sum(r.get() for r in resultados)
+            segundos = time.perf_counter() - t0
+
+    db = DatabaseManager(ruta)
+    marcadores = ", ".join("?" * len(habitaciones))
+    solapadas = db.conn.execute(SOLAPAMIENTOS.format(marcadores), habitaciones).fetchone()[0]
+    db.cerrar()
+
+    total = procesos * intentos
+    print(f"procesos: {procesos}  intentos: {total}  guardadas: {guardadas}  rechazadas: {total - guardadas}")
+    print(f"tiempo: {segundos:.2f} s  ->  {total / segundos:,.0f} intentos/s, {guardadas / segundos:,.0f} reservas/s")
+    print(f"reservas solapadas: {solapadas}")
+
+    if carpeta is not None:
+        carpeta.cleanup()
+
+    assert solapadas == 0, f"{solapadas} pares de reservas activas solapadas"
+    return 0
+
+
+if __name__ == "__main__":
+    argumentos = sys.argv[1:]
+    sys.exit(main(
+        int(argumentos[0]) if len(argumentos) > 0 else 8,
+        int(argumentos[1]) if len(argumentos) > 1 else 500,
+        argumentos[2] if len(argumentos) > 2 else None,
+    ))
@@ -0,0 +1,390 @@
+"""Tiempos de cada método de DatabaseManager a varias escalas.
+
+Para cada escala genera un hotel con database.generador (misma semilla,
+mismos datos), ejecuta cada caso varias veces y guarda en un JSON la primera
+llamada (cachés frías), la mediana, el mínimo y el p95, más las filas que
+devolvió. Las escrituras se miden en pares que dejan la base como estaba
+(agregar y luego eliminar, actualizar con los mismos valores).
+
+Con --comparar se compara contra un JSON anterior y se termina con código 1
+si algún caso empeoró más del umbral: sirve para detectar regresiones.
+
+Uso:
+    python -m benchmarks.suite_db [--escalas pequena,mediana,grande] [--salida resultados.json]
+                                  [--comparar anterior.json] [--umbral 1.5] [--semilla 1]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import types
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable, Optional
+
+from database import generador
+from database.analitica import NUMPY_DISPONIBLE
+from database.db_manager import DatabaseManager
+from database.perfiles import PERFIL_POR_DEFECTO, VARIABLE_PERFIL
+
+VERSION_FORMATO = 1
+
+# Parámetros de database.generador.generar por escala
+ESCALAS = {
+    "pequena": {"habitaciones": 20, "huespedes": 500, "anios": 1},
+    "mediana": {"habitaciones": 100, "huespedes": 5000, "anios": 2},
+    "grande": {"habitaciones": 300, "huespedes": 50000, "anios": 3},
+}
+
+# Cada caso se repite hasta juntar PRESUPUESTO segundos (entre MINIMO y MAXIMO veces)
+PRESUPUESTO = 0.3
+MINIMO_REPETICIONES = 3
+MAXIMO_REPETICIONES = 200
+
+# Métodos que no son operaciones del hotel (esquema, conexión)
+EXCLUIDOS = {"transaccion", "crear_tablas", "insertar_datos_prueba", "cerrar"}
+
+
+@dataclass(frozen=True)
+class Caso:
+    """Llamada a medir; preparar y limpiar quedan fuera del tiempo"""
+    nombre: str
+    medir: Callable
+    preparar: Optional[Callable] = None
+    limpiar: Optional[Callable] = None
+
+    @property
+    def metodo(self):
+        return self.nombre.split("[")[0]
+
+
+class Muestra:
+    """Ids, textos y fechas de la base generada sobre los que se ejecutan los casos"""
+
+    def __init__(self, db, hoy):
+        self.hoy = hoy
+        consulta = db.conn.execute
+
+        # Las generadas (no las de prueba), disponibles y sin reservas a futuro lejano
+        self.habitacion_id, self.numero = consulta(
+            "SELECT id, numero FROM habitaciones WHERE estado = 'disponible' ORDER BY id DESC LIMIT 1").fetchone()
+        # Huésped frecuente (el generador favorece los primeros ids)
+        self.huesped_id, self.telefono, self.apellido = consulta(
+            "SELECT id, telefono, apellido FROM huespedes ORDER BY id LIMIT 1").fetchone()
+        self.empleado_id = consulta("SELECT MAX(id) FROM empleados").fetchone()[0]
+        self.reserva_activa = consulta(
+            "SELECT id FROM reservaciones WHERE estado = 'activa' ORDER BY fecha_entrada DESC LIMIT 1").fetchone()[0]
+        self.reserva_finalizada = consulta(
+            "SELECT id FROM reservaciones WHERE estado = 'finalizada' ORDER BY id LIMIT 1").fetchone()[0]
+        self.despues_de = consulta(
+            "SELECT fecha_entrada, id FROM reservaciones ORDER BY fecha_entrada DESC, id DESC "
+            "LIMIT 1 OFFSET 200").fetchone()
+
+        # Estadías de prueba de las escrituras: después del horizonte del generador
+        self.entrada_libre = self.fecha(generador.HORIZONTE_FUTURO + 30)
+        self.salida_libre = self.fecha(generador.HORIZONTE_FUTURO + 33)
+        self._contador = 0
+
+    def fecha(self, dias):
+        return (self.hoy + timedelta(days=dias)).isoformat()
+
+    def unico(self, prefijo):
+        """Texto distinto en cada llamada (números, usuarios y teléfonos únicos)"""
+        self._contador += 1
+        return f"{prefijo}{self._contador}"
+
+
+def _ultima_reserva(db):
+    return db.conn.execute("SELECT MAX(id) FROM reservaciones").fetchone()[0]
+
+
+def _nueva_reserva(db, m):
+    db.agregar_reserva(m.huesped_id, m.habitacion_id, m.entrada_libre, m.salida_libre, 3000.0)
+    return _ultima_reserva(db)
+
+
+def _nueva_habitacion(db, m):
+    numero = m.unico("BENCH-")
+    db.agregar_habitacion(numero, "Doble", 900.0)
+    return db.obtener_habitacion_por_numero(numero).id
+
+
+def _nuevo_empleado(db, m):
+    db.agregar_empleado("Prueba", "Suite", "Recepcionista", "", m.unico("bench"), "1234", "Empleado")
+    return db.conn.execute("SELECT MAX(id) FROM empleados").fetchone()[0]
+
+
+def _nuevo_huesped(db, m):
+    return db.agregar_huesped("Prueba", "Suite", m.unico("99"), "")
+
+
+def _casos():
+    """Casos en el orden en que se ejecutan (lecturas primero)"""
+    hab = lambda db, m: db.obtener_habitacion_por_id(m.habitacion_id)
+    emp = lambda db, m: db.obtener_empleado_por_id(m.empleado_id)
+    hue = lambda db, m: db.obtener_huesped_por_id(m.huesped_id)
+    res = lambda db, m: db.obtener_reserva_por_id(m.reserva_activa)
+
+    return [
+        # Habitaciones
+        Caso("obtener_habitaciones", lambda db, m: db.obtener_habitaciones()),
+        Caso("obtener_habitacion_por_id", lambda db, m: db.obtener_habitacion_por_id(m.habitacion_id)),
+        Caso("obtener_habitacion_por_numero", lambda db, m: db.obtener_habitacion_por_numero(m.numero)),
+        Caso("obtener_habitaciones_disponibles", lambda db, m: db.obtener_habitaciones_disponibles()),
+        Caso("obtener_habitaciones_disponibles_rango",
+             lambda db, m: db.obtener_habitaciones_disponibles_rango(m.fecha(7), m.fecha(10))),
+        Caso("habitacion_disponible",
+             lambda db, m: db.habitacion_disponible(m.habitacion_id, m.fecha(7), m.fecha(10))),
+        Caso("habitacion_disponible[excluir]",
+             lambda db, m: db.habitacion_disponible(m.habitacion_id, m.fecha(7), m.fecha(10), m.reserva_activa)),
+        Caso("calendario_habitacion",
+             lambda db, m: db.calendario_habitacion(m.habitacion_id, m.fecha(-30), m.fecha(60))),
+        Caso("ocupacion_por_dia", lambda db, m: db.ocupacion_por_dia(m.fecha(-90), m.fecha(90))),
+        # Empleados
+        Caso("obtener_empleados", lambda db, m: db.obtener_empleados()),
+        Caso("obtener_empleado_por_id", emp),
+        Caso("validar_login", lambda db, m: db.validar_login("admin", "1234")),
+        Caso("obtener_estadisticas", lambda db, m: db.obtener_estadisticas()),
+        Caso("version_tabla", lambda db, m: db.version_tabla("reservaciones")),
+        # Huéspedes
+        Caso("obtener_huespedes", lambda db, m: db.obtener_huespedes()),
+        Caso("obtener_huesped_por_id", hue),
+        Caso("buscar_huesped_por_telefono", lambda db, m: db.buscar_huesped_por_telefono(m.telefono)),
+        Caso("buscar_huespedes[texto]", lambda db, m: db.buscar_huespedes(m.apellido[:3])),
+        Caso("buscar_huespedes[vacio]", lambda db, m: db.buscar_huespedes("")),
+        Caso("iterar_huespedes", lambda db, m: db.iterar_huespedes()),
+        # Reservas
+        Caso("obtener_reservas", lambda db, m: db.obtener_reservas()),
+        Caso("obtener_reservas_activas", lambda db, m: db.obtener_reservas_activas()),
+        Caso("obtener_reservas_pagina", lambda db, m: db.obtener_reservas_pagina()),
+        Caso("obtener_reservas_pagina[siguiente]",
+             lambda db, m: db.obtener_reservas_pagina(50, m.despues_de)),
+        Caso("obtener_reservas_pagina[filtros]",
+             lambda db, m: db.obtener_reservas_pagina(50, None, "finalizada", m.apellido[:3])),
+        Caso("obtener_reserva_por_id", res),
+        Caso("obtener_reserva_detalle", lambda db, m: db.obtener_reserva_detalle(m.reserva_finalizada)),
+        Caso("iterar_reservas", lambda db, m: db.iterar_reservas()),
+        Caso("iterar_reservas[rango]",
+             lambda db, m: db.iterar_reservas(m.fecha(-365), m.fecha(0), "finalizada")),
+        Caso("obtener_noches_rango", lambda db, m: db.obtener_noches_rango(m.fecha(-365), m.fecha(0))),
+
+        # Escrituras: el resultado de preparar llega a medir y a limpiar como `x`
+        Caso("agregar_habitacion",
+             lambda db, m, x: db.agregar_habitacion(x, "Doble", 900.0),
+             preparar=lambda db, m: m.unico("BENCH-"),
+             limpiar=lambda db, m, x: db.eliminar_habitacion(db.obtener_habitacion_por_numero(x).id)),
+        Caso("actualizar_habitacion",
+             lambda db, m, x: db.actualizar_habitacion(x.id, x.numero, x.tipo, x.precio, x.estado),
+             preparar=hab),
+        Caso("cambiar_estado_habitacion",
+             lambda db, m, x: db.cambiar_estado_habitacion(x.id, x.estado), preparar=hab),
+        Caso("eliminar_habitacion", lambda db, m, x: db.eliminar_habitacion(x), preparar=_nueva_habitacion),
+
+        Caso("agregar_empleado",
+             lambda db, m, x: db.agregar_empleado("Prueba", "Suite", "Recepcionista", "", x, "1234", "Empleado"),
+             preparar=lambda db, m: m.unico("bench"),
+             limpiar=lambda db, m, x: db.eliminar_empleado(
+                 db.conn.execute("SELECT id FROM empleados WHERE usuario = ?", (x,)).fetchone()[0])),
+        Caso("actualizar_empleado",
+             lambda db, m, x: db.actualizar_empleado(x.id, x.nombre, x.apellido, x.puesto, x.telefono, x.privilegio),
+             preparar=emp),
+        Caso("eliminar_empleado", lambda db, m, x: db.eliminar_empleado(x), preparar=_nuevo_empleado),
+
+        Caso("agregar_huesped",
+             lambda db, m, x: db.agregar_huesped("Prueba", "Suite", x, ""),
+             preparar=lambda db, m: m.unico("99"),
+             limpiar=lambda db, m, x: db.eliminar_huesped(db.buscar_huesped_por_telefono(x).id)),
+        Caso("actualizar_huesped",
+             lambda db, m, x: db.actualizar_huesped(x.id, x.nombre, x.apellido, x.telefono, x.email),
+             preparar=hue),
+        Caso("eliminar_huesped", lambda db, m, x: db.eliminar_huesped(x), preparar=_nuevo_huesped),
+
+        Caso("agregar_reserva",
+             lambda db, m, x: db.agregar_reserva(m.huesped_id, m.habitacion_id, m.entrada_libre,
+                                                 m.salida_libre, 3000.0),
+             limpiar=lambda db, m, x: db.eliminar_reserva(_ultima_reserva(db))),
+        Caso("actualizar_reserva",
+             lambda db, m, x: db.actualizar_reserva(x.id, x.huesped_id, x.habitacion_id, x.fecha_entrada,
+                                                    x.fecha_salida, x.estado, x.total),
+             preparar=res),
+        Caso("cancelar_reserva", lambda db, m, x: db.cancelar_reserva(x), preparar=_nueva_reserva,
+             limpiar=lambda db, m, x: db.eliminar_reserva(x)),
+        Caso("finalizar_reserva", lambda db, m, x: db.finalizar_reserva(x), preparar=_nueva_reserva,
+             limpiar=lambda db, m, x: (db.eliminar_reserva(x),
+                                       db.cambiar_estado_habitacion(m.habitacion_id, "disponible"))),
+        Caso("eliminar_reserva", lambda db, m, x: db.eliminar_reserva(x), preparar=_nueva_reserva),
+    ]
+
+
+def _filas(resultado):
+    """Filas devueltas (None si el resultado no es una colección)"""
+    if isinstance(resultado, types.GeneratorType):
+        return sum(1 for _ in resultado)
+    if isinstance(resultado, list):
+        return len(resultado)
+    return None
+
+
+def _medir(caso, db, muestra):
+    # Como timeit: sin recolector durante la medición, que agrega pausas al azar
+    gc.collect()
+    gc.disable()
+    try:
+        return _repetir(caso, db, muestra)
+    finally:
+        gc.enable()
+
+
+def _repetir(caso, db, muestra):
+    tiempos = []
+    filas = None
+    total = 0.0
+    while len(tiempos) < MAXIMO_REPETICIONES and (len(tiempos) < MINIMO_REPETICIONES or total < PRESUPUESTO):
+        argumentos = (caso.preparar(db, muestra),) if caso.preparar else ()
+        if caso.limpiar and not argumentos:
+            argumentos = (None,)
+
+        inicio = time.perf_counter()
+        resultado = caso.medir(db, muestra, *argumentos)
+        # Los iteradores no consultan hasta que se recorren: el recorrido cuenta
+        filas = _filas(resultado)
+        transcurrido = time.perf_counter() - inicio
+
+        if caso.limpiar:
+            caso.limpiar(db, muestra, *argumentos)
+        tiempos.append(transcurrido)
+        total += transcurrido
+
+    ordenados = sorted(tiempos)
+    return {
+        "primera_ms": tiempos[0] * 1000,
+        "mediana_ms": statistics.median(tiempos) * 1000,
+        "minimo_ms": ordenados[0] * 1000,
+        "p95_ms": ordenados[min(len(ordenados) - 1, int(len(ordenados) * 0.95))] * 1000,
+        "repeticiones": len(tiempos),
+        "filas": filas,
+    }
+
+
+def sin_medir():
+    """Métodos públicos de DatabaseManager que ningún caso cubre"""
+    publicos = {nombre for nombre in vars(DatabaseManager)
+                if not nombre.startswith("_") and callable(getattr(DatabaseManager, nombre))}
+    return sorted(publicos - EXCLUIDOS - {caso.metodo for caso in _casos()})
+
+
+def medir_escala(nombre, parametros, semilla, hoy, al_avanzar=None):
+    """Genera un hotel con los parámetros, mide todos los casos y devuelve el resultado de la escala"""
+    with tempfile.TemporaryDirectory() as carpeta:
+        db = DatabaseManager(os.path.join(carpeta, "hotel.db"))
+        try:
+            inicio = time.perf_counter()
+            filas = generador.generar(db, semilla=semilla, hoy=hoy, **parametros)
+            generacion = time.perf_counter() - inicio
+
+            muestra = Muestra(db, hoy)
+            metodos = {}
+            for caso in _casos():
+                metodos[caso.nombre] = _medir(caso, db, muestra)
+                if al_avanzar is not None:
+                    al_avanzar(nombre, caso.nombre, metodos[caso.nombre])
+        finally:
+            db.cerrar()
+
+    return {"parametros": parametros, "filas": filas, "generacion_s": generacion, "metodos": metodos}
+
+
+def ejecutar(escalas=None, semilla=1, al_avanzar=None):
+    """Corre la suite y devuelve el diccionario que se guarda como JSON"""
+    hoy = date.today()
+    return {
+        "version": VERSION_FORMATO,
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "entorno": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "plataforma": platform.platform(),
+            "numpy": NUMPY_DISPONIBLE,
+            "perfil": os.environ.get(VARIABLE_PERFIL, PERFIL_POR_DEFECTO),
+        },
+        "semilla": semilla,
+        "hoy": hoy.isoformat(),
+        "sin_medir": sin_medir(),
+        "escalas": {
+            nombre: medir_escala(nombre, ESCALAS[nombre], semilla, hoy, al_avanzar)
+            for nombre in escalas or ESCALAS
+        },
+    }
+
+
+def comparar(anterior, actual, umbral=1.5, minimo_ms=0.1):
+    """Casos cuyo tiempo mínimo creció más que `umbral` veces (y más de minimo_ms).
+
+    Se compara el mínimo y no la mediana porque es lo que menos varía entre
+    corridas en la misma máquina; minimo_ms ignora el ruido de los casos de
+    microsegundos. Devuelve una lista de (escala, caso, ms anterior, ms actual).
+    """
+    regresiones = []
+    for escala, resultado in actual["escalas"].items():
+        previos = anterior.get("escalas", {}).get(escala, {}).get("metodos", {})
+        for caso, medicion in resultado["metodos"].items():
+            if caso not in previos:
+                continue
+            antes, ahora = previos[caso]["minimo_ms"], medicion["minimo_ms"]
+            if ahora > antes * umbral and ahora - antes > minimo_ms:
+                regresiones.append((escala, caso, antes, ahora))
+    return regresiones
+
+
+def _mostrar(escala, caso, medicion):
+    filas = "" if medicion["filas"] is None else f"  {medicion['filas']} filas"
+    print(f"  {escala:<8} {caso:<40} {medicion['mediana_ms']:>10.3f} ms  "
+          f"(primera {medicion['primera_ms']:.3f}){filas}")
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Tiempos de DatabaseManager a varias escalas")
+    parser.add_argument("--escalas", default=",".join(ESCALAS),
+                        help=f"escalas separadas por coma ({', '.join(ESCALAS)})")
+    parser.add_argument("--salida", default="resultados_db.json", help="archivo JSON de resultados")
+    parser.add_argument("--comparar", help="JSON de una corrida anterior")
+    parser.add_argument("--umbral", type=float, default=1.5,
+                        help="factor del tiempo mínimo a partir del cual un caso es regresión")
+    parser.add_argument("--semilla", type=int, default=1)
+    args = parser.parse_args(argumentos)
+
+    escalas = [e.strip() for e in args.escalas.split(",") if e.strip()]
+    desconocidas = [e for e in escalas if e not in ESCALAS]
+    if desconocidas:
+        parser.error(f"escalas desconocidas: {', '.join(desconocidas)}")
+
+    resultados = ejecutar(escalas, args.semilla, _mostrar)
+    with open(args.salida, "w", encoding="utf-8") as archivo:
+        json.dump(resultados, archivo, ensure_ascii=False, indent=2)
+    print(f"Resultados en {args.salida}")
+    if resultados["sin_medir"]:
+        print(f"Sin caso en la suite: {', '.join(resultados['sin_medir'])}")
+
+    if not args.comparar:
+        return 0
+
+    with open(args.comparar, encoding="utf-8") as archivo:
+        anterior = json.load(archivo)
+    regresiones = comparar(anterior, resultados, args.umbral)
+    if not regresiones:
+        print(f"Sin regresiones respecto de {args.comparar} (umbral x{args.umbral})")
+        return 0
+
+    for escala, caso, antes, ahora in regresiones:
+        print(f"REGRESIÓN {escala} {caso}: {antes:.3f} ms -> {ahora:.3f} ms (x{ahora / antes:.2f})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
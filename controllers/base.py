@@ -0,0 +1,60 @@
+# controllers/base.py
+import weakref
+from collections import OrderedDict
+
+
+class ControladorBase:
+    """Base de los controladores: caché de lectura compartida por las pantallas.
+
+    Hay un controlador de cada tipo por DatabaseManager (ver para()), así todas
+    las pantallas ven los mismos datos en memoria. Cada lectura en caché guarda
+    la versión de las tablas de las que depende (DatabaseManager.version_tabla)
+    y se vuelve a consultar en cuanto alguna cambia; las escrituras hechas por
+    el propio controlador además vacían su caché.
+
+    Usa la conexión principal: solo desde el hilo de la interfaz.
+    """
+
+    # Máximo de lecturas distintas en caché (ej. búsquedas de huéspedes)
+    MAXIMO_CACHE = 64
+
+    _instancias = weakref.WeakKeyDictionary()
+
+    def __init__(self, db):
+        self.db = db
+        self._cache = OrderedDict()  # clave -> (versiones, resultado)
+
+    @classmethod
+    def para(cls, db):
+        """Devuelve el controlador compartido para este DatabaseManager"""
+        controladores = ControladorBase._instancias.setdefault(db, {})
+        if cls not in controladores:
+            controladores[cls] = cls(db)
+        return controladores[cls]
+
+    def invalidar(self):
+        """Vacía la caché del controlador"""
+        self._cache.clear()
+
+    def _leer(self, clave, tablas, cargar):
+        """Devuelve cargar() desde la caché si ninguna de las tablas cambió"""
+        versiones = tuple(self.db.version_tabla(tabla) for tabla in tablas)
+
+        guardado = self._cache.get(clave)
+        if guardado is not None and guardado[0] == versiones:
+            self._cache.move_to_end(clave)
+            return guardado[1]
+
+        resultado = cargar()
+        self._cache[clave] = (versiones, resultado)
+        self._cache.move_to_end(clave)
+        while len(self._cache) > self.MAXIMO_CACHE:
+            self._cache.popitem(last=False)
+        return resultado
+
+    def _escribir(self, metodo, *args):
+        """Ejecuta una escritura del DatabaseManager e invalida la caché"""
+        try:
+            return getattr(self.db, metodo)(*args)
+        finally:
+            self.invalidar()
@@ -0,0 +1,27 @@
+# controllers/empleados_controller.py
+from controllers.base import ControladorBase
+
+
+class EmpleadosController(ControladorBase):
+    """Empleados, con caché compartida"""
+
+    def obtener_empleados(self):
+        """Todos los empleados"""
+        return self._leer("todos", ("empleados",), self.db.obtener_empleados)
+
+    def obtener_empleado(self, empleado_id):
+        """Un empleado por id"""
+        return self.db.obtener_empleado_por_id(empleado_id)
+
+    def version(self):
+        """Marca de cambios de la tabla (cambia con cada escritura)"""
+        return self.db.version_tabla("empleados")
+
+    def agregar_empleado(self, nombre, apellido, puesto, telefono='', usuario='', password='', privilegio=''):
+        return self._escribir("agregar_empleado", nombre, apellido, puesto, telefono, usuario, password, privilegio)
+
+    def actualizar_empleado(self, id, nombre, apellido, puesto, telefono, privilegio):
+        return self._escribir("actualizar_empleado", id, nombre, apellido, puesto, telefono, privilegio)
+
+    def eliminar_empleado(self, id):
+        return self._escribir("eliminar_empleado", id)
@@ -0,0 +1,30 @@
+# controllers/habitaciones_controller.py
+from controllers.base import ControladorBase
+
+
+class HabitacionesController(ControladorBase):
+    """Habitaciones y su disponibilidad, con caché compartida"""
+
+    def obtener_habitaciones(self):
+        """Todas las habitaciones"""
+        return self._leer("todas", ("habitaciones",), self.db.obtener_habitaciones)
+
+    def disponibles_en(self, fecha_entrada, fecha_salida):
+        """Habitaciones libres entre check-in y check-out"""
+        return self._leer(
+            ("disponibles", fecha_entrada, fecha_salida),
+            ("habitaciones", "reservaciones"),
+            lambda: self.db.obtener_habitaciones_disponibles_rango(fecha_entrada, fecha_salida)
+        )
+
+    def agregar_habitacion(self, numero, tipo, precio, estado='disponible'):
+        return self._escribir("agregar_habitacion", numero, tipo, precio, estado)
+
+    def actualizar_habitacion(self, id, numero, tipo, precio, estado):
+        return self._escribir("actualizar_habitacion", id, numero, tipo, precio, estado)
+
+    def eliminar_habitacion(self, id):
+        return self._escribir("eliminar_habitacion", id)
+
+    def cambiar_estado_habitacion(self, id, nuevo_estado):
+        return self._escribir("cambiar_estado_habitacion", id, nuevo_estado)
@@ -0,0 +1,31 @@
+# controllers/huespedes_controller.py
+from controllers.base import ControladorBase
+
+
+class HuespedesController(ControladorBase):
+    """Huéspedes y sus búsquedas, con caché compartida"""
+
+    def buscar(self, texto, limite=50, pagina=0):
+        """Búsqueda de texto completo (ver DatabaseManager.buscar_huespedes)"""
+        return self._leer(
+            ("buscar", texto, limite, pagina),
+            ("huespedes",),
+            lambda: self.db.buscar_huespedes(texto, limite, pagina)
+        )
+
+    def hay_huespedes(self):
+        """Indica si hay al menos un huésped registrado"""
+        return bool(self.buscar("", limite=1))
+
+    def obtener_huesped(self, huesped_id):
+        """Un huésped por id"""
+        return self.db.obtener_huesped_por_id(huesped_id)
+
+    def agregar_huesped(self, nombre, apellido, telefono, email='', password=''):
+        return self._escribir("agregar_huesped", nombre, apellido, telefono, email, password)
+
+    def actualizar_huesped(self, id, nombre, apellido, telefono, email):
+        return self._escribir("actualizar_huesped", id, nombre, apellido, telefono, email)
+
+    def eliminar_huesped(self, id):
+        return self._escribir("eliminar_huesped", id)
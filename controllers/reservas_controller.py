@@ -0,0 +1,28 @@
+# controllers/reservas_controller.py
+from controllers.base import ControladorBase
+
+
+class ReservasController(ControladorBase):
+    """Reservas activas, con caché compartida.
+
+    El listado completo se pagina en la BD (obtener_reservas_pagina) y no se
+    guarda aquí; sí las reservas activas, que muestra el inicio del dashboard
+    cada vez que se vuelve a él.
+    """
+
+    def obtener_activas(self):
+        """Reservas activas, las de entrada más reciente primero"""
+        return self._leer("activas", ("reservaciones", "huespedes", "habitaciones"),
+                          self.db.obtener_reservas_activas)
+
+    def agregar_reserva(self, huesped_id, habitacion_id, fecha_entrada, fecha_salida, total):
+        return self._escribir("agregar_reserva", huesped_id, habitacion_id, fecha_entrada, fecha_salida, total)
+
+    def cancelar_reserva(self, id):
+        return self._escribir("cancelar_reserva", id)
+
+    def finalizar_reserva(self, id):
+        return self._escribir("finalizar_reserva", id)
+
+    def eliminar_reserva(self, id):
+        return self._escribir("eliminar_reserva", id)
@@ -0,0 +1,159 @@
+"""Indicadores de ocupación e ingresos por tipo de habitación y por día.
+
+Las noches vendidas salen de la matriz de ocupación (database/ocupacion.py,
+vía DatabaseManager.ocupacion_por_dia): un byte por habitación y noche,
+contado por tipo. Los ingresos cargan las reservas del rango en arreglos de
+NumPy (una fila por reserva, con los días como desplazamientos int32 desde el
+inicio del rango), se expanden a una fila por noche y suman la tarifa por
+noche de cada una por tipo y día.
+
+Cada (habitación, noche) cuenta una sola vez, igual que en la matriz: si una
+reserva finalizada y una activa se cruzan (ej. datos importados), vale la
+activa; entre dos del mismo estado, la última cargada.
+
+NumPy es opcional: sin él, NUMPY_DISPONIBLE es False y calcular_reporte()
+lanza RuntimeError; el resto de la aplicación no lo necesita.
+
+Definiciones (por tipo y por día, o sumadas en el rango):
+    ocupación  noches vendidas / habitaciones
+    ADR        ingresos / noches vendidas (tarifa media por noche vendida)
+    RevPAR     ingresos / habitaciones (ingreso por habitación disponible)
+"""
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende de la instalación
+    np = None
+
+NUMPY_DISPONIBLE = np is not None
+
+
+@dataclass(frozen=True)
+class ReporteOcupacion:
+    """Resultado de calcular_reporte; arreglos de forma (tipos, días)"""
+    desde: date
+    hasta: date
+    tipos: Tuple[str, ...]
+    habitaciones: "np.ndarray"   # (tipos,) habitaciones de cada tipo
+    ocupadas: "np.ndarray"       # (tipos, días) noches vendidas
+    ingresos: "np.ndarray"       # (tipos, días) ingresos de esas noches
+
+    @property
+    def dias(self):
+        """Fechas del reporte"""
+        return [self.desde + timedelta(days=i) for i in range(self.ocupadas.shape[1])]
+
+    @property
+    def ocupacion(self):
+        """Porcentaje de ocupación por tipo y día"""
+        return 100 * _dividir(self.ocupadas, self.habitaciones[:, None])
+
+    @property
+    def adr(self):
+        return _dividir(self.ingresos, self.ocupadas)
+
+    @property
+    def revpar(self):
+        return _dividir(self.ingresos, self.habitaciones[:, None])
+
+    def resumen(self):
+        """Totales del rango: {tipo: {ocupacion, adr, revpar, ingresos, noches}}; incluye 'Total'"""
+        dias = self.ocupadas.shape[1]
+        noches = self.ocupadas.sum(axis=1)
+        ingresos = self.ingresos.sum(axis=1)
+        disponibles = self.habitaciones * dias
+
+        filas = list(zip(self.tipos, noches, ingresos, disponibles))
+        filas.append(("Total", noches.sum(), ingresos.sum(), disponibles.sum()))
+
+        return {
+            tipo: {
+                "ocupacion": 100 * float(_dividir(n, d)),
+                "adr": float(_dividir(i, n)),
+                "revpar": float(_dividir(i, d)),
+                "ingresos": float(i),
+                "noches": int(n),
+            }
+            for tipo, n, i, d in filas
+        }
+
+
+def _dividir(a, b):
+    """a / b con 0 donde b es 0"""
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64))
+    resultado = np.zeros_like(a)
+    np.divide(a, b, out=resultado, where=b != 0)
+    return resultado
+
+
+def _a_dias(fechas, origen):
+    """Fechas 'AAAA-MM-DD' -> días desde origen (int32)"""
+    return (np.array(fechas, dtype="datetime64[D]") - np.datetime64(origen, "D")).astype(np.int32)
+
+
+def calcular_reporte(db, desde, hasta):
+    """Calcula el reporte entre desde y hasta (fechas o textos AAAA-MM-DD, inclusive)"""
+    if not NUMPY_DISPONIBLE:
+        raise RuntimeError("Los reportes de ocupación requieren NumPy (pip install numpy)")
+
+    desde = date.fromisoformat(str(desde))
+    hasta = date.fromisoformat(str(hasta))
+    if hasta < desde:
+        raise ValueError("La fecha final es anterior a la inicial")
+    dias = (hasta - desde).days + 1
+
+    # Habitaciones: tipo de cada una como índice en `tipos`
+    habitaciones = db.obtener_habitaciones()
+    tipos = tuple(sorted({h.tipo for h in habitaciones}))
+    indice_tipo = {tipo: i for i, tipo in enumerate(tipos)}
+    tipo_por_id = {h.id: indice_tipo[h.tipo] for h in habitaciones}
+    por_tipo = np.bincount([tipo_por_id[h.id] for h in habitaciones], minlength=len(tipos))
+
+    # Noches vendidas: matriz de ocupación, una fila de cuentas por tipo
+    fin_rango = (hasta + timedelta(days=1)).isoformat()
+    ocupadas = np.array(
+        [db.ocupacion_por_dia(desde.isoformat(), fin_rango, [h.id for h in habitaciones if h.tipo == tipo])
+         for tipo in tipos],
+        dtype=np.int32
+    ).reshape(len(tipos), dias)
+    ingresos = np.zeros((len(tipos), dias), dtype=np.float64)
+
+    filas = db.obtener_noches_rango(desde.isoformat(), hasta.isoformat())
+    filas = [f for f in filas if f[0] in tipo_por_id]
+    if filas:
+        habitacion_ids, entradas, salidas, totales, estados = zip(*filas)
+
+        habitacion = np.array(habitacion_ids, dtype=np.int64)
+        entrada = _a_dias(entradas, desde)
+        salida = _a_dias(salidas, desde)
+        total = np.array(totales, dtype=np.float64)
+        total[np.isnan(total)] = 0.0  # total NULL (np.array convierte None en nan)
+        activa = np.array([estado == 'activa' for estado in estados])
+
+        # Tarifa por noche sobre la estadía completa; solo cuentan las noches del rango
+        tarifa = total / np.maximum(salida - entrada, 1)
+        inicio = np.clip(entrada, 0, dias)
+        fin = np.clip(salida, 0, dias)
+
+        # Una fila por noche dentro del rango: reserva de origen y día
+        largo = fin - inicio
+        reserva = np.repeat(np.arange(len(filas)), largo)
+        desplazamiento = np.arange(len(reserva)) - np.repeat(np.cumsum(largo) - largo, largo)
+        dia = inicio[reserva] + desplazamiento
+
+        # Una noche por (habitación, día): ordenadas por habitación y día, y en
+        # cada una la activa (y la última cargada) al final; se queda esa
+        clave = habitacion[reserva] * dias + dia
+        orden = np.lexsort((reserva, activa[reserva], clave))
+        clave = clave[orden]
+        ultima = np.ones(len(clave), dtype=bool)
+        ultima[:-1] = clave[1:] != clave[:-1]
+        reserva, dia = reserva[orden][ultima], dia[orden][ultima]
+
+        tipo = np.fromiter((tipo_por_id[h] for h in habitacion_ids), dtype=np.int32, count=len(filas))
+        np.add.at(ingresos, (tipo[reserva], dia), tarifa[reserva])
+
+    return ReporteOcupacion(desde, hasta, tipos, por_tipo, ocupadas, ingresos)
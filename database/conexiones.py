@@ -0,0 +1,107 @@
+import sqlite3
+import os
+import threading
+import queue
+from contextlib import contextmanager
+
+from database.db_manager import DatabaseManager
+from database.ejecutor import EjecutorBD
+from database.estadisticas import ServicioEstadisticas
+from database.identidad import MapaIdentidad
+from database.instrumentacion import Instrumentacion
+from database.ocupacion import MatrizOcupacion
+from database.perfiles import aplicar_perfil
+
+
+class GestorConexiones:
+    """Gestor único de conexiones para todo el proceso.
+
+    Se crea una sola vez al arrancar (main.py): abre la conexión principal,
+    prepara el esquema y expone un DatabaseManager compartido por todas las
+    ventanas. Opcionalmente mantiene un pool pequeño de conexiones para
+    hilos de trabajo.
+    """
+
+    def __init__(self, db_name="hotel.db", tamano_pool=2, perfil=None):
+        self.db_path = os.path.join(os.path.dirname(__file__), db_name)
+        self.perfil = perfil
+        self.tamano_pool = tamano_pool
+        self._pool = queue.LifoQueue(maxsize=tamano_pool)
+        self._lock = threading.Lock()
+        self._creadas = 0
+        self._cerrado = False
+        self._ejecutor = None
+        # Contadores del dashboard, compartidos por todas las conexiones
+        self.estadisticas = ServicioEstadisticas()
+        # Filas leídas por clave primaria (identity map)
+        self.identidad = MapaIdentidad()
+        # Matriz de ocupación (hotel.db-ocupacion), una por proceso
+        self.ocupacion = MatrizOcupacion(self.db_path + "-ocupacion")
+        # Tiempos por método y consultas lentas (hotel.db-consultas.log)
+        self.instrumentacion = Instrumentacion(self.db_path + "-consultas.log")
+
+        # Conexión principal (hilo de la interfaz)
+        self.db = DatabaseManager(conn=self._conectar(), gestor=self)
+        self.db.crear_tablas()
+
+    def _conectar(self, multihilo=False):
+        """Abre una nueva conexión a la base de datos con el perfil de almacenamiento"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=not multihilo)
+        aplicar_perfil(conn, self.perfil)
+        return conn
+
+    def adquirir(self, timeout=None):
+        """Obtiene un DatabaseManager del pool para un hilo de trabajo"""
+        if self._cerrado:
+            raise RuntimeError("El gestor de conexiones está cerrado")
+
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._creadas < self.tamano_pool:
+                self._creadas += 1
+                return DatabaseManager(conn=self._conectar(multihilo=True), gestor=self)
+
+        # Pool lleno: esperar a que otro hilo libere una conexión
+        return self._pool.get(timeout=timeout)
+
+    def liberar(self, db):
+        """Devuelve un DatabaseManager al pool"""
+        if self._cerrado:
+            db.cerrar()
+            return
+        self._pool.put_nowait(db)
+
+    @contextmanager
+    def conexion(self, timeout=None):
+        """Context manager para usar una conexión del pool"""
+        db = self.adquirir(timeout)
+        try:
+            yield db
+        finally:
+            self.liberar(db)
+
+    def obtener_ejecutor(self, widget):
+        """Devuelve el EjecutorBD del proceso (lo crea al primer uso)"""
+        if self._ejecutor is None:
+            self._ejecutor = EjecutorBD(widget, gestor=self, hilos=self.tamano_pool)
+        else:
+            self._ejecutor.vincular(widget)
+        return self._ejecutor
+
+    def cerrar(self):
+        """Cierra la conexión principal y todas las del pool"""
+        if self._ejecutor is not None:
+            self._ejecutor.cerrar()
+        self._cerrado = True
+        while True:
+            try:
+                self._pool.get_nowait().cerrar()
+            except queue.Empty:
+                break
+        self.db.cerrar()
+        self.ocupacion.cerrar()
+        self.instrumentacion.cerrar()
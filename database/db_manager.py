@@ -1,14 +1,205 @@
 import sqlite3
+import logging
 import os
-
+import random
+import re
+import time
+from contextlib import contextmanager
+from datetime import date
+from database.perfiles import aplicar_perfil
+from database.migraciones import migrar
+from database.estadisticas import ServicioEstadisticas
+from database.identidad import MapaIdentidad
+from database.instrumentacion import Captura, Instrumentacion, instrumentar
+from database.ocupacion import ACTIVA, FINALIZADA, LIBRE, MatrizOcupacion
+from models.empleado import Empleado
+from models.habitacion import Habitacion
+from models.huesped import Huesped
+from models.reserva import Reserva, ReservaDetalle
+
+# Reintentos de una transacción cuando otra terminal tiene la base bloqueada
+REINTENTOS_BLOQUEO = 6
+ESPERA_BLOQUEO = 0.02  # segundos; se duplica en cada reintento
+
+logger = logging.getLogger(__name__)
+
+@instrumentar
 class DatabaseManager:
-    def __init__(self, db_name= "hotel.db"):
+    def __init__(self, db_name= "hotel.db", conn=None, gestor=None, perfil=None):
+        self.gestor = gestor
+        self._nivel_transaccion = 0
+        self._fts = None  # Se detecta al primer uso de buscar_huespedes
+        # Caché de contadores compartida por las conexiones del gestor
+        self.estadisticas = gestor.estadisticas if gestor is not None else ServicioEstadisticas()
+        # Filas leídas por clave primaria, también compartidas
+        self.identidad = gestor.identidad if gestor is not None else MapaIdentidad()
+        self._data_version = None  # Último PRAGMA data_version visto por esta conexión
+        self._tablas_modificadas = set()
+        self._filas_modificadas = set()
+        # Matriz habitaciones x días (ver database/ocupacion.py) y los rangos a
+        # recalcular en ella antes del próximo commit
+        self.ocupacion = gestor.ocupacion if gestor is not None else None
+        self._cambios_ocupacion = []
+        # Tiempos por método y registro de consultas lentas (ver database/instrumentacion.py)
+        self.instrumentacion = gestor.instrumentacion if gestor is not None else None
+
+        if conn is not None:
+            # Conexión entregada por GestorConexiones (el esquema ya lo prepara el gestor)
+            self.conn = conn
+            self.cursor = self.conn.cursor()
+            self._captura = Captura(self.conn)
+            return
+
         #obtener ruta de la carpeta db
         db_path = os.path.join(os.path.dirname(__file__), db_name)
         self.conn = sqlite3.connect(db_path)
+        aplicar_perfil(self.conn, perfil)
         self.cursor = self.conn.cursor()
+        self._captura = Captura(self.conn)
+        self.ocupacion = MatrizOcupacion(db_path + "-ocupacion")
+        self.instrumentacion = Instrumentacion(db_path + "-consultas.log")
         self.crear_tablas()
 
+    @contextmanager
+    def transaccion(self, inmediata=False):
+        """Agrupa varias escrituras en un solo commit (rollback si hay error).
+
+        Con inmediata=True la transacción toma el bloqueo de escritura al
+        empezar (BEGIN IMMEDIATE): lo que se lea dentro no puede cambiar antes
+        del commit. Dentro de otra transacción se une a la exterior.
+        """
+        self._nivel_transaccion += 1
+        try:
+            if inmediata and self._nivel_transaccion == 1 and not self.conn.in_transaction:
+                self.conn.execute("BEGIN IMMEDIATE")
+            yield self.cursor
+        except Exception:
+            self._nivel_transaccion -= 1
+            if self._nivel_transaccion == 0:
+                self.conn.rollback()
+                self._tablas_modificadas.clear()
+                self._filas_modificadas.clear()
+                self._cambios_ocupacion.clear()
+            raise
+        else:
+            self._nivel_transaccion -= 1
+            if self._nivel_transaccion == 0:
+                self._commit()
+                self._publicar_cambios()
+
+    def escribir_lote(self, operacion, *args):
+        """Ejecuta operacion(lote, *args) en una transacción BEGIN IMMEDIATE y devuelve su resultado.
+
+        Para escrituras masivas (database/importador.py): `lote` es una
+        EscrituraLote con la que se consulta y se escribe; lo que se escribe
+        por ella invalida las cachés y actualiza la matriz de ocupación al
+        confirmar. Reintenta si otra terminal tiene la base bloqueada.
+        """
+        return self._reintentar_si_bloqueada(self._escribir_lote, operacion, args)
+
+    def _escribir_lote(self, operacion, args):
+        with self.transaccion(inmediata=True):
+            return operacion(EscrituraLote(self), *args)
+
+    def _confirmar(self):
+        """Hace commit salvo que estemos dentro de transaccion()"""
+        if self._nivel_transaccion == 0:
+            self._commit()
+            self._publicar_cambios()
+
+    def _commit(self):
+        """Commit de la conexión; antes lleva a la matriz de ocupación los cambios en reservaciones"""
+        cambios, self._cambios_ocupacion = self._cambios_ocupacion, []
+        if cambios and self.ocupacion is not None:
+            self.ocupacion.aplicar(self.conn, cambios)
+        try:
+            self.conn.commit()
+        except Exception:
+            # La matriz ya tiene cambios que no llegaron a la base
+            if cambios and self.ocupacion is not None:
+                self.ocupacion.invalidar()
+            raise
+
+    def _cambio_ocupacion(self, *rangos, filas=None):
+        """Registra una sentencia sobre reservaciones y los rangos (habitacion_id, entrada, salida) que afecta.
+
+        filas son las que modificó la sentencia (por defecto cursor.rowcount de
+        la última ejecutada): la matriz las compara con la marca de la base.
+        """
+        if filas is None:
+            filas = self.cursor.rowcount
+        self._cambios_ocupacion.append((filas, list(rangos)))
+
+    def _reintentar_si_bloqueada(self, operacion, *args):
+        """Ejecuta operacion(*args) reintentando si la base está bloqueada.
+
+        busy_timeout ya espera al bloqueo, pero con el perfil "compatibilidad"
+        (sin espera) o con mucha contención SQLite devuelve SQLITE_BUSY; la
+        espera crece en cada intento y lleva algo de azar para que las
+        terminales no vuelvan a chocar a la vez.
+        """
+        # Dentro de otra transacción no se puede repetir solo una parte
+        if self._nivel_transaccion > 0:
+            return operacion(*args)
+
+        for intento in range(REINTENTOS_BLOQUEO):
+            try:
+                return operacion(*args)
+            except sqlite3.OperationalError as e:
+                if not self._es_bloqueo(e) or intento == REINTENTOS_BLOQUEO - 1:
+                    raise
+                time.sleep(ESPERA_BLOQUEO * (2 ** intento) * random.uniform(0.5, 1.5))
+
+    @staticmethod
+    def _es_bloqueo(error):
+        """Indica si el error es SQLITE_BUSY / SQLITE_LOCKED"""
+        nombre = getattr(error, 'sqlite_errorname', '')
+        if nombre:
+            return nombre.startswith(('SQLITE_BUSY', 'SQLITE_LOCKED'))
+        return 'locked' in str(error)
+
+    def _modificado(self, tabla, *ids):
+        """Registra la tabla (y las filas, si se conocen) que cambió la escritura en curso"""
+        self._tablas_modificadas.add(tabla)
+        self._filas_modificadas.update((tabla, id) for id in ids)
+
+    def _publicar_cambios(self):
+        """Tras el commit, invalida los contadores y las filas en caché modificadas"""
+        if self._tablas_modificadas:
+            self.estadisticas.invalidar(*self._tablas_modificadas)
+            self._tablas_modificadas.clear()
+        if self._filas_modificadas:
+            self.identidad.invalidar(self._filas_modificadas)
+            self._filas_modificadas.clear()
+
+    def _descartar_cambios_externos(self):
+        """Vacía las cachés del proceso (filas y contadores) si otra conexión confirmó cambios.
+
+        data_version es propio de cada conexión y no cambia con sus propios
+        commits; si cambió desde la última lectura, alguien más escribió
+        (otra terminal incluida) y lo guardado puede estar viejo. En la
+        primera lectura de la conexión no hay con qué comparar y también se vacía.
+        """
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            self.identidad.vaciar()
+            self.estadisticas.vaciar()
+            self._data_version = data_version
+
+    def _fila_en_cache(self, clave, cargar, depende_de=None):
+        """Lee una fila del mapa de identidad (ver _descartar_cambios_externos)"""
+        self._descartar_cambios_externos()
+        return self.identidad.obtener(clave, cargar, depende_de)
+
+    def version_tabla(self, tabla):
+        """Marca que cambia cada vez que se confirma una escritura sobre la tabla.
+
+        Combina el contador del proceso (escrituras de esta aplicación) con
+        PRAGMA data_version, que cambia cuando otra conexión confirma cambios.
+        """
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return self.estadisticas.version(tabla), data_version
+
     def crear_tablas(self):
 
         # THabitaciones
@@ -65,6 +256,9 @@ class DatabaseManager:
 
         self.conn.commit()
 
+        # Índices y cambios de esquema versionados
+        migrar(self.conn)
+
         # Insertar datos de prueba si no existen
         self.insertar_datos_prueba()
 
@@ -111,7 +305,19 @@ class DatabaseManager:
     def obtener_habitaciones(self):
         """Obtiene todas las habitaciones"""
         self.cursor.execute('SELECT * FROM habitaciones')
-        return self.cursor.fetchall()
+        return Habitacion.lista(self.cursor.fetchall())
+
+    def obtener_habitacion_por_id(self, id):
+        """Obtiene una habitación por su id (en caché hasta que se modifique)"""
+        return self._fila_en_cache(
+            ('habitaciones', id),
+            lambda: Habitacion.uno(self.conn.execute('SELECT * FROM habitaciones WHERE id=?', (id,)).fetchone())
+        )
+
+    def obtener_habitacion_por_numero(self, numero):
+        """Obtiene una habitación por su número"""
+        fila = self.conn.execute('SELECT id FROM habitaciones WHERE numero=?', (numero,)).fetchone()
+        return self.obtener_habitacion_por_id(fila[0]) if fila else None
 
     def agregar_habitacion(self, numero, tipo, precio, estado='disponible'):
         """Agrega una nueva habitación"""
@@ -120,7 +326,8 @@ class DatabaseManager:
                                 INSERT INTO habitaciones (numero, tipo, precio, estado)
                                 VALUES (?, ?, ?, ?)
                                 ''', (numero, tipo, precio, estado))
-            self.conn.commit()
+            self._modificado('habitaciones')
+            self._confirmar()
             return True
         except sqlite3.IntegrityError:
             return False  # Número de habitación duplicado
@@ -136,7 +343,8 @@ class DatabaseManager:
                                     estado=?
                                 WHERE id = ?
                                 ''', (numero, tipo, precio, estado, id))
-            self.conn.commit()
+            self._modificado('habitaciones', id)
+            self._confirmar()
             return True
         except sqlite3.IntegrityError:
             return False
@@ -144,7 +352,8 @@ class DatabaseManager:
     def eliminar_habitacion(self, id):
         """Elimina una habitación"""
         self.cursor.execute('DELETE FROM habitaciones WHERE id=?', (id,))
-        self.conn.commit()
+        self._modificado('habitaciones', id)
+        self._confirmar()
 
     def cambiar_estado_habitacion(self, id, nuevo_estado):
         """Cambia el estado de una habitación"""
@@ -153,14 +362,22 @@ class DatabaseManager:
                             SET estado=?
                             WHERE id = ?
                             ''', (nuevo_estado, id))
-        self.conn.commit()
+        self._modificado('habitaciones', id)
+        self._confirmar()
 
         # CRUD para Empleados
 
     def obtener_empleados(self):
         """Obtiene todos los empleados"""
         self.cursor.execute('SELECT * FROM empleados')
-        return self.cursor.fetchall()
+        return Empleado.lista(self.cursor.fetchall())
+
+    def obtener_empleado_por_id(self, id):
+        """Obtiene un empleado por su id (en caché hasta que se modifique)"""
+        return self._fila_en_cache(
+            ('empleados', id),
+            lambda: Empleado.uno(self.conn.execute('SELECT * FROM empleados WHERE id=?', (id,)).fetchone())
+        )
 
     def validar_login(self, usuario, password):
         """Valida credenciales de empleado"""
@@ -179,7 +396,8 @@ class DatabaseManager:
                                 INSERT INTO empleados (nombre, apellido, puesto, telefono, usuario, password, privilegio)
                                 VALUES (?, ?, ?, ?, ?, ?, ?)
                                 ''', (nombre, apellido, puesto, telefono, usuario, password, privilegio))
-            self.conn.commit()
+            self._modificado('empleados')
+            self._confirmar()
             return True
         except sqlite3.IntegrityError:
             return False
@@ -195,62 +413,93 @@ class DatabaseManager:
                                 telefono=?
                             WHERE id = ?
                             ''', (nombre, apellido, privilegio, puesto, telefono, id))
-        self.conn.commit()
+        self._modificado('empleados', id)
+        self._confirmar()
 
     def eliminar_empleado(self, id):
         """Elimina un empleado"""
         self.cursor.execute('DELETE FROM empleados WHERE id=?', (id,))
-        self.conn.commit()
+        self._modificado('empleados', id)
+        self._confirmar()
 
         # Estadísticas
 
     def obtener_estadisticas(self):
-        """Obtiene estadísticas generales del hotel"""
-        stats = {}
-
-        # Habitaciones por estado
-        self.cursor.execute('''
-                            SELECT estado, COUNT(*)
-                            FROM habitaciones
-                            GROUP BY estado
-                            ''')
-        estados = self.cursor.fetchall()
-
-        stats['disponibles'] = 0
-        stats['ocupadas'] = 0
-        stats['limpieza'] = 0
-        stats['mantenimiento'] = 0
-
-        for estado, cantidad in estados:
-            if estado == 'disponible':
-                stats['disponibles'] = cantidad
-            elif estado == 'ocupada':
-                stats['ocupadas'] = cantidad
-            elif estado == 'limpieza':
-                stats['limpieza'] = cantidad
-            elif estado == 'mantenimiento':
-                stats['mantenimiento'] = cantidad
-
-        # Total de empleados
-        self.cursor.execute('SELECT COUNT(*) FROM empleados')
-        stats['empleados'] = self.cursor.fetchone()[0]
-
-        # Reservas activas
-        self.cursor.execute("SELECT COUNT(*) FROM reservaciones WHERE estado='activa'")
-        stats['reservas_activas'] = self.cursor.fetchone()[0]
-
-        return stats
+        """Obtiene estadísticas generales del hotel (en caché hasta la próxima escritura)"""
+        self._descartar_cambios_externos()
+        return self.estadisticas.obtener(self.conn)
 
     #CRUD Huespedes
     def obtener_huespedes(self):
         """Obtiene todos los huéspedes"""
         self.cursor.execute('SELECT * FROM huespedes')
-        return self.cursor.fetchall()
+        return Huesped.lista(self.cursor.fetchall())
+
+    def obtener_huesped_por_id(self, id):
+        """Obtiene un huésped por su id (en caché hasta que se modifique)"""
+        return self._fila_en_cache(
+            ('huespedes', id),
+            lambda: Huesped.uno(self.conn.execute('SELECT * FROM huespedes WHERE id=?', (id,)).fetchone())
+        )
 
     def buscar_huesped_por_telefono(self, telefono):
         """Busca un huésped por su usuario"""
         self.cursor.execute('SELECT * FROM huespedes WHERE telefono=?', (telefono,))
-        return self.cursor.fetchone()
+        return Huesped.uno(self.cursor.fetchone())
+
+    def buscar_huespedes(self, texto, limite=50, pagina=0):
+        """Busca huéspedes por nombre, apellido, teléfono o email.
+
+        Cada palabra se busca como prefijo y sin distinguir acentos ("perez"
+        encuentra "Pérez"). Devuelve filas de huespedes ordenadas por relevancia,
+        de a `limite` por página.
+        """
+        terminos = re.findall(r"\w+", texto or "")
+        desplazamiento = pagina * limite
+
+        if not terminos:
+            self.cursor.execute('SELECT * FROM huespedes ORDER BY id LIMIT ? OFFSET ?',
+                                (limite, desplazamiento))
+            return Huesped.lista(self.cursor.fetchall())
+
+        if not self._tiene_fts():
+            return self._buscar_huespedes_like(terminos, limite, desplazamiento)
+
+        # '"per"* "gom"*': todas las palabras, cada una como prefijo
+        consulta = " ".join(f'"{t}"*' for t in terminos)
+        # bm25 con pesos por columna (nombre, apellido, teléfono, email)
+        self.cursor.execute('''
+                            SELECT h.*
+                            FROM huespedes_fts f
+                                     INNER JOIN huespedes h ON h.id = f.rowid
+                            WHERE huespedes_fts MATCH ?
+                            ORDER BY bm25(huespedes_fts, 10.0, 10.0, 5.0, 2.0)
+                            LIMIT ? OFFSET ?
+                            ''', (consulta, limite, desplazamiento))
+        return Huesped.lista(self.cursor.fetchall())
+
+    def _buscar_huespedes_like(self, terminos, limite, desplazamiento):
+        """Alternativa sin FTS5: LIKE por palabra (no ignora acentos)"""
+        condiciones = []
+        parametros = []
+        for termino in terminos:
+            condiciones.append("(nombre LIKE ? OR apellido LIKE ? OR telefono LIKE ? OR email LIKE ?)")
+            parametros.extend([f"%{termino}%"] * 4)
+
+        self.cursor.execute(f'''
+                            SELECT * FROM huespedes
+                            WHERE {" AND ".join(condiciones)}
+                            ORDER BY apellido, nombre
+                            LIMIT ? OFFSET ?
+                            ''', (*parametros, limite, desplazamiento))
+        return Huesped.lista(self.cursor.fetchall())
+
+    def _tiene_fts(self):
+        """Indica si la base de datos tiene el índice huespedes_fts"""
+        if self._fts is None:
+            self.cursor.execute("SELECT 1 FROM sqlite_master WHERE name='huespedes_fts'")
+            self._fts = self.cursor.fetchone() is not None
+        return self._fts
 
     def agregar_huesped(self, nombre, apellido, telefono, email='', password=''):
         """Agrega un nuevo huésped"""
@@ -259,8 +508,10 @@ class DatabaseManager:
                                 INSERT INTO huespedes (nombre, apellido, telefono, email, password)
                                 VALUES (?, ?, ?, ?, ?)
                                 ''', (nombre, apellido, telefono, email, password))
-            self.conn.commit()
-            return self.cursor.lastrowid  # Devuelve el ID del huésped creado
+            huesped_id = self.cursor.lastrowid  # Devuelve el ID del huésped creado
+            self._modificado('huespedes')
+            self._confirmar()
+            return huesped_id
         except sqlite3.IntegrityError:
             return None
 
@@ -275,7 +526,8 @@ class DatabaseManager:
                                     email=?
                                 WHERE id = ?
                                 ''', (nombre, apellido, telefono, email, id))
-            self.conn.commit()
+            self._modificado('huespedes', id)
+            self._confirmar()
             return True
         except sqlite3.IntegrityError:
             return False
@@ -283,7 +535,8 @@ class DatabaseManager:
     def eliminar_huesped(self, id):
         """Elimina un huésped"""
         self.cursor.execute('DELETE FROM huespedes WHERE id=?', (id,))
-        self.conn.commit()
+        self._modificado('huespedes', id)
+        self._confirmar()
 
     # ==================== CRUD para Reservas ====================
 
@@ -305,43 +558,258 @@ class DatabaseManager:
                                      INNER JOIN habitaciones hab ON r.habitacion_id = hab.id
                             ORDER BY r.fecha_entrada DESC
                             ''')
+        return ReservaDetalle.lista(self.cursor.fetchall())
+
+    def obtener_reservas_activas(self):
+        """Obtiene las reservas activas (mismas columnas que obtener_reservas)"""
+        self.cursor.execute('''
+                            SELECT r.id,
+                                   r.huesped_id,
+                                   h.nombre || ' ' || h.apellido AS huesped,
+                                   r.habitacion_id,
+                                   hab.numero                    AS habitacion,
+                                   hab.tipo,
+                                   r.fecha_entrada,
+                                   r.fecha_salida,
+                                   r.estado,
+                                   r.total
+                            FROM reservaciones r
+                                     INNER JOIN huespedes h ON r.huesped_id = h.id
+                                     INNER JOIN habitaciones hab ON r.habitacion_id = hab.id
+                            WHERE r.estado = 'activa'
+                            ORDER BY r.fecha_entrada DESC
+                            ''')
+        return ReservaDetalle.lista(self.cursor.fetchall())
+
+    def obtener_reservas_pagina(self, limite=50, despues_de=None, estado=None, texto=None):
+        """Obtiene una página de reservas (mismas columnas que obtener_reservas).
+
+        Paginación por clave: despues_de es (fecha_entrada, id) de la última fila
+        de la página anterior, así cada página cuesta lo mismo sin importar
+        cuántas reservas haya antes. estado filtra por estado exacto y texto
+        busca en el nombre del huésped o el número de habitación.
+        """
+        condiciones = []
+        parametros = []
+
+        if despues_de is not None:
+            condiciones.append("(r.fecha_entrada, r.id) < (?, ?)")
+            parametros.extend(despues_de)
+
+        if estado:
+            condiciones.append("r.estado = ?")
+            parametros.append(estado)
+
+        if texto:
+            condiciones.append("(h.nombre || ' ' || h.apellido LIKE ? OR hab.numero LIKE ?)")
+            parametros.extend([f"%{texto}%"] * 2)
+
+        where = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+
+        self.cursor.execute(f'''
+                            SELECT r.id,
+                                   r.huesped_id,
+                                   h.nombre || ' ' || h.apellido AS huesped,
+                                   r.habitacion_id,
+                                   hab.numero                    AS habitacion,
+                                   hab.tipo,
+                                   r.fecha_entrada,
+                                   r.fecha_salida,
+                                   r.estado,
+                                   r.total
+                            FROM reservaciones r
+                                     INNER JOIN huespedes h ON r.huesped_id = h.id
+                                     INNER JOIN habitaciones hab ON r.habitacion_id = hab.id
+                            {where}
+                            ORDER BY r.fecha_entrada DESC, r.id DESC
+                            LIMIT ?
+                            ''', (*parametros, limite))
+        return ReservaDetalle.lista(self.cursor.fetchall())
+
+    def iterar_reservas(self, desde=None, hasta=None, estado=None, tamano_bloque=1000):
+        """Recorre las reservas (mismas columnas que obtener_reservas) de a bloques.
+
+        Usa un cursor propio con fetchmany, así la memoria no depende de cuántas
+        reservas haya (exportaciones del historial completo). desde/hasta
+        filtran por fecha de entrada (inclusive) y estado por estado exacto.
+        Orden: fecha de entrada y id ascendentes.
+        """
+        condiciones, parametros = [], []
+        if desde:
+            condiciones.append("r.fecha_entrada >= ?")
+            parametros.append(desde)
+        if hasta:
+            condiciones.append("r.fecha_entrada <= ?")
+            parametros.append(hasta)
+        if estado:
+            condiciones.append("r.estado = ?")
+            parametros.append(estado)
+        where = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(f'''
+                           SELECT r.id,
+                                  r.huesped_id,
+                                  h.nombre || ' ' || h.apellido AS huesped,
+                                  r.habitacion_id,
+                                  hab.numero                    AS habitacion,
+                                  hab.tipo,
+                                  r.fecha_entrada,
+                                  r.fecha_salida,
+                                  r.estado,
+                                  r.total
+                           FROM reservaciones r
+                                    INNER JOIN huespedes h ON r.huesped_id = h.id
+                                    INNER JOIN habitaciones hab ON r.habitacion_id = hab.id
+                           {where}
+                           ORDER BY r.fecha_entrada, r.id
+                           ''', parametros)
+            while True:
+                bloque = cursor.fetchmany(tamano_bloque)
+                if not bloque:
+                    return
+                yield from ReservaDetalle.lista(bloque)
+        finally:
+            cursor.close()
+
+    def iterar_huespedes(self, tamano_bloque=1000):
+        """Recorre todos los huéspedes de a bloques (ver iterar_reservas)"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("SELECT * FROM huespedes ORDER BY id")
+            while True:
+                bloque = cursor.fetchmany(tamano_bloque)
+                if not bloque:
+                    return
+                yield from Huesped.lista(bloque)
+        finally:
+            cursor.close()
+
+    def obtener_noches_rango(self, desde, hasta):
+        """Reservas no canceladas con al menos una noche entre desde y hasta (inclusive).
+
+        Devuelve tuplas (habitacion_id, fecha_entrada, fecha_salida, total, estado)
+        sin pasar por los modelos: son la entrada de database.analitica, que las
+        convierte directamente en arreglos.
+        """
+        self.cursor.execute('''
+                            SELECT habitacion_id, fecha_entrada, fecha_salida, total, estado
+                            FROM reservaciones
+                            WHERE fecha_entrada <= ?
+                              AND fecha_salida > ?
+                              AND estado != 'cancelada'
+                            ''', (hasta, desde))
         return self.cursor.fetchall()
 
     def obtener_reserva_por_id(self, reserva_id):
         """Obtiene una reserva específica"""
         self.cursor.execute('SELECT * FROM reservaciones WHERE id=?', (reserva_id,))
-        return self.cursor.fetchone()
+        return Reserva.uno(self.cursor.fetchone())
+
+    def obtener_reserva_detalle(self, reserva_id):
+        """Obtiene una reserva con huésped y habitación (mismas columnas que obtener_reservas)"""
+        def cargar():
+            return ReservaDetalle.uno(self.conn.execute('''
+                                     SELECT r.id,
+                                            r.huesped_id,
+                                            h.nombre || ' ' || h.apellido AS huesped,
+                                            r.habitacion_id,
+                                            hab.numero                    AS habitacion,
+                                            hab.tipo,
+                                            r.fecha_entrada,
+                                            r.fecha_salida,
+                                            r.estado,
+                                            r.total
+                                     FROM reservaciones r
+                                              INNER JOIN huespedes h ON r.huesped_id = h.id
+                                              INNER JOIN habitaciones hab ON r.habitacion_id = hab.id
+                                     WHERE r.id = ?
+                                     ''', (reserva_id,)).fetchone())
+
+        # También cambia si se edita el huésped o la habitación de la reserva
+        return self._fila_en_cache(
+            ('reservaciones', reserva_id),
+            cargar,
+            depende_de=lambda fila: [('huespedes', fila[1]), ('habitaciones', fila[3])]
+        )
 
     def agregar_reserva(self, huesped_id, habitacion_id, fecha_entrada, fecha_salida, total):
-        """Agrega una nueva reserva"""
+        """Agrega una nueva reserva si la habitación está libre en esas fechas.
+
+        La comprobación y el INSERT van en una misma transacción BEGIN IMMEDIATE:
+        dos terminales que reservan la misma habitación a la vez no pueden
+        pasar ambas la comprobación. Devuelve False si la habitación ya está
+        reservada en el rango o si no se pudo guardar.
+        """
         try:
+            return self._reintentar_si_bloqueada(
+                self._insertar_reserva, huesped_id, habitacion_id, fecha_entrada, fecha_salida, total
+            )
+        except Exception:
+            logger.exception("Error al agregar reserva (huésped %s, habitación %s)", huesped_id, habitacion_id)
+            return False
+
+    def _insertar_reserva(self, huesped_id, habitacion_id, fecha_entrada, fecha_salida, total):
+        """Comprueba el solapamiento e inserta la reserva en una sola transacción"""
+        with self.transaccion(inmediata=True):
+            # Siempre contra la tabla: es la garantía contra reservas dobles
+            if self._hay_solapamiento(habitacion_id, fecha_entrada, fecha_salida):
+                return False
+
             self.cursor.execute('''
                                 INSERT INTO reservaciones (huesped_id, habitacion_id, fecha_entrada, fecha_salida, total, estado)
                                 VALUES (?, ?, ?, ?, ?, 'activa')
                                 ''', (huesped_id, habitacion_id, fecha_entrada, fecha_salida, total))
+            self._modificado('reservaciones')
+            self._cambio_ocupacion((habitacion_id, fecha_entrada, fecha_salida))
 
-            # Cambiar estado de la habitación a ocupada
-            self.cambiar_estado_habitacion(habitacion_id, 'ocupada')
+            # Solo se ocupa la habitación si la estadía empieza hoy (o ya empezó);
+            # las reservas futuras no bloquean la habitación en el presente
+            if self._cubre_hoy(fecha_entrada, fecha_salida):
+                self.cambiar_estado_habitacion(habitacion_id, 'ocupada')
 
-            self.conn.commit()
-            return True
-        except Exception as e:
-            print(f"Error al agregar reserva: {e}")
-            return False
+        return True
 
     def actualizar_reserva(self, id, huesped_id, habitacion_id, fecha_entrada, fecha_salida, estado, total):
-        """Actualiza una reserva"""
-        self.cursor.execute('''
-                            UPDATE reservaciones
-                            SET huesped_id=?,
-                                habitacion_id=?,
-                                fecha_entrada=?,
-                                fecha_salida=?,
-                                estado=?,
-                                total=?
-                            WHERE id = ?
-                            ''', (huesped_id, habitacion_id, fecha_entrada, fecha_salida, estado, total, id))
-        self.conn.commit()
+        """Actualiza una reserva si la habitación sigue libre en las nuevas fechas.
+
+        Igual que agregar_reserva: la comprobación (sin contar la propia
+        reserva) y el UPDATE van en una transacción BEGIN IMMEDIATE. Devuelve
+        False si se cruza con otra reserva activa o si no se pudo guardar.
+        """
+        try:
+            return self._reintentar_si_bloqueada(
+                self._modificar_reserva, id, huesped_id, habitacion_id, fecha_entrada, fecha_salida, estado, total
+            )
+        except Exception:
+            logger.exception("Error al actualizar reserva %s", id)
+            return False
+
+    def _modificar_reserva(self, id, huesped_id, habitacion_id, fecha_entrada, fecha_salida, estado, total):
+        """Comprueba el solapamiento y actualiza la reserva en una sola transacción"""
+        with self.transaccion(inmediata=True):
+            if estado == 'activa' and self._hay_solapamiento(habitacion_id, fecha_entrada, fecha_salida, id):
+                return False
+
+            anterior = self.obtener_reserva_por_id(id)
+            self.cursor.execute('''
+                                UPDATE reservaciones
+                                SET huesped_id=?,
+                                    habitacion_id=?,
+                                    fecha_entrada=?,
+                                    fecha_salida=?,
+                                    estado=?,
+                                    total=?
+                                WHERE id = ?
+                                ''', (huesped_id, habitacion_id, fecha_entrada, fecha_salida, estado, total, id))
+            self._modificado('reservaciones', id)
+            rangos = [(habitacion_id, fecha_entrada, fecha_salida)]
+            if anterior:
+                rangos.append((anterior.habitacion_id, anterior.fecha_entrada, anterior.fecha_salida))
+            self._cambio_ocupacion(*rangos)
+
+        return True
 
     def eliminar_reserva(self, id):
         """Elimina una reserva"""
@@ -349,52 +817,203 @@ class DatabaseManager:
         reserva = self.obtener_reserva_por_id(id)
 
         if reserva:
-            habitacion_id = reserva[2]
-
-            # Eliminar la reserva
-            self.cursor.execute('DELETE FROM reservaciones WHERE id=?', (id,))
+            habitacion_id = reserva.habitacion_id
 
-            # Cambiar estado de la habitación a disponible
-            self.cambiar_estado_habitacion(habitacion_id, 'disponible')
+            with self.transaccion():
+                # Eliminar la reserva
+                self.cursor.execute('DELETE FROM reservaciones WHERE id=?', (id,))
+                self._modificado('reservaciones', id)
+                self._cambio_ocupacion((habitacion_id, reserva.fecha_entrada, reserva.fecha_salida))
 
-            self.conn.commit()
+                # Liberar la habitación solo si esta reserva la ocupaba hoy
+                if reserva.estado == 'activa' and self._cubre_hoy(reserva.fecha_entrada, reserva.fecha_salida):
+                    self.cambiar_estado_habitacion(habitacion_id, 'disponible')
 
     def cancelar_reserva(self, id):
         """Cancela una reserva (cambia estado a cancelada)"""
         reserva = self.obtener_reserva_por_id(id)
 
         if reserva:
-            habitacion_id = reserva[2]
+            habitacion_id = reserva.habitacion_id
 
-            # Cambiar estado de la reserva
-            self.cursor.execute('UPDATE reservaciones SET estado="cancelada" WHERE id=?', (id,))
+            with self.transaccion():
+                # Cambiar estado de la reserva
+                self.cursor.execute("UPDATE reservaciones SET estado='cancelada' WHERE id=?", (id,))
+                self._modificado('reservaciones', id)
+                self._cambio_ocupacion((habitacion_id, reserva.fecha_entrada, reserva.fecha_salida))
 
-            # Liberar la habitación
-            self.cambiar_estado_habitacion(habitacion_id, 'disponible')
-
-            self.conn.commit()
+                # Liberar la habitación solo si esta reserva la ocupaba hoy
+                if reserva.estado == 'activa' and self._cubre_hoy(reserva.fecha_entrada, reserva.fecha_salida):
+                    self.cambiar_estado_habitacion(habitacion_id, 'disponible')
 
     def finalizar_reserva(self, id):
         """Finaliza una reserva (checkout)"""
         reserva = self.obtener_reserva_por_id(id)
 
         if reserva:
-            habitacion_id = reserva[2]
+            habitacion_id = reserva.habitacion_id
 
-            # Cambiar estado de la reserva
-            self.cursor.execute('UPDATE reservaciones SET estado="finalizada" WHERE id=?', (id,))
+            with self.transaccion():
+                # Cambiar estado de la reserva
+                self.cursor.execute("UPDATE reservaciones SET estado='finalizada' WHERE id=?", (id,))
+                self._modificado('reservaciones', id)
+                self._cambio_ocupacion((habitacion_id, reserva.fecha_entrada, reserva.fecha_salida))
 
-            # Cambiar habitación a limpieza
-            self.cambiar_estado_habitacion(habitacion_id, 'limpieza')
-
-            self.conn.commit()
+                # Cambiar habitación a limpieza
+                self.cambiar_estado_habitacion(habitacion_id, 'limpieza')
 
     def obtener_habitaciones_disponibles(self):
         """Obtiene solo las habitaciones disponibles"""
         self.cursor.execute("SELECT * FROM habitaciones WHERE estado='disponible'")
-        return self.cursor.fetchall()
+        return Habitacion.lista(self.cursor.fetchall())
+
+    def obtener_habitaciones_disponibles_rango(self, fecha_entrada, fecha_salida):
+        """Obtiene las habitaciones libres entre check-in y check-out.
+
+        Una habitación está libre si no tiene reservas activas que se crucen con
+        [fecha_entrada, fecha_salida). Las fechas son 'YYYY-MM-DD'. Las habitaciones
+        en mantenimiento no se ofrecen.
+        """
+        if self.ocupacion is not None:
+            filas = self.conn.execute(
+                "SELECT * FROM habitaciones WHERE estado != 'mantenimiento' ORDER BY numero").fetchall()
+            libres = self.ocupacion.libres(self.conn, (fila[0] for fila in filas), fecha_entrada, fecha_salida)
+            if libres is not None:
+                libres = set(libres)
+                return Habitacion.lista([fila for fila in filas if fila[0] in libres])
+
+        self.cursor.execute('''
+                            SELECT hab.*
+                            FROM habitaciones hab
+                            WHERE hab.estado != 'mantenimiento'
+                              AND NOT EXISTS (SELECT 1
+                                              FROM reservaciones r
+                                              WHERE r.habitacion_id = hab.id
+                                                AND r.estado = 'activa'
+                                                AND r.fecha_salida > ?
+                                                AND r.fecha_entrada < ?)
+                            ORDER BY hab.numero
+                            ''', (fecha_entrada, fecha_salida))
+        return Habitacion.lista(self.cursor.fetchall())
+
+    def habitacion_disponible(self, habitacion_id, fecha_entrada, fecha_salida, excluir_reserva=None):
+        """Indica si una habitación no tiene reservas activas en el rango"""
+        if excluir_reserva is None and self.ocupacion is not None:
+            libre = self.ocupacion.disponible(self.conn, habitacion_id, fecha_entrada, fecha_salida)
+            if libre is not None:
+                return libre
+        return not self._hay_solapamiento(habitacion_id, fecha_entrada, fecha_salida, excluir_reserva)
+
+    def _hay_solapamiento(self, habitacion_id, fecha_entrada, fecha_salida, excluir_reserva=None):
+        """Indica, consultando reservaciones, si hay una reserva activa que se cruce con el rango"""
+        self.cursor.execute('''
+                            SELECT 1
+                            FROM reservaciones
+                            WHERE habitacion_id = ?
+                              AND estado = 'activa'
+                              AND fecha_salida > ?
+                              AND fecha_entrada < ?
+                              AND id != ?
+                            LIMIT 1
+                            ''', (habitacion_id, fecha_entrada, fecha_salida, excluir_reserva or 0))
+        return self.cursor.fetchone() is not None
+
+    def calendario_habitacion(self, habitacion_id, desde, hasta):
+        """Estado de cada noche de la habitación en [desde, hasta): 'libre', 'activa' o 'finalizada'"""
+        nombres = {LIBRE: 'libre', ACTIVA: 'activa', FINALIZADA: 'finalizada'}
+        if self.ocupacion is not None:
+            estados = self.ocupacion.estados(self.conn, habitacion_id, desde, hasta)
+            if estados is not None:
+                return [nombres[e] for e in estados]
+
+        inicio = date.fromisoformat(desde).toordinal()
+        estados = [LIBRE] * (date.fromisoformat(hasta).toordinal() - inicio)
+        for entrada, salida, estado in self.conn.execute('''
+                SELECT fecha_entrada, fecha_salida, estado
+                FROM reservaciones
+                WHERE habitacion_id = ?
+                  AND estado IN ('activa', 'finalizada')
+                  AND fecha_entrada < ?
+                  AND fecha_salida > ?
+                ORDER BY estado = 'activa'
+                ''', (habitacion_id, hasta, desde)):
+            valor = ACTIVA if estado == 'activa' else FINALIZADA
+            for dia in range(max(date.fromisoformat(entrada).toordinal() - inicio, 0),
+                             min(date.fromisoformat(salida).toordinal() - inicio, len(estados))):
+                estados[dia] = valor
+        return [nombres[e] for e in estados]
+
+    def ocupacion_por_dia(self, desde, hasta, habitacion_ids=None):
+        """Habitaciones ocupadas (reserva activa o finalizada) en cada noche de [desde, hasta).
+
+        Con habitacion_ids cuenta solo esas habitaciones (ej. las de un tipo).
+        """
+        if habitacion_ids is None:
+            habitacion_ids = [fila[0] for fila in self.conn.execute("SELECT id FROM habitaciones")]
+        habitacion_ids = list(habitacion_ids)
+
+        if self.ocupacion is not None:
+            cuentas = self.ocupacion.ocupadas_por_dia(self.conn, habitacion_ids, desde, hasta)
+            if cuentas is not None:
+                return cuentas
+
+        # Sin matriz: noches por habitación (una habitación cuenta una vez por día)
+        inicio = date.fromisoformat(desde).toordinal()
+        dias = date.fromisoformat(hasta).toordinal() - inicio
+        incluidas = set(habitacion_ids)
+        noches = {}
+        for habitacion_id, entrada, salida, _, _ in self.obtener_noches_rango(desde, hasta):
+            if habitacion_id not in incluidas:
+                continue
+            fila = noches.setdefault(habitacion_id, bytearray(dias))
+            a = max(date.fromisoformat(entrada).toordinal() - inicio, 0)
+            b = min(date.fromisoformat(salida).toordinal() - inicio, dias)
+            if b > a:
+                fila[a:b] = b"\x01" * (b - a)
+        return [sum(dia) for dia in zip(*noches.values())] if noches else [0] * dias
+
+    @staticmethod
+    def _cubre_hoy(fecha_entrada, fecha_salida):
+        """Indica si una estadía incluye la noche de hoy"""
+        hoy = date.today().isoformat()
+        return fecha_entrada <= hoy < fecha_salida
 
     def cerrar(self):
         """Cierra la conexión a la base de datos"""
+        # La matriz y la instrumentación del gestor las cierra el gestor
+        if self.gestor is None:
+            if self.ocupacion is not None:
+                self.ocupacion.cerrar()
+            if self.instrumentacion is not None:
+                self.instrumentacion.cerrar()
         self.conn.close()
 
+
+class EscrituraLote:
+    """Consultas y escrituras disponibles dentro de DatabaseManager.escribir_lote"""
+
+    def __init__(self, db):
+        self._db = db
+
+    def consultar(self, sql, parametros=()):
+        """Ejecuta una consulta y devuelve todas sus filas"""
+        return self._db.cursor.execute(sql, parametros).fetchall()
+
+    def ejecutar_muchos(self, tabla, sql, filas, ids=(), rangos=()):
+        """executemany de sql sobre `tabla` y devuelve las filas modificadas.
+
+        ids son las claves de filas ya existentes que cambian (para el mapa de
+        identidad); rangos, en reservaciones, los (habitacion_id, entrada,
+        salida) a recalcular en la matriz de ocupación.
+        """
+        cursor = self._db.cursor
+        cursor.executemany(sql, filas)
+        modificadas = cursor.rowcount
+        self._db._modificado(tabla, *ids)
+        if tabla == 'reservaciones':
+            self._db._cambio_ocupacion(*rangos, filas=modificadas)
+        return modificadas
+
+    def hay_solapamiento(self, habitacion_id, fecha_entrada, fecha_salida):
+        """Indica si ya hay una reserva activa en la habitación que se cruce con el rango"""
+        return self._db._hay_solapamiento(habitacion_id, fecha_entrada, fecha_salida)
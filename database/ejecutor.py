@@ -0,0 +1,176 @@
+# database/ejecutor.py
+import queue
+import sys
+import threading
+import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class EjecutorBD:
+    """Ejecuta llamadas a la base de datos fuera del hilo de la interfaz.
+
+    Cada tarea corre en un hilo de trabajo con un DatabaseManager del pool de
+    GestorConexiones y devuelve un Future. Tkinter no es seguro entre hilos,
+    así que los resultados no se entregan desde el hilo de trabajo: quedan en
+    una cola que el hilo de la interfaz revisa con `after` mientras haya
+    tareas pendientes, y desde ahí se llaman los callbacks.
+
+    Sin gestor (ventanas abiertas con un DatabaseManager propio) las tareas se
+    ejecutan en el hilo de la interfaz con ese mismo db, con igual API.
+    """
+
+    def __init__(self, widget, gestor=None, db=None, hilos=2, intervalo_ms=25):
+        # after() siempre sobre la raíz: sobrevive a las pantallas que se destruyen
+        self.raiz = widget.nametowidget(".")
+        self.gestor = gestor
+        self.db = db
+        self.intervalo_ms = intervalo_ms
+
+        self._hilos = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="bd") if gestor else None
+        self._entregas = queue.Queue()
+        self._pendientes = 0
+        self._lock = threading.Lock()
+        self._revisando = False
+
+    def enviar(self, tarea, *args, al_terminar=None, al_fallar=None, dueno=None,
+               indicador=None, **kwargs) -> Future:
+        """Encola una tarea y devuelve su Future.
+
+        tarea es el nombre de un método de DatabaseManager ("validar_login") o
+        una función que recibe el db como primer argumento. al_terminar(resultado)
+        y al_fallar(error) se llaman en el hilo de la interfaz; si `dueno` ya fue
+        destruido no se llaman. `indicador` se muestra mientras la tarea corre.
+        """
+        if indicador is not None:
+            indicador.iniciar()
+
+        if self._hilos is not None:
+            futuro = self._hilos.submit(self._ejecutar_en_pool, tarea, args, kwargs)
+        else:
+            futuro = Future()
+            try:
+                futuro.set_result(self._llamar(self.db, tarea, args, kwargs))
+            except Exception as e:
+                futuro.set_exception(e)
+
+        self.entregar(futuro, al_terminar, al_fallar, dueno, indicador)
+        return futuro
+
+    def entregar(self, futuro: Future, al_terminar=None, al_fallar=None, dueno=None, indicador=None):
+        """Programa los callbacks de un Future para el hilo de la interfaz"""
+        with self._lock:
+            self._pendientes += 1
+
+        # add_done_callback corre en el hilo de trabajo: solo encolar
+        futuro.add_done_callback(
+            lambda f: self._entregas.put((f, al_terminar, al_fallar, dueno, indicador))
+        )
+        self._programar_revision()
+
+    def vincular(self, widget):
+        """Usa la raíz de `widget` para entregar resultados.
+
+        El login destruye su ventana raíz y el dashboard crea otra: los
+        callbacks pasan a programarse sobre la nueva.
+        """
+        raiz = widget.nametowidget(".")
+        if raiz is self.raiz:
+            return
+
+        self.raiz = raiz
+        # La revisión programada en la raíz anterior ya no va a correr
+        self._revisando = False
+        with self._lock:
+            pendientes = self._pendientes > 0
+        if pendientes:
+            self._programar_revision()
+
+    def cerrar(self):
+        """Espera las tareas en curso y detiene los hilos de trabajo"""
+        if self._hilos is not None:
+            self._hilos.shutdown(wait=True, cancel_futures=True)
+
+    # ==================== Internos ====================
+
+    def _ejecutar_en_pool(self, tarea, args, kwargs):
+        with self.gestor.conexion() as db:
+            return self._llamar(db, tarea, args, kwargs)
+
+    @staticmethod
+    def _llamar(db, tarea, args, kwargs):
+        if isinstance(tarea, str):
+            return getattr(db, tarea)(*args, **kwargs)
+        return tarea(db, *args, **kwargs)
+
+    def _programar_revision(self):
+        if not self._revisando:
+            self._revisando = True
+            self.raiz.after(self.intervalo_ms, self._revisar)
+
+    def _revisar(self):
+        """Entrega en el hilo de la interfaz los resultados ya terminados"""
+        raiz = self.raiz
+        while True:
+            try:
+                futuro, al_terminar, al_fallar, dueno, indicador = self._entregas.get_nowait()
+            except queue.Empty:
+                break
+
+            with self._lock:
+                self._pendientes -= 1
+
+            try:
+                self._entregar_resultado(futuro, al_terminar, al_fallar, dueno, indicador)
+            except Exception:
+                # Un callback con error no debe detener la entrega de los demás
+                self.raiz.report_callback_exception(*sys.exc_info())
+
+        # Un callback abrió otra raíz (vincular): la revisión sigue allí
+        if raiz is not self.raiz:
+            return
+
+        with self._lock:
+            quedan = self._pendientes > 0
+
+        if quedan:
+            try:
+                self.raiz.after(self.intervalo_ms, self._revisar)
+                return
+            except tk.TclError:
+                # La raíz se destruyó (cierre de la aplicación): nadie recibe ya los resultados
+                pass
+        self._revisando = False
+
+    @staticmethod
+    def _entregar_resultado(futuro, al_terminar, al_fallar, dueno, indicador):
+        # Los widgets pueden haberse destruido mientras la tarea corría (logout,
+        # ventana cerrada); con la aplicación destruida Tk lanza TclError
+        try:
+            vivo = dueno is None or bool(dueno.winfo_exists())
+        except tk.TclError:
+            vivo = False
+
+        if indicador is not None:
+            try:
+                indicador.terminar()
+            except tk.TclError:
+                pass
+
+        if not vivo or futuro.cancelled():
+            return
+
+        error = futuro.exception()
+        if error is None:
+            if al_terminar is not None:
+                al_terminar(futuro.result())
+        elif al_fallar is not None:
+            al_fallar(error)
+        else:
+            raise error
+
+
+def ejecutor_para(db, widget) -> EjecutorBD:
+    """Devuelve el ejecutor del gestor del db, o uno síncrono si no hay gestor"""
+    if db.gestor is not None:
+        return db.gestor.obtener_ejecutor(widget)
+    return EjecutorBD(widget, db=db)
@@ -0,0 +1,77 @@
+# database/estadisticas.py
+import threading
+from collections import defaultdict
+
+# contador -> (tabla de la que depende, subconsulta escalar)
+# Cada subconsulta usa un índice (o una tabla pequeña); todas se piden juntas
+# en un solo SELECT.
+CONTADORES = {
+    'disponibles': ('habitaciones', "SELECT COUNT(*) FROM habitaciones WHERE estado = 'disponible'"),
+    'ocupadas': ('habitaciones', "SELECT COUNT(*) FROM habitaciones WHERE estado = 'ocupada'"),
+    'limpieza': ('habitaciones', "SELECT COUNT(*) FROM habitaciones WHERE estado = 'limpieza'"),
+    'mantenimiento': ('habitaciones', "SELECT COUNT(*) FROM habitaciones WHERE estado = 'mantenimiento'"),
+    'empleados': ('empleados', "SELECT COUNT(*) FROM empleados"),
+    'reservas_activas': ('reservaciones', "SELECT COUNT(*) FROM reservaciones WHERE estado = 'activa'"),
+}
+
+
+class ServicioEstadisticas:
+    """Contadores del dashboard con caché e invalidación por tabla.
+
+    Se comparte entre todas las conexiones del proceso (ver GestorConexiones).
+    DatabaseManager avisa qué tablas cambió cuando confirma una escritura y
+    solo se recalculan los contadores que dependen de ellas. Los cambios de
+    otras terminales los detecta DatabaseManager con PRAGMA data_version y
+    vacían la caché completa (ver vaciar()).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._valores = {}
+        # Versión por tabla (todas, no solo las de los contadores): evita guardar
+        # un valor leído antes de una escritura y es la base de version_tabla()
+        self._versiones = defaultdict(int)
+
+    def obtener(self, conn):
+        """Devuelve todos los contadores, consultando solo los invalidados"""
+        with self._lock:
+            faltantes = [c for c in CONTADORES if c not in self._valores]
+            versiones = dict(self._versiones)
+
+        if faltantes:
+            columnas = ", ".join(f"({CONTADORES[c][1]})" for c in faltantes)
+            fila = conn.execute(f"SELECT {columnas}").fetchone()
+
+            with self._lock:
+                for contador, valor in zip(faltantes, fila):
+                    tabla = CONTADORES[contador][0]
+                    # Si la tabla cambió mientras se consultaba, no cachear
+                    if self._versiones[tabla] == versiones.get(tabla, 0):
+                        self._valores[contador] = valor
+                resultado = {**self._valores, **dict(zip(faltantes, fila))}
+        else:
+            with self._lock:
+                resultado = dict(self._valores)
+
+        return {c: resultado[c] for c in CONTADORES}
+
+    def version(self, tabla):
+        """Contador de escrituras confirmadas sobre la tabla en este proceso"""
+        with self._lock:
+            return self._versiones.get(tabla, 0)
+
+    def invalidar(self, *tablas):
+        """Descarta los contadores que dependen de las tablas indicadas"""
+        with self._lock:
+            for tabla in tablas:
+                self._versiones[tabla] += 1
+                for contador, (tabla_contador, _) in CONTADORES.items():
+                    if tabla_contador == tabla:
+                        self._valores.pop(contador, None)
+
+    def vaciar(self):
+        """Descarta todos los contadores (otra conexión confirmó cambios que no se conocen)"""
+        with self._lock:
+            for tabla in {tabla for tabla, _ in CONTADORES.values()}:
+                self._versiones[tabla] += 1
+            self._valores.clear()
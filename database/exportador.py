@@ -0,0 +1,118 @@
+"""Exportación de reservas y huéspedes para contabilidad (CSV o JSON Lines).
+
+Las filas se leen de a bloques (DatabaseManager.iterar_reservas /
+iterar_huespedes) y se escriben a medida que llegan: exportar años de
+historial usa la misma memoria que exportar un mes.
+
+Uso:
+    python -m database.exportador {reservas,huespedes} archivo [--desde AAAA-MM-DD]
+                                  [--hasta AAAA-MM-DD] [--estado activa] [--formato csv|jsonl]
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from operator import attrgetter
+
+from database.db_manager import DatabaseManager
+from utils import validaciones
+from utils.constantes import ESTADOS_RESERVA
+
+FORMATOS = ("csv", "jsonl")
+
+# Columnas exportadas por tipo (la contraseña de los huéspedes no sale)
+COLUMNAS = {
+    "reservas": ("id", "huesped_id", "huesped", "habitacion_id", "habitacion", "tipo",
+                 "fecha_entrada", "fecha_salida", "estado", "total"),
+    "huespedes": ("id", "nombre", "apellido", "telefono", "email"),
+}
+
+# Cada cuántas filas se llama a al_avanzar
+_AVISO_CADA = 5000
+
+
+def _filas(db, tipo, desde, hasta, estado, tamano_bloque):
+    if tipo == "reservas":
+        return db.iterar_reservas(desde, hasta, estado, tamano_bloque)
+    return db.iterar_huespedes(tamano_bloque)
+
+
+def exportar(db, tipo, ruta, formato=None, desde=None, hasta=None, estado=None,
+             tamano_bloque=1000, al_avanzar=None):
+    """Escribe las filas de `tipo` en `ruta` y devuelve cuántas exportó.
+
+    formato se deduce de la extensión si no se indica. desde/hasta (fecha de
+    entrada) y estado solo aplican a reservas. al_avanzar(filas) se llama
+    cada algunas miles de filas desde el mismo hilo que exporta.
+    """
+    if tipo not in COLUMNAS:
+        raise ValueError(f"Tipo desconocido: {tipo!r}. Opciones: {', '.join(COLUMNAS)}")
+
+    formato = formato or os.path.splitext(ruta)[1].lstrip(".").lower()
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no soportado: {formato!r} ({' o '.join(FORMATOS)})")
+
+    if desde:
+        desde = validaciones.fecha(desde, "desde")
+    if hasta:
+        hasta = validaciones.fecha(hasta, "hasta")
+    if estado:
+        estado = validaciones.opcion(estado, "estado", ESTADOS_RESERVA)
+
+    columnas = COLUMNAS[tipo]
+    valores = attrgetter(*columnas)
+    total = 0
+
+    # Se escribe en un temporal y se renombra al final: un error a mitad de
+    # camino no deja un archivo incompleto con el nombre pedido
+    temporal = ruta + ".parcial"
+    try:
+        with open(temporal, "w", newline="", encoding="utf-8") as archivo:
+            if formato == "csv":
+                escritor = csv.writer(archivo)
+                escritor.writerow(columnas)
+                escribir = lambda fila: escritor.writerow(valores(fila))
+            else:
+                escribir = lambda fila: archivo.write(
+                    json.dumps(dict(zip(columnas, valores(fila))), ensure_ascii=False) + "\n")
+
+            for fila in _filas(db, tipo, desde, hasta, estado, tamano_bloque):
+                escribir(fila)
+                total += 1
+                if al_avanzar is not None and total % _AVISO_CADA == 0:
+                    al_avanzar(total)
+
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+
+    return total
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Exportación de reservas y huéspedes")
+    parser.add_argument("tipo", choices=list(COLUMNAS))
+    parser.add_argument("archivo")
+    parser.add_argument("--formato", choices=FORMATOS)
+    parser.add_argument("--desde", help="fecha de entrada mínima (AAAA-MM-DD)")
+    parser.add_argument("--hasta", help="fecha de entrada máxima (AAAA-MM-DD)")
+    parser.add_argument("--estado", choices=ESTADOS_RESERVA)
+    parser.add_argument("--db", default="hotel.db", help="base de datos (relativa a la carpeta database)")
+    args = parser.parse_args(argumentos)
+
+    db = DatabaseManager(args.db)
+    try:
+        filas = exportar(db, args.tipo, args.archivo, args.formato, args.desde, args.hasta, args.estado,
+                         al_avanzar=lambda n: print(f"  {n} filas...", end="\r", file=sys.stderr))
+    finally:
+        db.cerrar()
+
+    print(f"{args.tipo}: {filas} filas exportadas a {args.archivo}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
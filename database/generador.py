@@ -0,0 +1,192 @@
+"""Datos sintéticos de un hotel a escala: habitaciones, huéspedes, empleados y
+años de reservas con temporadas.
+
+Todo sale de random.Random(semilla): la misma semilla y la misma fecha `hoy`
+generan exactamente las mismas filas, así dos corridas de benchmarks miden
+la misma base.
+
+Las reservas se generan habitación por habitación avanzando día a día: cada
+día libre hay una probabilidad de que entre alguien, que depende del tipo de
+habitación, del mes (temporada alta en verano y diciembre) y del día de la
+semana. Las estadías son más largas en temporada alta. Las reservas que ya
+terminaron quedan finalizadas, las que siguen o empiezan después de `hoy`
+activas, y una parte de todas ellas canceladas (sin ocupar la habitación).
+
+Uso:
+    python -m database.generador archivo.db [--habitaciones 200] [--huespedes 20000]
+                                 [--anios 3] [--semilla 1]
+"""
+import argparse
+import sys
+import unicodedata
+from datetime import date, timedelta
+from random import Random
+
+from database.db_manager import DatabaseManager
+
+# Tipo: (precio base por noche, probabilidad base de entrada en un día libre)
+TIPOS = {
+    "Sencilla": (650.0, 0.42),
+    "Doble": (950.0, 0.38),
+    "Familiar": (1400.0, 0.30),
+    "Deluxe": (2300.0, 0.22),
+}
+# Proporción de cada tipo en el hotel
+PROPORCION_TIPOS = (0.35, 0.35, 0.18, 0.12)
+
+# Demanda por mes (enero = índice 0): verano y fin de año altos, otoño bajo
+TEMPORADA = (0.75, 0.70, 0.85, 1.05, 0.90, 1.15, 1.45, 1.50, 0.85, 0.70, 0.75, 1.35)
+# Demanda por día de la semana (lunes = 0): más entradas jueves a sábado
+SEMANA = (0.80, 0.80, 0.90, 1.10, 1.35, 1.40, 0.85)
+
+# Noches de estadía (1 a 7) en temporada normal y alta
+NOCHES = (1, 2, 3, 4, 5, 6, 7)
+PESOS_NOCHES = (30, 28, 18, 10, 6, 4, 4)
+PESOS_NOCHES_ALTA = (14, 20, 20, 16, 12, 8, 10)
+
+PROBABILIDAD_CANCELACION = 0.07
+# Días hacia adelante con reservas ya tomadas
+HORIZONTE_FUTURO = 180
+
+NOMBRES = ("María", "José", "Juan", "Ana", "Luis", "Carmen", "Carlos", "Laura", "Jorge", "Sofía",
+           "Miguel", "Lucía", "Pedro", "Elena", "Andrés", "Paula", "Diego", "Marta", "Javier",
+           "Isabel", "Fernando", "Valeria", "Ricardo", "Daniela", "Alejandro", "Gabriela")
+APELLIDOS = ("García", "Rodríguez", "González", "Fernández", "López", "Martínez", "Sánchez",
+             "Pérez", "Gómez", "Martín", "Jiménez", "Ruiz", "Hernández", "Díaz", "Moreno",
+             "Álvarez", "Romero", "Navarro", "Torres", "Domínguez", "Vázquez", "Ramos", "Gil",
+             "Serrano", "Molina", "Castro", "Ortiz", "Rubio", "Núñez", "Medina", "Herrera")
+PUESTOS = ("Recepcionista", "Recepcionista", "Camarista", "Camarista", "Mantenimiento", "Gerente")
+
+# Habitaciones por piso; la numeración empieza en el piso 3 (101-204 son las de prueba)
+_POR_PISO = 40
+_PRIMER_PISO = 3
+
+
+def _sin_acentos(texto):
+    return unicodedata.normalize("NFKD", texto).encode("ascii", "ignore").decode().lower()
+
+
+def generar(db, habitaciones=200, huespedes=20000, anios=3, semilla=1, hoy=None, empleados=12):
+    """Agrega al hotel de `db` los datos sintéticos y devuelve cuántas filas insertó por tabla.
+
+    Las reservas cubren los `anios` años anteriores a `hoy` (por defecto la
+    fecha actual) y HORIZONTE_FUTURO días hacia adelante.
+    """
+    rng = Random(semilla)
+    hoy = date.fromisoformat(str(hoy)) if hoy else date.today()
+    inicio = hoy - timedelta(days=365 * anios)
+    fin = hoy + timedelta(days=HORIZONTE_FUTURO)
+
+    with db.transaccion(inmediata=True) as cursor:
+        primer_huesped = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM huespedes").fetchone()[0] + 1
+        primer_empleado = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM empleados").fetchone()[0] + 1
+
+        # Habitaciones
+        tipos = rng.choices(list(TIPOS), weights=PROPORCION_TIPOS, k=habitaciones)
+        numeros = [str(100 * (_PRIMER_PISO + i // _POR_PISO) + 1 + i % _POR_PISO) for i in range(habitaciones)]
+        cursor.executemany(
+            "INSERT INTO habitaciones (numero, tipo, precio, estado) VALUES (?, ?, ?, 'disponible')",
+            [(numero, tipo, TIPOS[tipo][0]) for numero, tipo in zip(numeros, tipos)]
+        )
+        ids = [fila[0] for fila in cursor.execute(
+            f"SELECT id FROM habitaciones WHERE numero IN ({','.join('?' * len(numeros))}) ORDER BY id",
+            numeros)] if numeros else []
+
+        # Huéspedes (teléfono único a partir del id que les tocará)
+        filas_huespedes = []
+        for i in range(primer_huesped, primer_huesped + huespedes):
+            nombre, apellido = rng.choice(NOMBRES), rng.choice(APELLIDOS)
+            filas_huespedes.append((nombre, apellido, f"55{i:08d}",
+                                    f"{_sin_acentos(nombre)}.{_sin_acentos(apellido)}{i}@correo.com", "1234"))
+        cursor.executemany(
+            "INSERT INTO huespedes (nombre, apellido, telefono, email, password) VALUES (?, ?, ?, ?, ?)",
+            filas_huespedes
+        )
+
+        cursor.executemany(
+            "INSERT INTO empleados (nombre, apellido, puesto, telefono, usuario, password, privilegio) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(rng.choice(NOMBRES), rng.choice(APELLIDOS), puesto, f"44{i:08d}", f"usuario{i}", "1234",
+              "Administrador" if puesto == "Gerente" else "Empleado")
+             for i, puesto in zip(range(primer_empleado, primer_empleado + empleados),
+                                  (rng.choice(PUESTOS) for _ in range(empleados)))]
+        )
+
+        # Reservas
+        reservas = []
+        ocupadas = []
+        for habitacion_id, tipo in zip(ids, tipos):
+            precio, base = TIPOS[tipo]
+            dia = inicio
+            while dia < fin:
+                demanda = base * TEMPORADA[dia.month - 1] * SEMANA[dia.weekday()]
+                if huespedes == 0 or rng.random() >= demanda:
+                    dia += timedelta(days=1)
+                    continue
+
+                alta = TEMPORADA[dia.month - 1] > 1.1
+                noches = rng.choices(NOCHES, weights=PESOS_NOCHES_ALTA if alta else PESOS_NOCHES)[0]
+                salida = dia + timedelta(days=noches)
+                tarifa = precio * (1.2 if alta else 1.0)
+                # Huéspedes frecuentes: los primeros ids reservan más seguido
+                huesped_id = primer_huesped + int(huespedes * rng.random() ** 2)
+
+                if rng.random() < PROBABILIDAD_CANCELACION:
+                    # La cancelada no ocupa la habitación: el día sigue libre
+                    reservas.append((huesped_id, habitacion_id, dia.isoformat(), salida.isoformat(),
+                                     'cancelada', round(tarifa * noches, 2)))
+                    dia += timedelta(days=1)
+                    continue
+
+                estado = 'finalizada' if salida <= hoy else 'activa'
+                if dia <= hoy < salida:
+                    ocupadas.append(habitacion_id)
+                reservas.append((huesped_id, habitacion_id, dia.isoformat(), salida.isoformat(),
+                                 estado, round(tarifa * noches, 2)))
+                dia = salida
+
+        # En el orden en que entran, como si se hubieran cargado con el tiempo
+        reservas.sort(key=lambda r: r[2])
+        cursor.executemany(
+            "INSERT INTO reservaciones (huesped_id, habitacion_id, fecha_entrada, fecha_salida, estado, total) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            reservas
+        )
+        cursor.executemany("UPDATE habitaciones SET estado = 'ocupada' WHERE id = ?",
+                           [(h,) for h in ocupadas])
+
+        db._modificado('habitaciones')
+        db._modificado('huespedes')
+        db._modificado('empleados')
+        db._modificado('reservaciones')
+
+    return {
+        "habitaciones": len(ids),
+        "huespedes": huespedes,
+        "empleados": empleados,
+        "reservaciones": len(reservas),
+    }
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Genera un hotel con datos sintéticos")
+    parser.add_argument("db", help="base de datos (relativa a la carpeta database)")
+    parser.add_argument("--habitaciones", type=int, default=200)
+    parser.add_argument("--huespedes", type=int, default=20000)
+    parser.add_argument("--anios", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=1)
+    parser.add_argument("--hoy", help="fecha de referencia (AAAA-MM-DD); por defecto la actual")
+    args = parser.parse_args(argumentos)
+
+    db = DatabaseManager(args.db)
+    try:
+        filas = generar(db, args.habitaciones, args.huespedes, args.anios, args.semilla, args.hoy)
+    finally:
+        db.cerrar()
+
+    print(", ".join(f"{tabla}: {n}" for tabla, n in filas.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
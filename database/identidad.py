@@ -0,0 +1,71 @@
+# database/identidad.py
+import threading
+from collections import OrderedDict
+
+
+class MapaIdentidad:
+    """Caché de filas por clave primaria, compartida por las conexiones del proceso.
+
+    Las claves son (tabla, id). Una fila puede depender de otras (una reserva
+    con el nombre del huésped depende de esa fila de huespedes): al invalidar
+    una fila se descartan también las que dependen de ella. Con más de
+    `maximo` filas se descarta la usada hace más tiempo.
+
+    Las escrituras de otros procesos no pasan por invalidar(): cada
+    DatabaseManager vacía el mapa cuando ve cambiar PRAGMA data_version
+    (ver DatabaseManager._descartar_cambios_externos).
+    """
+
+    def __init__(self, maximo=2000):
+        self.maximo = maximo
+        self._lock = threading.Lock()
+        self._filas = OrderedDict()   # clave -> fila
+        self._dependientes = {}       # clave -> claves que dependen de ella
+        # Cambia con cada invalidación: una lectura que se cruzó con una
+        # escritura no se guarda
+        self._generacion = 0
+
+    def obtener(self, clave, cargar, depende_de=None):
+        """Devuelve la fila de `clave`, usando cargar() si no está en caché.
+
+        depende_de(fila) devuelve las claves de otras filas cuyos cambios
+        también invalidan esta. Los resultados None no se guardan.
+        """
+        with self._lock:
+            if clave in self._filas:
+                self._filas.move_to_end(clave)
+                return self._filas[clave]
+            generacion = self._generacion
+
+        fila = cargar()
+        if fila is None:
+            return None
+
+        with self._lock:
+            if generacion == self._generacion:
+                self._filas[clave] = fila
+                for dependencia in (depende_de(fila) if depende_de else ()):
+                    self._dependientes.setdefault(dependencia, set()).add(clave)
+                self._recortar()
+        return fila
+
+    def invalidar(self, claves):
+        """Descarta las filas indicadas y las que dependen de ellas"""
+        with self._lock:
+            self._generacion += 1
+            pendientes = list(claves)
+            while pendientes:
+                clave = pendientes.pop()
+                self._filas.pop(clave, None)
+                pendientes.extend(self._dependientes.pop(clave, ()))
+
+    def vaciar(self):
+        """Descarta todas las filas (otra terminal confirmó cambios que no se conocen)"""
+        with self._lock:
+            self._generacion += 1
+            self._filas.clear()
+            self._dependientes.clear()
+
+    def _recortar(self):
+        while len(self._filas) > self.maximo:
+            self._filas.popitem(last=False)
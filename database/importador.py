@@ -0,0 +1,339 @@
+"""Importación masiva de habitaciones, huéspedes y reservas desde CSV o JSON.
+
+Lee el archivo por partes (CSV y JSON Lines fila a fila; un .json con una
+lista se carga entero), valida cada fila con utils.validaciones e inserta las
+válidas con executemany, un lote por transacción. Las filas rechazadas se
+informan con su número de línea y el motivo, y no detienen la importación.
+
+Columnas (encabezados del CSV o claves del JSON):
+    habitaciones  numero, tipo, precio, estado (opcional)
+    huespedes     nombre, apellido, telefono, email (opcional)
+    reservas      habitacion (número) o habitacion_id,
+                  huesped_telefono o huesped_id,
+                  fecha_entrada, fecha_salida, total (opcional: noches x precio),
+                  estado (opcional)
+
+Uso:
+    python -m database.importador {habitaciones,huespedes,reservas} archivo [--lote N] [--rechazos rechazos.csv]
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import islice
+from typing import List
+
+from database.db_manager import DatabaseManager
+from utils import validaciones
+
+TAMANO_LOTE = 2000
+# SQLite admite como mínimo 999 parámetros por sentencia
+_MAXIMO_PARAMETROS = 900
+
+
+@dataclass
+class Rechazo:
+    linea: int
+    motivo: str
+    datos: dict
+
+
+@dataclass
+class ResultadoImportacion:
+    tipo: str
+    leidas: int = 0
+    insertadas: int = 0
+    rechazos: List[Rechazo] = field(default_factory=list)
+    segundos: float = 0.0
+
+    @property
+    def filas_por_minuto(self):
+        return self.leidas * 60 / self.segundos if self.segundos else 0.0
+
+    def resumen(self):
+        return (f"{self.tipo}: {self.leidas} filas leídas, {self.insertadas} insertadas, "
+                f"{len(self.rechazos)} rechazadas en {self.segundos:.1f} s "
+                f"({self.filas_por_minuto:,.0f} filas/min)")
+
+
+# ==================== Lectura ====================
+
+def leer_filas(ruta, formato=None):
+    """Genera (número de línea, dict) desde un CSV, JSON Lines o JSON"""
+    formato = formato or os.path.splitext(ruta)[1].lstrip(".").lower()
+
+    if formato == "csv":
+        with open(ruta, newline="", encoding="utf-8-sig") as archivo:
+            lector = csv.DictReader(archivo)
+            for fila in lector:
+                yield lector.line_num, fila
+
+    elif formato in ("jsonl", "ndjson"):
+        with open(ruta, encoding="utf-8") as archivo:
+            for linea, texto in enumerate(archivo, start=1):
+                if texto.strip():
+                    yield linea, json.loads(texto)
+
+    elif formato == "json":
+        with open(ruta, encoding="utf-8") as archivo:
+            datos = json.load(archivo)
+        # Una lista de objetos, o un objeto con una lista (ej. {"reservas": [...]})
+        if isinstance(datos, dict):
+            datos = next((v for v in datos.values() if isinstance(v, list)), [])
+        for posicion, fila in enumerate(datos, start=1):
+            yield posicion, fila
+
+    else:
+        raise ValueError(f"Formato no soportado: {formato!r} (csv, jsonl o json)")
+
+
+def _lotes(filas, tamano):
+    filas = iter(filas)
+    while True:
+        lote = list(islice(filas, tamano))
+        if not lote:
+            return
+        yield lote
+
+
+def _en_partes(valores):
+    valores = list(valores)
+    for inicio in range(0, len(valores), _MAXIMO_PARAMETROS):
+        yield valores[inicio:inicio + _MAXIMO_PARAMETROS]
+
+
+def _buscar(lote, consulta, valores):
+    """Ejecuta `consulta` (con {} para la lista IN) por partes y junta las filas"""
+    filas = []
+    for parte in _en_partes(set(valores)):
+        marcadores = ", ".join("?" * len(parte))
+        filas.extend(lote.consultar(consulta.format(marcadores), parte))
+    return filas
+
+
+# ==================== Importadores por tabla ====================
+
+class _ImportadorHabitaciones:
+    tabla = "habitaciones"
+
+    validar = staticmethod(validaciones.validar_habitacion)
+
+    def insertar_lote(self, lote, validas):
+        """Inserta las filas válidas (dentro de DatabaseManager.escribir_lote); devuelve (insertadas, rechazos)"""
+        vistos = {fila[0] for fila in _buscar(
+            lote, "SELECT numero FROM habitaciones WHERE numero IN ({})",
+            (valores[0] for _, valores, _ in validas))}
+
+        filas, rechazos = [], []
+        for linea, valores, datos in validas:
+            if valores[0] in vistos:
+                rechazos.append(Rechazo(linea, f"La habitación {valores[0]} ya existe", datos))
+                continue
+            vistos.add(valores[0])
+            filas.append(valores)
+
+        lote.ejecutar_muchos(
+            'habitaciones', "INSERT INTO habitaciones (numero, tipo, precio, estado) VALUES (?, ?, ?, ?)", filas)
+        return len(filas), rechazos
+
+
+class _ImportadorHuespedes:
+    tabla = "huespedes"
+
+    validar = staticmethod(validaciones.validar_huesped)
+
+    def insertar_lote(self, lote, validas):
+        """Inserta las filas válidas (dentro de DatabaseManager.escribir_lote); devuelve (insertadas, rechazos)"""
+        vistos = {fila[0] for fila in _buscar(
+            lote, "SELECT telefono FROM huespedes WHERE telefono IN ({})",
+            (valores[2] for _, valores, _ in validas))}
+
+        filas, rechazos = [], []
+        for linea, valores, datos in validas:
+            if valores[2] in vistos:
+                rechazos.append(Rechazo(linea, f"Ya hay un huésped con el teléfono {valores[2]}", datos))
+                continue
+            vistos.add(valores[2])
+            filas.append(valores)
+
+        # Los triggers de huespedes_fts mantienen el índice de búsqueda
+        lote.ejecutar_muchos(
+            'huespedes', "INSERT INTO huespedes (nombre, apellido, telefono, email) VALUES (?, ?, ?, ?)", filas)
+        return len(filas), rechazos
+
+
+class _ImportadorReservas:
+    tabla = "reservas"
+
+    @staticmethod
+    def validar(datos):
+        entrada, salida, total, estado = validaciones.validar_reserva(datos)
+
+        if validaciones.opcional(datos.get("habitacion_id")):
+            habitacion = ("id", validaciones.entero(datos.get("habitacion_id"), "habitacion_id"))
+        else:
+            habitacion = ("numero", validaciones.requerido(datos.get("habitacion"), "habitacion"))
+
+        if validaciones.opcional(datos.get("huesped_id")):
+            huesped = ("id", validaciones.entero(datos.get("huesped_id"), "huesped_id"))
+        else:
+            huesped = ("telefono", validaciones.requerido(datos.get("huesped_telefono"), "huesped_telefono"))
+
+        return habitacion, huesped, entrada, salida, total, estado
+
+    def insertar_lote(self, lote, validas):
+        """Inserta las filas válidas (dentro de DatabaseManager.escribir_lote); devuelve (insertadas, rechazos)"""
+        # Las habitaciones son pocas: se cargan todas una vez por lote
+        habitaciones = {}
+        for id, numero, precio in lote.consultar("SELECT id, numero, precio FROM habitaciones"):
+            habitaciones[("id", id)] = habitaciones[("numero", numero)] = (id, precio)
+
+        huespedes = {("telefono", tel): id for id, tel in _buscar(
+            lote, "SELECT id, telefono FROM huespedes WHERE telefono IN ({})",
+            (v[1][1] for _, v, _ in validas if v[1][0] == "telefono"))}
+        huespedes.update({("id", id): id for (id,) in _buscar(
+            lote, "SELECT id FROM huespedes WHERE id IN ({})",
+            (v[1][1] for _, v, _ in validas if v[1][0] == "id"))})
+
+        hoy = date.today().isoformat()
+        filas, rechazos, ocupadas = [], [], set()
+        rangos_lote = {}  # habitacion_id -> [(entrada, salida)] de las activas de este lote
+
+        for linea, (habitacion, huesped, entrada, salida, total, estado), datos in validas:
+            if habitacion not in habitaciones:
+                rechazos.append(Rechazo(linea, f"No existe la habitación {habitacion[1]}", datos))
+                continue
+            if huesped not in huespedes:
+                rechazos.append(Rechazo(linea, f"No existe el huésped {huesped[1]}", datos))
+                continue
+
+            habitacion_id, precio = habitaciones[habitacion]
+
+            if estado == 'activa':
+                rangos = rangos_lote.setdefault(habitacion_id, [])
+                solapa_lote = any(e < salida and entrada < s for e, s in rangos)
+                if solapa_lote or lote.hay_solapamiento(habitacion_id, entrada, salida):
+                    rechazos.append(Rechazo(
+                        linea, f"La habitación {habitacion[1]} ya está reservada entre {entrada} y {salida}", datos))
+                    continue
+                rangos.append((entrada, salida))
+                if entrada <= hoy < salida:
+                    ocupadas.add(habitacion_id)
+
+            if total is None:
+                total = date.fromisoformat(salida).toordinal() - date.fromisoformat(entrada).toordinal()
+                total *= precio
+
+            filas.append((huespedes[huesped], habitacion_id, entrada, salida, total, estado))
+
+        # La matriz de ocupación se actualiza solo en las habitaciones del lote
+        lote.ejecutar_muchos(
+            'reservaciones',
+            "INSERT INTO reservaciones (huesped_id, habitacion_id, fecha_entrada, fecha_salida, total, estado) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            filas,
+            rangos=[(h, entrada, salida) for _, h, entrada, salida, _, estado in filas if estado != 'cancelada']
+        )
+
+        # Igual que agregar_reserva: se ocupan las habitaciones con estadía en curso
+        if ocupadas:
+            lote.ejecutar_muchos('habitaciones', "UPDATE habitaciones SET estado = 'ocupada' WHERE id = ?",
+                                 [(id,) for id in ocupadas], ids=ocupadas)
+
+        return len(filas), rechazos
+
+
+IMPORTADORES = {
+    "habitaciones": _ImportadorHabitaciones,
+    "huespedes": _ImportadorHuespedes,
+    "reservas": _ImportadorReservas,
+}
+
+
+# ==================== API ====================
+
+def importar(db, tipo, ruta, formato=None, tamano_lote=TAMANO_LOTE, al_avanzar=None):
+    """Importa el archivo en la tabla `tipo` y devuelve un ResultadoImportacion.
+
+    Cada lote se inserta en su propia transacción BEGIN IMMEDIATE (con
+    reintento si otra terminal tiene la base bloqueada). al_avanzar(resultado)
+    se llama después de cada lote.
+    """
+    if tipo not in IMPORTADORES:
+        raise ValueError(f"Tipo desconocido: {tipo!r}. Opciones: {', '.join(IMPORTADORES)}")
+
+    importador = IMPORTADORES[tipo]()
+    resultado = ResultadoImportacion(tipo)
+    inicio = time.perf_counter()
+
+    for lote in _lotes(leer_filas(ruta, formato), tamano_lote):
+        resultado.leidas += len(lote)
+
+        validas = []
+        for linea, datos in lote:
+            try:
+                if not isinstance(datos, dict):
+                    raise ValueError("La fila no es un objeto con columnas")
+                validas.append((linea, importador.validar(datos), datos))
+            except ValueError as e:
+                resultado.rechazos.append(Rechazo(linea, str(e), datos))
+
+        if validas:
+            insertadas, rechazos = db.escribir_lote(importador.insertar_lote, validas)
+            resultado.insertadas += insertadas
+            resultado.rechazos.extend(rechazos)
+
+        resultado.segundos = time.perf_counter() - inicio
+        if al_avanzar is not None:
+            al_avanzar(resultado)
+
+    resultado.segundos = time.perf_counter() - inicio
+    resultado.rechazos.sort(key=lambda rechazo: rechazo.linea)
+    return resultado
+
+
+def guardar_rechazos(resultado, ruta):
+    """Escribe los rechazos en un CSV (linea, motivo, datos en JSON)"""
+    with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(["linea", "motivo", "datos"])
+        for rechazo in resultado.rechazos:
+            escritor.writerow([rechazo.linea, rechazo.motivo, json.dumps(rechazo.datos, ensure_ascii=False)])
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Importación masiva a hotel.db")
+    parser.add_argument("tipo", choices=list(IMPORTADORES))
+    parser.add_argument("archivo")
+    parser.add_argument("--formato", choices=["csv", "jsonl", "json"])
+    parser.add_argument("--lote", type=int, default=TAMANO_LOTE)
+    parser.add_argument("--rechazos", help="CSV donde guardar las filas rechazadas")
+    parser.add_argument("--db", default="hotel.db", help="base de datos (relativa a la carpeta database)")
+    args = parser.parse_args(argumentos)
+
+    db = DatabaseManager(args.db)
+    try:
+        resultado = importar(
+            db, args.tipo, args.archivo, args.formato, args.lote,
+            al_avanzar=lambda r: print(f"  {r.leidas} filas...", end="\r", file=sys.stderr)
+        )
+    finally:
+        db.cerrar()
+
+    print(resultado.resumen())
+    for rechazo in resultado.rechazos[:20]:
+        print(f"  línea {rechazo.linea}: {rechazo.motivo}")
+    if len(resultado.rechazos) > 20:
+        print(f"  ... y {len(resultado.rechazos) - 20} más")
+
+    if args.rechazos:
+        guardar_rechazos(resultado, args.rechazos)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
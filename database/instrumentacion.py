@@ -0,0 +1,294 @@
+# database/instrumentacion.py
+import bisect
+import functools
+import json
+import logging
+import logging.handlers
+import os
+import re
+import threading
+import time
+import types
+from datetime import datetime
+
+# Variable de entorno con el umbral de consulta lenta en milisegundos
+VARIABLE_UMBRAL = "HOTEL_CONSULTA_LENTA_MS"
+UMBRAL_POR_DEFECTO_MS = 100
+
+# Límite superior (ms) de cada intervalo del histograma; lo que supera el último va aparte
+LIMITES_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000)
+
+# Registro rotativo: hasta COPIAS_LOG archivos de TAMANO_LOG bytes
+TAMANO_LOG = 1024 * 1024
+COPIAS_LOG = 3
+
+# Sentencias guardadas por llamada (un método que recorre miles de filas en
+# un bucle no debe llenar la memoria)
+MAXIMO_SENTENCIAS = 50
+
+# Métodos que no se miden (infraestructura, no operaciones del hotel)
+NO_MEDIDOS = {"transaccion", "crear_tablas", "insertar_datos_prueba", "cerrar", "version_tabla"}
+
+# Errores y consultas lentas van al logger "database" (y de ahí al archivo)
+logger = logging.getLogger("database")
+_logger_lentas = logging.getLogger("database.lentas")
+
+_LITERAL = re.compile(r"'(?:[^']|'')*'")
+
+# ruta -> [manejador, usos]: un manejador por archivo aunque haya varias
+# Instrumentacion en el proceso
+_manejadores = {}
+_lock_manejadores = threading.Lock()
+
+
+def _sin_valores(sql):
+    """SQL con los textos reemplazados por '?': no guardar contraseñas ni datos personales"""
+    return " ".join(_LITERAL.sub("?", sql).split())
+
+
+def _umbral_configurado():
+    try:
+        return float(os.environ.get(VARIABLE_UMBRAL, UMBRAL_POR_DEFECTO_MS))
+    except ValueError:
+        return UMBRAL_POR_DEFECTO_MS
+
+
+class _Metrica:
+    """Acumulados de un método"""
+    __slots__ = ("llamadas", "errores", "total", "maximo", "filas", "con_filas", "histograma")
+
+    def __init__(self):
+        self.llamadas = 0
+        self.errores = 0
+        self.total = 0.0
+        self.maximo = 0.0
+        self.filas = 0
+        self.con_filas = 0
+        self.histograma = [0] * (len(LIMITES_MS) + 1)
+
+    def percentil(self, fraccion):
+        """Límite superior (ms) del intervalo donde cae el percentil; None si pasa del último"""
+        objetivo = fraccion * self.llamadas
+        acumulado = 0
+        for limite, cantidad in zip(LIMITES_MS, self.histograma):
+            acumulado += cantidad
+            if acumulado >= objetivo:
+                return limite
+        return None
+
+
+class Instrumentacion:
+    """Tiempos, filas y errores por método de DatabaseManager, y registro de consultas lentas.
+
+    Se comparte entre todas las conexiones del proceso (ver GestorConexiones).
+    Cada método público de DatabaseManager queda envuelto (ver instrumentar()): la duración
+    incluye ejecutar, leer las filas y armar los modelos, que es lo que
+    espera la interfaz. Las sentencias se capturan con set_trace_callback;
+    si la llamada supera umbral_ms se escribe en el registro rotativo con
+    cada sentencia y su tiempo aproximado (hasta la siguiente sentencia).
+    """
+
+    def __init__(self, ruta_log=None, umbral_ms=None, activa=True):
+        self.ruta_log = ruta_log
+        self.umbral_ms = _umbral_configurado() if umbral_ms is None else umbral_ms
+        self.activa = activa
+        self.desde = datetime.now()
+        self._lock = threading.Lock()
+        self._metricas = {}
+        if ruta_log:
+            _agregar_manejador(ruta_log)
+
+    def registrar(self, metodo, segundos, filas=None, error=None, sentencias=()):
+        """Suma una llamada a las métricas del método y la registra si fue lenta"""
+        ms = segundos * 1000
+        with self._lock:
+            metrica = self._metricas.get(metodo)
+            if metrica is None:
+                metrica = self._metricas[metodo] = _Metrica()
+            metrica.llamadas += 1
+            metrica.total += ms
+            metrica.maximo = max(metrica.maximo, ms)
+            metrica.histograma[bisect.bisect_left(LIMITES_MS, ms)] += 1
+            if error is not None:
+                metrica.errores += 1
+            if filas is not None:
+                metrica.filas += filas
+                metrica.con_filas += 1
+
+        if ms >= self.umbral_ms:
+            detalle = "".join(f"\n    {duracion:9.2f} ms  {_sin_valores(sql)}" for sql, duracion in sentencias)
+            _logger_lentas.warning("%s: %.1f ms%s%s", metodo, ms,
+                                   f" ({filas} filas)" if filas is not None else "", detalle)
+
+    def resumen(self):
+        """Métricas por método ordenadas por tiempo total: {metodo: {...}}"""
+        with self._lock:
+            metricas = sorted(self._metricas.items(), key=lambda item: item[1].total, reverse=True)
+            return {
+                metodo: {
+                    "llamadas": m.llamadas,
+                    "errores": m.errores,
+                    "total_ms": round(m.total, 3),
+                    "media_ms": round(m.total / m.llamadas, 3),
+                    "maximo_ms": round(m.maximo, 3),
+                    "p50_ms": m.percentil(0.5),
+                    "p95_ms": m.percentil(0.95),
+                    "filas": m.filas,
+                    "filas_por_llamada": round(m.filas / m.con_filas, 1) if m.con_filas else None,
+                    "histograma": {
+                        **{f"<={limite}ms": n for limite, n in zip(LIMITES_MS, m.histograma)},
+                        f">{LIMITES_MS[-1]}ms": m.histograma[-1],
+                    },
+                }
+                for metodo, m in metricas
+            }
+
+    def volcar(self, ruta=None):
+        """Escribe el resumen en un JSON y devuelve la ruta (por defecto junto al registro)"""
+        ahora = datetime.now()
+        if ruta is None:
+            base = os.path.splitext(self.ruta_log)[0] if self.ruta_log else "metricas"
+            ruta = f"{base}-metricas-{ahora:%Y%m%d-%H%M%S}.json"
+
+        datos = {
+            "desde": self.desde.isoformat(timespec="seconds"),
+            "hasta": ahora.isoformat(timespec="seconds"),
+            "umbral_lenta_ms": self.umbral_ms,
+            "metodos": self.resumen(),
+        }
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(datos, archivo, ensure_ascii=False, indent=2)
+        return ruta
+
+    def cerrar(self):
+        """Deja de escribir en el registro (el archivo se cierra con el último que lo usa)"""
+        if self.ruta_log:
+            _quitar_manejador(self.ruta_log)
+            self.ruta_log = None
+
+    def reiniciar(self):
+        """Vuelve a cero las métricas"""
+        with self._lock:
+            self._metricas.clear()
+            self.desde = datetime.now()
+
+
+def _agregar_manejador(ruta):
+    with _lock_manejadores:
+        if ruta in _manejadores:
+            _manejadores[ruta][1] += 1
+            return
+        manejador = logging.handlers.RotatingFileHandler(
+            ruta, maxBytes=TAMANO_LOG, backupCount=COPIAS_LOG, encoding="utf-8", delay=True)
+        manejador.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+        logger.addHandler(manejador)
+        if logger.level == logging.NOTSET:
+            logger.setLevel(logging.INFO)
+        _manejadores[ruta] = [manejador, 1]
+
+
+def _quitar_manejador(ruta):
+    with _lock_manejadores:
+        entrada = _manejadores.get(ruta)
+        if entrada is None:
+            return
+        entrada[1] -= 1
+        if entrada[1] == 0:
+            del _manejadores[ruta]
+            logger.removeHandler(entrada[0])
+            entrada[0].close()
+
+
+# ==================== Captura por conexión ====================
+
+class Captura:
+    """Sentencias que ejecuta una conexión mientras hay un método medido en curso.
+
+    Una por DatabaseManager (cada conexión se usa desde un solo hilo). Los
+    métodos anidados (agregar_reserva -> cambiar_estado_habitacion) comparten
+    la lista: cada uno toma las sentencias desde su propio inicio.
+    """
+
+    def __init__(self, conn):
+        self.nivel = 0
+        self.sentencias = []  # (sql, instante)
+        conn.set_trace_callback(self._anotar)
+
+    def _anotar(self, sql):
+        if self.nivel and len(self.sentencias) < MAXIMO_SENTENCIAS:
+            self.sentencias.append((sql, time.perf_counter()))
+
+    def desde(self, inicio, fin):
+        """Sentencias desde la posición inicio con su duración aproximada en ms"""
+        tramo = self.sentencias[inicio:]
+        instantes = [t for _, t in tramo[1:]] + [fin]
+        return [(sql, (siguiente - t) * 1000) for (sql, t), siguiente in zip(tramo, instantes)]
+
+
+def _contar(resultado):
+    if isinstance(resultado, list):
+        return len(resultado)
+    return None
+
+
+def _medir_generador(db, nombre, generador):
+    """Mide un método generador (iterar_*) hasta que se termina de recorrer"""
+    instrumentacion = db.instrumentacion
+    filas = 0
+    inicio = time.perf_counter()
+    error = None
+    try:
+        for fila in generador:
+            filas += 1
+            yield fila
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        # Las sentencias del generador no se capturan: corre intercalado con otras llamadas
+        instrumentacion.registrar(nombre, time.perf_counter() - inicio, filas, error)
+
+
+def _medido(nombre, metodo):
+    @functools.wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        instrumentacion = self.instrumentacion
+        if instrumentacion is None or not instrumentacion.activa:
+            return metodo(self, *args, **kwargs)
+
+        captura = self._captura
+        captura.nivel += 1
+        posicion = len(captura.sentencias)
+        inicio = time.perf_counter()
+        try:
+            resultado = metodo(self, *args, **kwargs)
+        except Exception as e:
+            fin = time.perf_counter()
+            instrumentacion.registrar(nombre, fin - inicio, error=e, sentencias=captura.desde(posicion, fin))
+            raise
+        else:
+            fin = time.perf_counter()
+            # El detalle de sentencias solo hace falta para el registro de lentas
+            lenta = (fin - inicio) * 1000 >= instrumentacion.umbral_ms
+            sentencias = captura.desde(posicion, fin) if lenta else ()
+        finally:
+            captura.nivel -= 1
+            if captura.nivel == 0:
+                captura.sentencias = []
+
+        if isinstance(resultado, types.GeneratorType):
+            return _medir_generador(self, nombre, resultado)
+
+        instrumentacion.registrar(nombre, fin - inicio, _contar(resultado), sentencias=sentencias)
+        return resultado
+
+    return envoltura
+
+
+def instrumentar(clase):
+    """Envuelve los métodos públicos de la clase con la medición (decorador de clase)"""
+    for nombre, valor in list(vars(clase).items()):
+        if nombre.startswith("_") or nombre in NO_MEDIDOS or not isinstance(valor, types.FunctionType):
+            continue
+        setattr(clase, nombre, _medido(nombre, valor))
+    return clase
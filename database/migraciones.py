@@ -0,0 +1,139 @@
+# Migraciones versionadas del esquema.
+# La versión aplicada se guarda en PRAGMA user_version; cada migración se
+# ejecuta una sola vez y en orden.
+import sqlite3
+
+
+def fts5_disponible(conn):
+    """Indica si el SQLite enlazado incluye el módulo FTS5"""
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp._prueba_fts5 USING fts5(x)")
+        conn.execute("DROP TABLE temp._prueba_fts5")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+MIGRACIONES = [
+    (1, "Índices para reservas, disponibilidad y estadísticas", [
+        # obtener_estadisticas / filtros por estado ordenados por fecha
+        "CREATE INDEX IF NOT EXISTS idx_reservaciones_estado_entrada "
+        "ON reservaciones (estado, fecha_entrada)",
+        # Solapamiento de fechas por habitación (disponibilidad)
+        "CREATE INDEX IF NOT EXISTS idx_reservaciones_habitacion_fechas "
+        "ON reservaciones (habitacion_id, fecha_entrada, fecha_salida)",
+        # Reservas de un huésped
+        "CREATE INDEX IF NOT EXISTS idx_reservaciones_huesped "
+        "ON reservaciones (huesped_id)",
+        # obtener_reservas ordena por fecha de entrada
+        "CREATE INDEX IF NOT EXISTS idx_reservaciones_entrada "
+        "ON reservaciones (fecha_entrada)",
+        # obtener_habitaciones_disponibles / conteo por estado
+        "CREATE INDEX IF NOT EXISTS idx_habitaciones_estado "
+        "ON habitaciones (estado)",
+    ]),
+    (2, "Índice parcial de reservas activas para consultas de disponibilidad", [
+        # Solo reservas activas, ordenadas por salida: el rango "sale después del
+        # check-in" deja fuera todo el histórico de la habitación
+        "CREATE INDEX IF NOT EXISTS idx_reservaciones_activas_habitacion "
+        "ON reservaciones (habitacion_id, fecha_salida, fecha_entrada) "
+        "WHERE estado = 'activa'",
+    ]),
+    (3, "Índice de texto completo de huéspedes (FTS5)", [
+        # Tabla de contenido externo: el índice guarda solo los términos y lee
+        # las columnas de huespedes. remove_diacritics hace que "perez" encuentre
+        # "Pérez"; prefix acelera las búsquedas por prefijo de 2 y 3 letras.
+        "CREATE VIRTUAL TABLE IF NOT EXISTS huespedes_fts USING fts5("
+        "nombre, apellido, telefono, email, "
+        "content='huespedes', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        # Triggers que mantienen el índice sincronizado con la tabla
+        "CREATE TRIGGER IF NOT EXISTS huespedes_fts_ai AFTER INSERT ON huespedes BEGIN "
+        "INSERT INTO huespedes_fts (rowid, nombre, apellido, telefono, email) "
+        "VALUES (new.id, new.nombre, new.apellido, new.telefono, new.email); END",
+        "CREATE TRIGGER IF NOT EXISTS huespedes_fts_ad AFTER DELETE ON huespedes BEGIN "
+        "INSERT INTO huespedes_fts (huespedes_fts, rowid, nombre, apellido, telefono, email) "
+        "VALUES ('delete', old.id, old.nombre, old.apellido, old.telefono, old.email); END",
+        "CREATE TRIGGER IF NOT EXISTS huespedes_fts_au AFTER UPDATE ON huespedes BEGIN "
+        "INSERT INTO huespedes_fts (huespedes_fts, rowid, nombre, apellido, telefono, email) "
+        "VALUES ('delete', old.id, old.nombre, old.apellido, old.telefono, old.email); "
+        "INSERT INTO huespedes_fts (rowid, nombre, apellido, telefono, email) "
+        "VALUES (new.id, new.nombre, new.apellido, new.telefono, new.email); END",
+        # Indexar los huéspedes que ya existían
+        "INSERT INTO huespedes_fts (huespedes_fts) VALUES ('rebuild')",
+    ], fts5_disponible),
+    (4, "Marca de cambios de reservaciones para la matriz de ocupación", [
+        # database/ocupacion.py guarda la marca con la que se generó la matriz;
+        # si no coincide con esta, la matriz está desactualizada. Los triggers
+        # la cambian con cualquier escritura, venga de donde venga (importador,
+        # otra terminal, SQL a mano). marca_anterior permite comprobar, dentro
+        # de la transacción, que la matriz estaba al día antes de esa escritura.
+        "CREATE TABLE IF NOT EXISTS ocupacion_marca ("
+        "id INTEGER PRIMARY KEY CHECK (id = 1), "
+        "marca INTEGER NOT NULL, "
+        "marca_anterior INTEGER NOT NULL)",
+        "INSERT OR IGNORE INTO ocupacion_marca (id, marca, marca_anterior) VALUES (1, random(), 0)",
+        "CREATE TRIGGER IF NOT EXISTS ocupacion_marca_ai AFTER INSERT ON reservaciones BEGIN "
+        "UPDATE ocupacion_marca SET marca_anterior = marca, marca = random() WHERE id = 1; END",
+        "CREATE TRIGGER IF NOT EXISTS ocupacion_marca_ad AFTER DELETE ON reservaciones BEGIN "
+        "UPDATE ocupacion_marca SET marca_anterior = marca, marca = random() WHERE id = 1; END",
+        "CREATE TRIGGER IF NOT EXISTS ocupacion_marca_au AFTER UPDATE ON reservaciones BEGIN "
+        "UPDATE ocupacion_marca SET marca_anterior = marca, marca = random() WHERE id = 1; END",
+    ]),
+    (5, "Marca de ocupación como contador de filas modificadas", [
+        # Con marca + 1 por fila, una transacción que cambió N filas deja la marca
+        # exactamente N por encima de la de la matriz si nadie más escribió: la
+        # matriz se actualiza en forma incremental también tras un lote
+        # (importador, varias sentencias). marca_anterior deja de usarse.
+        "DROP TRIGGER IF EXISTS ocupacion_marca_ai",
+        "DROP TRIGGER IF EXISTS ocupacion_marca_ad",
+        "DROP TRIGGER IF EXISTS ocupacion_marca_au",
+        # Punto de partida al azar (y lejos del máximo: marca + 1 no desborda)
+        "UPDATE ocupacion_marca SET marca = abs(random() % 4611686018427387904), marca_anterior = 0",
+        "CREATE TRIGGER IF NOT EXISTS ocupacion_marca_ai AFTER INSERT ON reservaciones BEGIN "
+        "UPDATE ocupacion_marca SET marca = marca + 1 WHERE id = 1; END",
+        "CREATE TRIGGER IF NOT EXISTS ocupacion_marca_ad AFTER DELETE ON reservaciones BEGIN "
+        "UPDATE ocupacion_marca SET marca = marca + 1 WHERE id = 1; END",
+        "CREATE TRIGGER IF NOT EXISTS ocupacion_marca_au AFTER UPDATE ON reservaciones BEGIN "
+        "UPDATE ocupacion_marca SET marca = marca + 1 WHERE id = 1; END",
+    ]),
+]
+
+
+def version_actual(conn):
+    """Devuelve la versión del esquema guardada en la base de datos"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrar(conn):
+    """Aplica las migraciones pendientes y devuelve la versión final.
+
+    Cada migración es atómica: si una sentencia falla no queda nada de ella
+    y user_version sigue en la anterior.
+    """
+    version = version_actual(conn)
+
+    for numero, _descripcion, sentencias, *requisito in MIGRACIONES:
+        if numero <= version:
+            continue
+
+        # Una migración con requisito no cumplido (ej. SQLite sin FTS5) se marca
+        # como aplicada sin ejecutarse; el código que la usa tiene alternativa
+        aplicable = not requisito or requisito[0](conn)
+
+        # BEGIN explícito: el módulo sqlite3 no abre transacción para DDL, así
+        # que `with conn:` dejaría un paso a medio aplicar si una sentencia falla.
+        # La nueva versión se guarda en la misma transacción.
+        conn.execute("BEGIN")
+        try:
+            for sql in sentencias if aplicable else []:
+                conn.execute(sql)
+            # PRAGMA no acepta parámetros; numero es un entero de esta lista
+            conn.execute(f"PRAGMA user_version = {int(numero)}")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        version = numero
+
+    return version
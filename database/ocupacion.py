@@ -0,0 +1,335 @@
+# database/ocupacion.py
+import mmap
+import os
+import sqlite3
+import struct
+import threading
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:  # Opcional: acelera libres() y ocupadas_por_dia()
+    np = None
+
+# Estado de cada noche (un byte por habitación y día)
+LIBRE = 0
+ACTIVA = 1
+FINALIZADA = 2
+
+# Ventana que cubre la matriz: desde el 1 de enero de hace ANIOS_ATRAS años
+# hasta el 31 de diciembre dentro de ANIOS_ADELANTE años
+ANIOS_ATRAS = 1
+ANIOS_ADELANTE = 3
+
+# magia, versión del formato, origen (ordinal), días, filas, marca
+_CABECERA = struct.Struct("<8sIiIIq")
+_TAMANO_CABECERA = 64
+_MAGIA = b"HOTELOCU"
+_VERSION_FORMATO = 1
+# Filas de más al reconstruir, para que las habitaciones nuevas no obliguen a rehacerla
+_HOLGURA_FILAS = 64
+
+_BYTE_ACTIVA = bytes([ACTIVA])
+
+
+class MatrizOcupacion:
+    """Matriz habitaciones x días persistida junto a la base (hotel.db-ocupacion).
+
+    Un byte por noche: LIBRE, ACTIVA (reserva activa) o FINALIZADA. La fila es
+    el id de la habitación y la columna el día desde `origen`. El archivo se
+    lee con mmap, así disponibilidad, calendarios y ocupación por día son
+    operaciones sobre bytes, sin consultar las reservas.
+
+    La validez se comprueba contra ocupacion_marca (ver migraciones 4 y 5):
+    la cabecera guarda la marca con la que se generó y, si no coincide con la
+    de la base, la matriz se reconstruye. DatabaseManager la actualiza antes de
+    cada commit que toca reservaciones, dentro de la misma transacción.
+
+    Los métodos de lectura devuelven None cuando no pueden responder (rango
+    fuera de la ventana, archivo no escribible, base sin la migración): quien
+    llama usa entonces la consulta SQL.
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self._lock = threading.RLock()
+        self._archivo = None
+        self._mapa = None
+        self._inodo = None
+        self.origen = 0   # ordinal del día 0
+        self.dias = 0
+        self.filas = 0
+
+    # ==================== Lectura ====================
+
+    def disponible(self, conn, habitacion_id, fecha_entrada, fecha_salida):
+        """Indica si la habitación no tiene noches activas en [entrada, salida)"""
+        with self._lock:
+            rango = self._preparar(conn, fecha_entrada, fecha_salida, habitacion_id)
+            if rango is None:
+                return None
+            inicio, fin = rango
+            base = self._fila(habitacion_id)
+            return _BYTE_ACTIVA not in self._mapa[base + inicio:base + fin]
+
+    def libres(self, conn, habitacion_ids, fecha_entrada, fecha_salida):
+        """De las habitaciones indicadas, las que están libres en [entrada, salida)"""
+        habitacion_ids = list(habitacion_ids)
+        with self._lock:
+            rango = self._preparar(conn, fecha_entrada, fecha_salida, max(habitacion_ids, default=0))
+            if rango is None:
+                return None
+            inicio, fin = rango
+
+            if np is not None:
+                ocupada = (self._arreglo()[habitacion_ids, inicio:fin] == ACTIVA).any(axis=1)
+                return [h for h, o in zip(habitacion_ids, ocupada.tolist()) if not o]
+
+            mapa = self._mapa
+            return [
+                h for h in habitacion_ids
+                if _BYTE_ACTIVA not in mapa[self._fila(h) + inicio:self._fila(h) + fin]
+            ]
+
+    def estados(self, conn, habitacion_id, desde, hasta):
+        """Estado de cada noche de la habitación en [desde, hasta) como bytes"""
+        with self._lock:
+            rango = self._preparar(conn, desde, hasta, habitacion_id)
+            if rango is None:
+                return None
+            inicio, fin = rango
+            base = self._fila(habitacion_id)
+            return bytes(self._mapa[base + inicio:base + fin])
+
+    def ocupadas_por_dia(self, conn, habitacion_ids, desde, hasta):
+        """Noches vendidas (activas o finalizadas) por día en [desde, hasta)"""
+        habitacion_ids = list(habitacion_ids)
+        with self._lock:
+            rango = self._preparar(conn, desde, hasta, max(habitacion_ids, default=0))
+            if rango is None:
+                return None
+            inicio, fin = rango
+
+            if np is not None:
+                return (self._arreglo()[habitacion_ids, inicio:fin] != LIBRE).sum(axis=0).tolist()
+
+            cuentas = [0] * (fin - inicio)
+            for h in habitacion_ids:
+                base = self._fila(h)
+                for i, estado in enumerate(self._mapa[base + inicio:base + fin]):
+                    if estado:
+                        cuentas[i] += 1
+            return cuentas
+
+    # ==================== Escritura ====================
+
+    def aplicar(self, conn, cambios):
+        """Actualiza la matriz con las escrituras de la transacción en curso.
+
+        cambios es una lista con una entrada por sentencia sobre reservaciones:
+        (filas modificadas, [(habitacion_id, fecha_entrada, fecha_salida), ...]
+        a recalcular). Se llama antes del commit, con el bloqueo de escritura
+        tomado: ninguna otra terminal puede cambiar reservaciones mientras tanto.
+        Nunca lanza: ante cualquier problema la matriz queda invalidada.
+        """
+        with self._lock:
+            try:
+                fila = conn.execute("SELECT marca FROM ocupacion_marca WHERE id = 1").fetchone()
+                if fila is None:
+                    return
+                marca = fila[0]
+
+                filas = sum(n for n, _ in cambios)
+                # Un solo recálculo por habitación, del primer al último día tocado
+                tramos = {}
+                for _, rangos in cambios:
+                    for habitacion_id, fecha_entrada, fecha_salida in rangos:
+                        entrada, salida = tramos.get(habitacion_id, (fecha_entrada, fecha_salida))
+                        tramos[habitacion_id] = (min(entrada, fecha_entrada), max(salida, fecha_salida))
+                mayor_id = max(tramos, default=0)
+
+                # Incremental solo si la matriz reflejaba la base justo antes de
+                # esta transacción: cada fila modificada suma 1 a la marca
+                if (not self._abierta() or mayor_id >= self.filas
+                        or self.origen != _origen_actual() or self._marca() + filas != marca):
+                    self._reconstruir(conn)
+                    return
+
+                for habitacion_id, (fecha_entrada, fecha_salida) in tramos.items():
+                    self._recalcular(conn, habitacion_id, fecha_entrada, fecha_salida)
+                self._escribir_marca(marca)
+            except (OSError, ValueError, sqlite3.Error):
+                self.invalidar()
+
+    def invalidar(self):
+        """Marca la matriz como desactualizada (se reconstruye al próximo uso)"""
+        with self._lock:
+            try:
+                if self._abierta():
+                    self._escribir_marca(0)
+            except (OSError, ValueError):
+                self.cerrar()
+
+    def cerrar(self):
+        with self._lock:
+            if self._mapa is not None:
+                self._mapa.close()
+            if self._archivo is not None:
+                self._archivo.close()
+            self._mapa = self._archivo = self._inodo = None
+
+    # ==================== Internos ====================
+
+    def _fila(self, habitacion_id):
+        return _TAMANO_CABECERA + habitacion_id * self.dias
+
+    def _arreglo(self):
+        """Vista (filas, días) del mapa sin copiarlo; no guardarla (impide cerrar el mapa)"""
+        return np.frombuffer(self._mapa, dtype=np.uint8, offset=_TAMANO_CABECERA).reshape(self.filas, self.dias)
+
+    def _dia(self, fecha):
+        return date.fromisoformat(str(fecha)).toordinal() - self.origen
+
+    def _preparar(self, conn, desde, hasta, mayor_id):
+        """Deja la matriz al día y devuelve (inicio, fin) del rango, o None"""
+        try:
+            marca = conn.execute("SELECT marca FROM ocupacion_marca WHERE id = 1").fetchone()
+            if marca is None:
+                return None
+            if (not self._abierta() or self._marca() != marca[0] or mayor_id >= self.filas
+                    or self.origen != _origen_actual()):
+                self._reconstruir(conn)
+        except (OSError, ValueError, sqlite3.Error):
+            self.cerrar()
+            return None
+
+        inicio, fin = self._dia(desde), self._dia(hasta)
+        if inicio < 0 or fin > self.dias or fin < inicio:
+            return None
+        return inicio, fin
+
+    def _abierta(self):
+        """Indica si hay un mapa abierto y es el del archivo actual (lo abre si hace falta)"""
+        if self._mapa is not None:
+            try:
+                if os.stat(self.ruta).st_ino == self._inodo:
+                    return True
+            except OSError:
+                pass
+        # Primera vez, o bien otra terminal reconstruyó la matriz: abrir el archivo actual
+        self.cerrar()
+        if not os.path.exists(self.ruta):
+            return False
+        try:
+            self._abrir()
+        except (OSError, ValueError):
+            self.cerrar()
+            return False
+        return True
+
+    def _abrir(self):
+        archivo = open(self.ruta, "r+b")
+        try:
+            mapa = mmap.mmap(archivo.fileno(), 0)
+        except (OSError, ValueError):
+            archivo.close()
+            raise
+        magia, version, origen, dias, filas, _ = _CABECERA.unpack_from(mapa, 0)
+        if magia != _MAGIA or version != _VERSION_FORMATO or len(mapa) != _TAMANO_CABECERA + filas * dias:
+            mapa.close()
+            archivo.close()
+            raise ValueError("Matriz de ocupación con formato desconocido")
+
+        self._archivo, self._mapa = archivo, mapa
+        self._inodo = os.fstat(archivo.fileno()).st_ino
+        self.origen, self.dias, self.filas = origen, dias, filas
+
+    def _marca(self):
+        return _CABECERA.unpack_from(self._mapa, 0)[5]
+
+    def _escribir_marca(self, marca):
+        _CABECERA.pack_into(self._mapa, 0, _MAGIA, _VERSION_FORMATO, self.origen, self.dias, self.filas, marca)
+
+    def _reconstruir(self, conn):
+        """Genera la matriz completa desde reservaciones y la reemplaza en disco"""
+        # La marca se lee antes que las reservas: si algo cambia en el medio,
+        # la matriz queda con una marca vieja y se vuelve a generar
+        marca = conn.execute("SELECT marca FROM ocupacion_marca WHERE id = 1").fetchone()[0]
+        mayor_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM habitaciones").fetchone()[0]
+
+        origen = _origen_actual()
+        dias = _fin_actual() - origen
+        filas = mayor_id + 1 + _HOLGURA_FILAS
+        # Con la misma geometría se reescribe sobre el mapa abierto: en Windows
+        # no se puede reemplazar un archivo que otra terminal tiene mapeado
+        en_lugar = self._abierta() and (self.origen, self.dias) == (origen, dias) and self.filas > mayor_id
+        if en_lugar:
+            filas = self.filas
+
+        datos = bytearray(_TAMANO_CABECERA + filas * dias)
+        _CABECERA.pack_into(datos, 0, _MAGIA, _VERSION_FORMATO, origen, dias, filas, marca)
+
+        # Las finalizadas primero: si una noche tiene ambas, queda ACTIVA
+        consulta = conn.execute('''
+                                SELECT habitacion_id, fecha_entrada, fecha_salida, estado
+                                FROM reservaciones
+                                WHERE estado IN ('activa', 'finalizada')
+                                  AND fecha_entrada < ?
+                                  AND fecha_salida > ?
+                                ORDER BY estado = 'activa'
+                                ''', (date.fromordinal(origen + dias).isoformat(), date.fromordinal(origen).isoformat()))
+        for habitacion_id, fecha_entrada, fecha_salida, estado in consulta:
+            if not 0 <= habitacion_id < filas:
+                continue
+            inicio = max(date.fromisoformat(fecha_entrada).toordinal() - origen, 0)
+            fin = min(date.fromisoformat(fecha_salida).toordinal() - origen, dias)
+            if fin > inicio:
+                base = _TAMANO_CABECERA + habitacion_id * dias
+                datos[base + inicio:base + fin] = bytes([ACTIVA if estado == 'activa' else FINALIZADA]) * (fin - inicio)
+
+        if en_lugar:
+            # Cabecera al final: hasta entonces la marca anterior ya no coincide
+            self._escribir_marca(0)
+            self._mapa[_TAMANO_CABECERA:] = bytes(datos[_TAMANO_CABECERA:])
+            self._mapa[:_TAMANO_CABECERA] = bytes(datos[:_TAMANO_CABECERA])
+            return
+
+        temporal = f"{self.ruta}.{os.getpid()}.tmp"
+        with open(temporal, "wb") as archivo:
+            archivo.write(datos)
+        self.cerrar()
+        os.replace(temporal, self.ruta)
+        self._abrir()
+
+    def _recalcular(self, conn, habitacion_id, fecha_entrada, fecha_salida):
+        """Vuelve a calcular las noches de una habitación en [entrada, salida)"""
+        inicio = max(self._dia(fecha_entrada), 0)
+        fin = min(self._dia(fecha_salida), self.dias)
+        if fin <= inicio:
+            return
+
+        base = self._fila(habitacion_id)
+        fila = bytearray(fin - inicio)
+        consulta = conn.execute('''
+                                SELECT fecha_entrada, fecha_salida, estado
+                                FROM reservaciones
+                                WHERE habitacion_id = ?
+                                  AND estado IN ('activa', 'finalizada')
+                                  AND fecha_entrada < ?
+                                  AND fecha_salida > ?
+                                ORDER BY estado = 'activa'
+                                ''', (habitacion_id, date.fromordinal(self.origen + fin).isoformat(),
+                                      date.fromordinal(self.origen + inicio).isoformat()))
+        for entrada, salida, estado in consulta:
+            a = max(self._dia(entrada), inicio) - inicio
+            b = min(self._dia(salida), fin) - inicio
+            fila[a:b] = bytes([ACTIVA if estado == 'activa' else FINALIZADA]) * (b - a)
+        self._mapa[base + inicio:base + fin] = bytes(fila)
+
+
+def _origen_actual():
+    return date(date.today().year - ANIOS_ATRAS, 1, 1).toordinal()
+
+
+def _fin_actual():
+    return date(date.today().year + ANIOS_ADELANTE + 1, 1, 1).toordinal()
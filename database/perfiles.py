@@ -0,0 +1,75 @@
+import os
+
+# Variable de entorno para elegir el perfil en cada instalación
+VARIABLE_PERFIL = "HOTEL_DB_PERFIL"
+PERFIL_POR_DEFECTO = "local"
+
+# Perfiles de almacenamiento para hotel.db
+PERFILES_ALMACENAMIENTO = {
+    # Un solo equipo o varias terminales en la misma máquina.
+    # WAL permite leer mientras se escribe; NORMAL solo sincroniza en los checkpoints.
+    "local": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,       # ~16 MB (valor negativo = KiB)
+        "mmap_size": 134217728,     # 128 MB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,       # ms
+    },
+    # Igual que "local" pero sin perder ninguna transacción ante un corte de luz
+    "seguro": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -16000,
+        "mmap_size": 134217728,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # Base de datos en una carpeta de red: WAL no funciona sobre sistemas de archivos remotos
+    "red": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "cache_size": -8000,
+        "mmap_size": 0,
+        "temp_store": "MEMORY",
+        "busy_timeout": 15000,
+    },
+    # Comportamiento original de sqlite3 (útil para comparar)
+    "compatibilidad": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "cache_size": -2000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 0,
+    },
+}
+
+# Orden en que se aplican: journal_mode primero porque el resto depende de él
+_ORDEN_PRAGMAS = ("journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store", "busy_timeout")
+
+
+def obtener_perfil(nombre=None):
+    """Devuelve la configuración del perfil indicado (o el de la variable de entorno)"""
+    if nombre is None:
+        nombre = os.environ.get(VARIABLE_PERFIL, PERFIL_POR_DEFECTO)
+
+    if nombre not in PERFILES_ALMACENAMIENTO:
+        raise ValueError(
+            f"Perfil de almacenamiento desconocido: {nombre!r}. "
+            f"Opciones: {', '.join(PERFILES_ALMACENAMIENTO)}"
+        )
+    return PERFILES_ALMACENAMIENTO[nombre]
+
+
+def aplicar_perfil(conn, nombre=None):
+    """Aplica los PRAGMA del perfil a una conexión recién abierta"""
+    perfil = obtener_perfil(nombre)
+    cursor = conn.cursor()
+
+    for pragma in _ORDEN_PRAGMAS:
+        if pragma in perfil:
+            cursor.execute(f"PRAGMA {pragma}={perfil[pragma]}")
+
+    cursor.close()
+    return perfil
@@ -0,0 +1,134 @@
+"""Verificación de planes de consulta de DatabaseManager.
+
+Ejecuta cada método de lectura sobre una base de datos temporal, captura las
+sentencias SQL que emite y corre EXPLAIN QUERY PLAN sobre cada una. Termina
+con código 1 si alguna consulta recorre una tabla completa sin usar índice.
+
+Uso:
+    python -m database.verificar_planes
+"""
+import os
+import re
+import sys
+import tempfile
+import types
+
+from database.db_manager import DatabaseManager
+
+# (método, argumentos) que se ejecutan para capturar sus consultas
+CONSULTAS = [
+    ("obtener_habitaciones", ()),
+    ("obtener_habitaciones_disponibles", ()),
+    ("obtener_habitaciones_disponibles_rango", ("2025-01-10", "2025-01-12")),
+    ("habitacion_disponible", (1, "2025-01-10", "2025-01-12")),
+    ("obtener_empleados", ()),
+    ("validar_login", ("admin", "1234")),
+    ("obtener_estadisticas", ()),
+    ("obtener_huespedes", ()),
+    ("buscar_huesped_por_telefono", ("5550000",)),
+    ("buscar_huespedes", ("perez",)),
+    ("buscar_huespedes", ("",)),
+    ("obtener_reservas", ()),
+    ("obtener_reservas_activas", ()),
+    ("obtener_reservas_pagina", ()),
+    ("iterar_reservas", ()),
+    ("iterar_reservas", ("2024-01-01", "2024-12-31", "finalizada")),
+    ("iterar_huespedes", ()),
+    ("obtener_noches_rango", ("2024-01-01", "2024-12-31")),
+    ("_hay_solapamiento", (1, "2025-01-10", "2025-01-12")),
+    ("calendario_habitacion", (1, "2025-01-01", "2025-02-01")),
+    ("ocupacion_por_dia", ("2025-01-01", "2025-02-01")),
+    ("obtener_reservas_pagina", (50, ("2025-01-10", 7), "activa", "per")),
+    ("obtener_reserva_por_id", (1,)),
+    ("obtener_reserva_detalle", (1,)),
+    ("obtener_habitacion_por_id", (1,)),
+    ("obtener_habitacion_por_numero", ("101",)),
+    ("obtener_empleado_por_id", (1,)),
+    ("obtener_huesped_por_id", (1,)),
+]
+
+# Métodos que por diseño devuelven la tabla completa (listados sin filtro)
+SCAN_PERMITIDO = {
+    "obtener_habitaciones": {"habitaciones"},
+    "obtener_empleados": {"empleados"},
+    "obtener_huespedes": {"huespedes"},
+    "iterar_huespedes": {"huespedes"},
+    # Texto vacío: primera página en orden de id (LIMIT corta el recorrido);
+    # sqlite_master se consulta una sola vez para detectar FTS5
+    "buscar_huespedes": {"huespedes", "sqlite_master"},
+    # COUNT(*) de empleados: tabla pequeña, no justifica un índice propio
+    "obtener_estadisticas": {"empleados"},
+}
+
+# "SCAN tabla" o "SCAN tabla AS alias" sin "USING ... INDEX"
+_PATRON_SCAN = re.compile(r"^SCAN (\w+)(?: AS (\w+))?$")
+
+
+def _capturar_sentencias(db, metodo, args):
+    """Ejecuta el método y devuelve las sentencias SELECT que emitió"""
+    capturadas = []
+    # Solo hay un callback por conexión: se encadena con el de la
+    # instrumentación (database/instrumentacion.Captura) y se le devuelve al final
+    anotar = db._captura._anotar
+
+    def trazar(sql):
+        capturadas.append(sql)
+        anotar(sql)
+
+    db.conn.set_trace_callback(trazar)
+    try:
+        resultado = getattr(db, metodo)(*args)
+        # Los iteradores no consultan hasta que se recorren
+        if isinstance(resultado, types.GeneratorType):
+            for _ in resultado:
+                pass
+    finally:
+        db.conn.set_trace_callback(anotar)
+
+    return [sql for sql in capturadas if sql.lstrip().upper().startswith(("SELECT", "WITH"))]
+
+
+def _tablas_escaneadas(conn, sql):
+    """Devuelve las tablas que el plan recorre completas"""
+    tablas = set()
+    for fila in conn.execute("EXPLAIN QUERY PLAN " + sql):
+        detalle = fila[3]
+        coincidencia = _PATRON_SCAN.match(detalle)
+        if coincidencia:
+            tablas.add(coincidencia.group(1))
+    return tablas
+
+
+def verificar(db, consultas=None):
+    """Devuelve una lista de (método, tabla, sql) con escaneos completos no permitidos"""
+    problemas = []
+
+    for metodo, args in consultas or CONSULTAS:
+        permitidas = SCAN_PERMITIDO.get(metodo, set())
+
+        for sql in _capturar_sentencias(db, metodo, args):
+            for tabla in _tablas_escaneadas(db.conn, sql) - permitidas:
+                problemas.append((metodo, tabla, " ".join(sql.split())))
+
+    return problemas
+
+
+def main():
+    with tempfile.TemporaryDirectory() as carpeta:
+        db = DatabaseManager(os.path.join(carpeta, "planes.db"))
+        try:
+            problemas = verificar(db)
+        finally:
+            db.cerrar()
+
+    if not problemas:
+        print(f"OK: {len(CONSULTAS)} métodos verificados, ningún escaneo completo")
+        return 0
+
+    for metodo, tabla, sql in problemas:
+        print(f"ESCANEO COMPLETO en {metodo}: tabla '{tabla}'\n    {sql}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+# gui/busqueda.py
+import re
+import unicodedata
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Sequence
+
+
+def palabras(texto: str) -> List[str]:
+    """Separa en palabras en minúsculas y sin acentos ("Pérez" -> ["perez"])"""
+    descompuesto = unicodedata.normalize("NFKD", str(texto or "").lower())
+    sin_acentos = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return re.findall(r"\w+", sin_acentos)
+
+
+class BusquedaIncremental:
+    """Búsqueda mientras se escribe, compartida por las pantallas de listas.
+
+    - Debounce: espera `retardo_ms` sin teclas antes de buscar.
+    - Cancelación: cada tecla cancela la búsqueda pendiente, y un resultado
+      que llega después de otra búsqueda más nueva se descarta.
+    - Refinamiento: si el texto nuevo extiende al anterior ("pe" -> "per"),
+      se filtran los resultados anteriores en memoria sin volver a la BD.
+
+    obtener(texto) -> lista       consulta completa (BD); con `ejecutor` puede
+                                  devolver un Future que se entrega al terminar
+    coincide(elemento, texto)     filtro en memoria para refinar
+    mostrar(lista)                dibuja los resultados
+    """
+
+    def __init__(self, entry, obtener: Callable[[str], Sequence],
+                 coincide: Callable[[object, str], bool],
+                 mostrar: Callable[[Sequence], None],
+                 retardo_ms: int = 250, limite: Optional[int] = None,
+                 ejecutor=None):
+        self.entry = entry
+        self.obtener = obtener
+        self.coincide = coincide
+        self.mostrar = mostrar
+        self.retardo_ms = retardo_ms
+        self.ejecutor = ejecutor
+        # Si obtener() corta en `limite` filas, un resultado lleno no se puede refinar
+        self.limite = limite
+
+        self._pendiente = None
+        self._generacion = 0
+        self._ultimo_texto: Optional[str] = None
+        self._ultimos_resultados: Optional[Sequence] = None
+
+        self.entry.bind('<KeyRelease>', self.programar)
+
+    @staticmethod
+    def normalizar(texto: str) -> str:
+        """Normaliza el texto de búsqueda"""
+        return texto.strip().lower()
+
+    def programar(self, event=None):
+        """Programa una búsqueda tras el debounce (cancela la anterior)"""
+        self.cancelar()
+        self._pendiente = self.entry.after(self.retardo_ms, self.ejecutar)
+
+    def cancelar(self):
+        """Cancela la búsqueda pendiente, si la hay"""
+        if self._pendiente is not None:
+            self.entry.after_cancel(self._pendiente)
+            self._pendiente = None
+
+    def invalidar(self):
+        """Olvida los resultados anteriores (cambiaron los datos o los filtros)"""
+        self._ultimo_texto = None
+        self._ultimos_resultados = None
+
+    def ejecutar(self):
+        """Ejecuta la búsqueda con el texto actual del entry"""
+        self._pendiente = None
+        texto = self.normalizar(self.entry.get())
+
+        # Mismo texto y mismos datos (ej. teclas de flecha): nada que hacer. Va
+        # antes de cambiar la generación: lo que esté en curso sigue valiendo
+        if texto == self._ultimo_texto and self._ultimos_resultados is not None:
+            return
+
+        self._generacion += 1
+        generacion = self._generacion
+
+        if self._puede_refinar(texto):
+            resultados = [e for e in self._ultimos_resultados if self.coincide(e, texto)]
+        else:
+            resultados = self.obtener(texto)
+
+        if isinstance(resultados, Future):
+            self.ejecutor.entregar(
+                resultados,
+                al_terminar=lambda r: self._terminar(generacion, texto, r),
+                dueno=self.entry
+            )
+        else:
+            self._terminar(generacion, texto, resultados)
+
+    @property
+    def generacion(self) -> int:
+        """Número de la búsqueda más reciente"""
+        return self._generacion
+
+    def _terminar(self, generacion: int, texto: str, resultados: Sequence):
+        # Llegó una búsqueda más nueva mientras esta corría: descartar
+        if generacion != self._generacion:
+            return
+
+        self._ultimo_texto = texto
+        self._ultimos_resultados = resultados
+        self.mostrar(resultados)
+
+    def refrescar(self):
+        """Vuelve a consultar la fuente con el texto actual"""
+        self.cancelar()
+        self.invalidar()
+        self.ejecutar()
+
+    def _puede_refinar(self, texto: str) -> bool:
+        if self._ultimo_texto is None or self._ultimos_resultados is None:
+            return False
+        if not texto.startswith(self._ultimo_texto):
+            return False
+        if self.limite is not None and len(self._ultimos_resultados) >= self.limite:
+            return False
+        return True
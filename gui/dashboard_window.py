@@ -1,24 +1,26 @@
 # gui/dashboard_window.py
 import customtkinter as ctk
 from tkinter import messagebox
-from gui.habitaciones_window import HabitacionesWindow
-from gui.empleados_window import EmpleadosWindow
-from gui.reservas_window import ReservasWindow
-from gui.huespedes_window import HuespedesWindow
+from gui.pantallas import CachePantallas, obtener_pantalla, precargar_pantallas
+from controllers.reservas_controller import ReservasController
 from database.db_manager import DatabaseManager
 from typing import Optional
 
 
 class DashboardWindow:
-    def __init__(self, root, nombre_empleado, apellido_empleado, puesto, privilegio):
+    # Reservas activas que se listan en "Actividad Reciente"
+    ACTIVIDADES_INICIO = 4
+
+    def __init__(self, root, nombre_empleado, apellido_empleado, puesto, privilegio, db=None,
+                 precargar=True, pantallas_en_cache=3):
         self.root = root
         self.nombre_empleado = nombre_empleado
         self.apellido_empleado = apellido_empleado
         self.puesto = puesto
         self.privilegio = privilegio
 
-        # Base de datos
-        self.db = DatabaseManager()
+        # Base de datos (compartida por todas las pantallas)
+        self.db = db if db is not None else DatabaseManager()
 
         # Configuración de ventana
         self.root.title("Sistema Hotel Amigues - Dashboard")
@@ -26,6 +28,7 @@ class DashboardWindow:
 
         # Variables
         self.boton_activo = None
+        self.pantallas_en_cache = pantallas_en_cache
 
         # Colores del tema
         self.COLORES = {
@@ -44,6 +47,10 @@ class DashboardWindow:
         self._crear_interfaz()
         self.mostrar_inicio()
 
+        # Importar las demás pantallas en segundo plano una vez dibujado el inicio
+        if precargar:
+            self.root.after(500, precargar_pantallas)
+
     def _crear_interfaz(self):
         """Crea la interfaz principal del dashboard"""
         # Container principal
@@ -300,10 +307,23 @@ class DashboardWindow:
         )
         self.area_contenido.pack(fill="both", expand=True, padx=0, pady=0)
 
+        # Pantallas ya construidas (se ocultan en lugar de destruirse)
+        self.pantallas = CachePantallas(self.area_contenido, self.pantallas_en_cache)
+
     def limpiar_area_contenido(self):
-        """Limpia el área de contenido"""
+        """Limpia el área de contenido (las pantallas en caché solo se ocultan)"""
+        self.pantallas.ocultar()
         for widget in self.area_contenido.winfo_children():
-            widget.destroy()
+            if not self.pantallas.contiene_marco(widget):
+                widget.destroy()
+
+    def _abrir_pantalla(self, nombre, *args):
+        """Muestra una pantalla del registro, reutilizándola si está en caché"""
+        self.limpiar_area_contenido()
+        self.pantallas.mostrar(
+            nombre,
+            lambda marco: obtener_pantalla(nombre)(marco, *args)
+        )
 
     def mostrar_inicio(self):
         """Muestra la pantalla de inicio con estadísticas"""
@@ -493,13 +513,12 @@ class DashboardWindow:
             anchor="w"
         ).pack(anchor="w")
 
-        # Lista de actividades (placeholder)
+        # Últimas reservas activas (caché compartida con las demás pantallas)
         activities = [
-            "Nueva reserva registrada - Hab. 101",
-            "Check-out completado - Hab. 205",
-            "Habitación 302 lista para ocupar",
-            "Nueva reserva para fin de semana"
-        ]
+            f"Reserva activa - Hab. {reserva.habitacion} · {reserva.huesped} "
+            f"({reserva.fecha_entrada} → {reserva.fecha_salida})"
+            for reserva in ReservasController.para(self.db).obtener_activas()[:self.ACTIVIDADES_INICIO]
+        ] or ["Sin reservas activas"]
 
         for activity in activities:
             item = ctk.CTkFrame(card, fg_color="transparent")
@@ -569,30 +588,25 @@ class DashboardWindow:
 
     # Métodos para abrir diferentes secciones
     def abrir_habitaciones(self):
-        self.limpiar_area_contenido()
-        HabitacionesWindow(self.area_contenido, self.privilegio)
+        self._abrir_pantalla("habitaciones", self.privilegio, self.db)
 
     def abrir_empleados(self):
         if self.privilegio != "Administrador":
             self.mostrar_acceso_denegado()
             return
-        self.limpiar_area_contenido()
-        EmpleadosWindow(self.area_contenido)
+        self._abrir_pantalla("empleados", self.db)
 
     def abrir_reservas(self):
-        self.limpiar_area_contenido()
-        ReservasWindow(self.area_contenido, self.privilegio)
+        self._abrir_pantalla("reservas", self.privilegio, self.db)
 
     def abrir_huesped(self):
-        self.limpiar_area_contenido()
-        HuespedesWindow(self.area_contenido)
+        self._abrir_pantalla("huespedes", self.db)
 
     def abrir_reportes(self):
         if self.privilegio != "Administrador":
             self.mostrar_acceso_denegado()
             return
-        self.limpiar_area_contenido()
-        self.mostrar_en_desarrollo("Reportes", "📊")
+        self._abrir_pantalla("reportes", self.db)
 
     def abrir_configuracion(self):
         if self.privilegio != "Administrador":
@@ -672,13 +686,5 @@ class DashboardWindow:
             "¿Desea cerrar sesión?"
         )
         if respuesta:
-            self.db.cerrar()
-            self.root.quit()
-
-    def __del__(self):
-        """Destructor para cerrar conexión a BD"""
-        if hasattr(self, 'db'):
-            try:
-                self.db.cerrar()
-            except Exception:
-                pass
\ No newline at end of file
+            # La conexión compartida la cierra main.py al terminar
+            self.root.quit()
\ No newline at end of file
@@ -2,12 +2,19 @@
 import customtkinter as ctk
 from tkinter import ttk, messagebox
 from database.db_manager import DatabaseManager
+from controllers.empleados_controller import EmpleadosController
 
 
 class EmpleadosWindow:
-    def __init__(self, parent):
+    def __init__(self, parent, db=None):
         self.parent = parent
-        self.db = DatabaseManager()
+        self.db = db if db is not None else DatabaseManager()
+        self.controller = EmpleadosController.para(self.db)
+
+        # Filas mostradas: id -> valores (el iid de cada fila es el id del empleado)
+        self.filas = {}
+        self.version_cargada = None
+
         self.crear_widgets()
         self.cargar_empleados()
 
@@ -123,20 +130,40 @@ class EmpleadosWindow:
         # Evento de doble click para editar
         self.tabla.bind('<Double-1>', lambda e: self.abrir_formulario_editar())
 
-    def cargar_empleados(self):
-        """Carga los empleados desde la base de datos"""
-        # Limpiar tabla
-        for item in self.tabla.get_children():
-            self.tabla.delete(item)
+    def refrescar(self):
+        """Recarga los datos al volver a mostrar la pantalla (caché del dashboard)"""
+        self.cargar_empleados()
 
-        # Obtener empleados de la base de datos
-        empleados = self.db.obtener_empleados()
+    def cargar_empleados(self):
+        """Carga los empleados aplicando a la tabla solo las filas que cambiaron"""
+        # Sin escrituras desde la última carga: nada que hacer
+        version = self.controller.version()
+        if version == self.version_cargada:
+            return
 
-        # Insertar en la tabla (sin mostrar la contraseña)
-        for emp in empleados:
-            # emp = (id, nombre, apellido, puesto, telefono, usuario, password, privilegio)
-            datos_mostrar = (emp[0], emp[1], emp[2], emp[3], emp[4], emp[5], emp[7])
-            self.tabla.insert("", "end", values=datos_mostrar)
+        # Obtener empleados de la base de datos (sin mostrar la contraseña)
+        # emp = (id, nombre, apellido, puesto, telefono, usuario, password, privilegio)
+        nuevas = {
+            emp[0]: (emp[0], emp[1], emp[2], emp[3], emp[4], emp[5], emp[7])
+            for emp in self.controller.obtener_empleados()
+        }
+
+        # Eliminadas
+        eliminadas = [str(emp_id) for emp_id in self.filas if emp_id not in nuevas]
+        if eliminadas:
+            self.tabla.delete(*eliminadas)
+
+        # Modificadas y nuevas (en el orden de la BD); la selección y el scroll
+        # se conservan porque las filas existentes no se recrean
+        for posicion, (emp_id, valores) in enumerate(nuevas.items()):
+            anteriores = self.filas.get(emp_id)
+            if anteriores is None:
+                self.tabla.insert("", posicion, iid=str(emp_id), values=valores)
+            elif anteriores != valores:
+                self.tabla.item(str(emp_id), values=valores)
+
+        self.filas = nuevas
+        self.version_cargada = version
 
     def abrir_formulario_agregar(self):
         """Abre ventana para agregar empleado"""
@@ -156,13 +183,7 @@ class EmpleadosWindow:
 
         # Buscar empleado completo en la BD
         empleado_id = datos_tabla[0]
-        empleados = self.db.obtener_empleados()
-        empleado_completo = None
-
-        for emp in empleados:
-            if emp[0] == empleado_id:
-                empleado_completo = emp
-                break
+        empleado_completo = self.controller.obtener_empleado(empleado_id)
 
         if empleado_completo:
             FormularioEmpleado(self.parent, self.db, self.cargar_empleados, empleado_completo)
@@ -193,7 +214,7 @@ class EmpleadosWindow:
         )
 
         if respuesta:
-            self.db.eliminar_empleado(empleado_id)
+            self.controller.eliminar_empleado(empleado_id)
             messagebox.showinfo("Éxito", "Empleado eliminado correctamente")
             self.cargar_empleados()
 
@@ -201,6 +222,7 @@ class EmpleadosWindow:
 class FormularioEmpleado:
     def __init__(self, parent, db, callback_refrescar, datos=None):
         self.db = db
+        self.controller = EmpleadosController.para(db)
         self.callback_refrescar = callback_refrescar
         self.datos = datos
 
@@ -425,7 +447,7 @@ class FormularioEmpleado:
         # Guardar en base de datos
         if self.datos:  # EDITAR
             empleado_id = self.datos[0]
-            exito = self.db.actualizar_empleado(empleado_id, nombre, apellido,
+            exito = self.controller.actualizar_empleado(empleado_id, nombre, apellido,
                                                 puesto, telefono, privilegio)
 
             if exito:
@@ -440,7 +462,7 @@ class FormularioEmpleado:
                 messagebox.showerror("Error", "Usuario y contraseña son obligatorios")
                 return
 
-            exito = self.db.agregar_empleado(nombre, apellido, puesto, telefono,
+            exito = self.controller.agregar_empleado(nombre, apellido, puesto, telefono,
                                              usuario, password, privilegio)
 
             if exito:
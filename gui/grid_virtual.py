@@ -0,0 +1,176 @@
+# gui/grid_virtual.py
+import math
+import customtkinter as ctk
+from typing import Callable, List, Optional, Sequence
+
+
+class GridVirtual(ctk.CTkFrame):
+    """Grid con scroll que solo crea widgets para las filas visibles.
+
+    Las celdas se crean una vez (las que caben en pantalla más una fila extra)
+    y se reciclan al hacer scroll: cada celda se reconfigura con los datos de la
+    posición que le toca en lugar de destruirse y crearse de nuevo. El costo de
+    dibujar se mantiene constante aunque haya cientos de elementos.
+
+    crear_celda(parent) -> widget      crea una celda vacía
+    actualizar_celda(widget, datos)    la rellena con los datos de un elemento
+    """
+
+    def __init__(self, parent, crear_celda: Callable, actualizar_celda: Callable,
+                 columnas: int = 4, ancho_celda: int = 280, alto_celda: int = 320,
+                 espacio: int = 20, **kwargs):
+        kwargs.setdefault("fg_color", "transparent")
+        super().__init__(parent, **kwargs)
+
+        self.crear_celda = crear_celda
+        self.actualizar_celda = actualizar_celda
+        self.columnas = columnas
+        self.ancho_celda = ancho_celda
+        self.alto_celda = alto_celda
+        self.alto_fila = alto_celda + espacio
+
+        # Estado
+        self.datos: Sequence = []
+        self.offset = 0
+        self._celdas: List = []
+        self._asignado: List[Optional[int]] = []
+
+        # Viewport (recorta las celdas que salen de la vista) + scrollbar
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._yview)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.interior = ctk.CTkFrame(self, fg_color="transparent")
+        self.interior.pack(side="left", fill="both", expand=True)
+        self.interior.bind("<Configure>", lambda e: self._redibujar())
+
+        # Rueda del mouse: una etiqueta de eventos propia de este grid que se
+        # agrega a cada widget de adentro (bind_all acumularía manejadores
+        # globales con cada grid creado)
+        self._etiqueta_rueda = f"GridVirtual{id(self)}"
+        for secuencia in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_class(self._etiqueta_rueda, secuencia, self._rueda_mouse)
+        self._etiquetar_rueda(self)
+
+    # ==================== API ====================
+
+    def establecer_datos(self, datos: Sequence):
+        """Reemplaza los elementos mostrados y vuelve al inicio"""
+        self.datos = datos
+        self.offset = 0
+        self._asignado = [None] * len(self._celdas)
+        self._redibujar()
+
+    def refrescar(self):
+        """Vuelve a rellenar las celdas visibles (los datos cambiaron en sitio)"""
+        self._asignado = [None] * len(self._celdas)
+        self._redibujar()
+
+    # ==================== Geometría ====================
+
+    def _total_filas(self):
+        return math.ceil(len(self.datos) / self.columnas)
+
+    def _alto_contenido(self):
+        return self._total_filas() * self.alto_fila
+
+    def _escala(self):
+        # winfo_* devuelve píxeles reales; place() vuelve a aplicar el escalado de CTk
+        return self._get_widget_scaling() or 1
+
+    def _alto_visible(self):
+        return max(self.interior.winfo_height() / self._escala(), 1)
+
+    def _offset_maximo(self):
+        return max(self._alto_contenido() - self._alto_visible(), 0)
+
+    def _asegurar_celdas(self, cantidad):
+        """Crea celdas hasta tener las necesarias para llenar la vista"""
+        while len(self._celdas) < cantidad:
+            celda = self.crear_celda(self.interior)
+            self._etiquetar_rueda(celda)
+            self._celdas.append(celda)
+            self._asignado.append(None)
+
+    def _redibujar(self):
+        """Coloca las celdas visibles según el offset actual"""
+        alto_visible = self._alto_visible()
+        self.offset = min(max(self.offset, 0), self._offset_maximo())
+
+        filas_visibles = math.ceil(alto_visible / self.alto_fila) + 1
+        capacidad = filas_visibles * self.columnas
+        if self.datos:
+            self._asegurar_celdas(min(capacidad, len(self.datos)))
+
+        ancho_columna = max(self.interior.winfo_width() / self._escala(), 1) / self.columnas
+        primera_fila = int(self.offset // self.alto_fila)
+        primer_indice = primera_fila * self.columnas
+        ultimo_indice = min(primer_indice + capacidad, len(self.datos))
+        usadas = set()
+
+        # Cada índice de datos va siempre al mismo hueco (índice % celdas):
+        # al avanzar una fila solo se reconfiguran las celdas de esa fila
+        n_celdas = len(self._celdas)
+        for indice in range(primer_indice, ultimo_indice):
+            hueco = indice % n_celdas
+            celda = self._celdas[hueco]
+            usadas.add(hueco)
+
+            if self._asignado[hueco] != indice:
+                self.actualizar_celda(celda, self.datos[indice])
+                self._asignado[hueco] = indice
+
+            fila, columna = divmod(indice, self.columnas)
+            x = columna * ancho_columna + (ancho_columna - self.ancho_celda) / 2
+            y = fila * self.alto_fila - self.offset + (self.alto_fila - self.alto_celda) / 2
+            # El tamaño lo fija la propia celda (CTk no acepta width/height en place)
+            celda.place(x=max(x, 0), y=y)
+
+        for hueco, celda in enumerate(self._celdas):
+            if hueco not in usadas:
+                celda.place_forget()
+                self._asignado[hueco] = None
+
+        self._actualizar_scrollbar()
+
+    def _actualizar_scrollbar(self):
+        alto_contenido = self._alto_contenido()
+        if alto_contenido <= 0:
+            self.scrollbar.set(0, 1)
+            return
+        inicio = self.offset / alto_contenido
+        fin = (self.offset + self._alto_visible()) / alto_contenido
+        self.scrollbar.set(inicio, min(fin, 1))
+
+    # ==================== Scroll ====================
+
+    def _yview(self, *args):
+        """Callback del scrollbar: ('moveto', f) o ('scroll', n, unidad)"""
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * self._alto_contenido())
+        elif args[0] == "scroll":
+            paso = self._alto_visible() if args[2] == "pages" else self.alto_fila // 4
+            self.offset += int(args[1]) * paso
+        self._redibujar()
+
+    def _rueda_mouse(self, event):
+        if getattr(event, "num", None) == 4:
+            pasos = -1
+        elif getattr(event, "num", None) == 5:
+            pasos = 1
+        else:
+            pasos = -1 if event.delta > 0 else 1
+
+        self._yview("scroll", pasos, "units")
+
+    def _etiquetar_rueda(self, widget):
+        """Agrega la etiqueta de la rueda al widget y a todos sus hijos (también los internos de CTk)"""
+        etiquetas = widget.bindtags()
+        if self._etiqueta_rueda not in etiquetas:
+            widget.bindtags((self._etiqueta_rueda,) + etiquetas)
+        for hijo in widget.winfo_children():
+            self._etiquetar_rueda(hijo)
+
+    def destroy(self):
+        for secuencia in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.unbind_class(self._etiqueta_rueda, secuencia)
+        super().destroy()
@@ -2,17 +2,22 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from database.db_manager import DatabaseManager
+from controllers.habitaciones_controller import HabitacionesController
+from gui.grid_virtual import GridVirtual
+from gui.busqueda import BusquedaIncremental
 from typing import Optional, List, Tuple
 
 
 class HabitacionesWindow:
-    def __init__(self, parent, privilegio="Empleado"):
+    def __init__(self, parent, privilegio="Empleado", db=None):
         self.parent = parent
         self.privilegio = privilegio
-        self.db = DatabaseManager()
+        self.db = db if db is not None else DatabaseManager()
+        self.controller = HabitacionesController.para(self.db)
 
         # Variables
         self.habitacion_seleccionada = None
+        self.hay_habitaciones = False
         self.filtro_estado = "Todos"
         self.filtro_tipo = "Todos"
 
@@ -116,7 +121,14 @@ class HabitacionesWindow:
             corner_radius=10
         )
         self.entry_buscar.pack(side="left", padx=(0, 15))
-        self.entry_buscar.bind('<KeyRelease>', lambda e: self.aplicar_filtros())
+
+        # Búsqueda con debounce y refinamiento sobre los resultados anteriores
+        self.busqueda = BusquedaIncremental(
+            self.entry_buscar,
+            obtener=self._buscar_habitaciones,
+            coincide=self._coincide_busqueda,
+            mostrar=self._mostrar_resultados
+        )
 
         # Filtro por estado
         ctk.CTkLabel(
@@ -173,44 +185,60 @@ class HabitacionesWindow:
         btn_refrescar.pack(side="right", padx=(10, 0))
 
     def _crear_grid_habitaciones(self, parent):
-        """Crea el grid scrollable de habitaciones"""
-        # Frame contenedor con scroll
-        self.scroll_frame = ctk.CTkScrollableFrame(
+        """Crea el grid virtualizado de habitaciones"""
+        # Solo se crean tarjetas para las filas visibles y se reciclan al hacer scroll
+        self.scroll_frame = GridVirtual(
             parent,
-            fg_color="transparent"
+            crear_celda=self._crear_tarjeta_habitacion,
+            actualizar_celda=self._actualizar_tarjeta_habitacion,
+            columnas=4,
+            ancho_celda=280,
+            alto_celda=320
         )
         self.scroll_frame.pack(fill="both", expand=True)
 
-        # Configurar grid
-        for i in range(4):
-            self.scroll_frame.columnconfigure(i, weight=1)
+        self.mensaje_frame = None
+
+    def refrescar(self):
+        """Recarga los datos al volver a mostrar la pantalla (caché del dashboard)"""
+        self.cargar_habitaciones()
 
     def cargar_habitaciones(self):
         """Carga y muestra las habitaciones"""
-        # Limpiar grid
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
-
-        # Obtener habitaciones
-        habitaciones = self.db.obtener_habitaciones()
-
-        if not habitaciones:
+        self.busqueda.refrescar()
+
+    def _buscar_habitaciones(self, busqueda: str) -> List[Tuple]:
+        """Obtiene las habitaciones de la BD y aplica los filtros"""
+        habitaciones = self.controller.obtener_habitaciones()
+        self.hay_habitaciones = bool(habitaciones)
+        return self._filtrar_habitaciones(habitaciones, busqueda)
+
+    def _coincide_busqueda(self, hab: Tuple, busqueda: str) -> bool:
+        """Filtro en memoria usado al refinar una búsqueda"""
+        return busqueda in str(hab[1]).lower()
+
+    def _mostrar_resultados(self, habitaciones: List[Tuple]):
+        """Muestra las habitaciones encontradas o el mensaje correspondiente"""
+        # Quitar mensaje anterior (vacío / sin resultados)
+        if self.mensaje_frame is not None:
+            self.mensaje_frame.destroy()
+            self.mensaje_frame = None
+
+        if not self.hay_habitaciones:
+            self.scroll_frame.establecer_datos([])
             self._mostrar_mensaje_vacio()
             return
 
-        # Aplicar filtros
-        habitaciones_filtradas = self._filtrar_habitaciones(habitaciones)
-
-        if not habitaciones_filtradas:
+        if not habitaciones:
+            self.scroll_frame.establecer_datos([])
             self._mostrar_mensaje_sin_resultados()
             return
 
         # Mostrar habitaciones en grid
-        self._mostrar_habitaciones_grid(habitaciones_filtradas)
+        self._mostrar_habitaciones_grid(habitaciones)
 
-    def _filtrar_habitaciones(self, habitaciones: List[Tuple]) -> List[Tuple]:
+    def _filtrar_habitaciones(self, habitaciones: List[Tuple], busqueda: str) -> List[Tuple]:
         """Filtra las habitaciones según criterios"""
-        busqueda = self.entry_buscar.get().strip().lower()
         estado_filtro = self.combo_filtro_estado.get()
         tipo_filtro = self.combo_filtro_tipo.get()
 
@@ -234,25 +262,13 @@ class HabitacionesWindow:
 
     def _mostrar_habitaciones_grid(self, habitaciones: List[Tuple]):
         """Muestra las habitaciones en formato grid"""
-        row = 0
-        col = 0
-
-        for hab in habitaciones:
-            card = self._crear_tarjeta_habitacion(hab)
-            card.grid(row=row, column=col, padx=10, pady=10, sticky="n")
-
-            col += 1
-            if col >= 4:
-                col = 0
-                row += 1
-
-    def _crear_tarjeta_habitacion(self, datos: Tuple):
-        """Crea una tarjeta visual para una habitación"""
-        habitacion_id, numero, tipo, precio, estado = datos
+        self.scroll_frame.establecer_datos(habitaciones)
 
+    def _crear_tarjeta_habitacion(self, parent):
+        """Crea una tarjeta visual vacía (se rellena con _actualizar_tarjeta_habitacion)"""
         # Frame principal de la tarjeta
         card = ctk.CTkFrame(
-            self.scroll_frame,
+            parent,
             fg_color=self.COLORES['card_bg'],
             corner_radius=15,
             border_width=2,
@@ -261,56 +277,55 @@ class HabitacionesWindow:
             height=320
         )
         card.pack_propagate(False)
+        card.datos = None
+
+        def seleccionar(e):
+            self._seleccionar_habitacion(card.datos, card)
 
         # Hover effect
         card.bind("<Enter>", lambda e: card.configure(border_color=self.COLORES['primary']))
         card.bind("<Leave>", lambda e: card.configure(border_color=("#E0E0E0", "#4A4A4A")))
 
         # Click para seleccionar
-        card.bind("<Button-1>", lambda e: self._seleccionar_habitacion(datos, card))
+        card.bind("<Button-1>", seleccionar)
 
         # Container interno
         content = ctk.CTkFrame(card, fg_color="transparent")
         content.pack(fill="both", expand=True, padx=15, pady=15)
 
-        # Bind click en todos los elementos hijos
-        for widget in content.winfo_children():
-            widget.bind("<Button-1>", lambda e: self._seleccionar_habitacion(datos, card))
-
         # Badge de estado en la esquina superior
         badge_frame = ctk.CTkFrame(content, fg_color="transparent")
         badge_frame.pack(fill="x")
 
-        badge = ctk.CTkLabel(
+        card.badge = ctk.CTkLabel(
             badge_frame,
-            text=self._get_texto_estado(estado),
+            text="",
             font=("Segoe UI", 9, "bold"),
-            fg_color=self.COLORES.get(estado, "#95A5A6"),
             corner_radius=6,
             padx=10,
             pady=4
         )
-        badge.pack(side="right")
-        badge.bind("<Button-1>", lambda e: self._seleccionar_habitacion(datos, card))
+        card.badge.pack(side="right")
+        card.badge.bind("<Button-1>", seleccionar)
 
         # Número de habitación (grande)
-        numero_label = ctk.CTkLabel(
+        card.numero_label = ctk.CTkLabel(
             content,
-            text=f"#{numero}",
+            text="",
             font=("Segoe UI", 32, "bold")
         )
-        numero_label.pack(pady=(10, 5))
-        numero_label.bind("<Button-1>", lambda e: self._seleccionar_habitacion(datos, card))
+        card.numero_label.pack(pady=(10, 5))
+        card.numero_label.bind("<Button-1>", seleccionar)
 
         # Tipo de habitación
-        tipo_label = ctk.CTkLabel(
+        card.tipo_label = ctk.CTkLabel(
             content,
-            text=tipo,
+            text="",
             font=("Segoe UI", 12),
             text_color=("#7F8C8D", "#95A5A6")
         )
-        tipo_label.pack(pady=(0, 10))
-        tipo_label.bind("<Button-1>", lambda e: self._seleccionar_habitacion(datos, card))
+        card.tipo_label.pack(pady=(0, 10))
+        card.tipo_label.bind("<Button-1>", seleccionar)
 
         # Separador
         separator = ctk.CTkFrame(content, height=2, fg_color=("#E0E0E0", "#4A4A4A"))
@@ -319,16 +334,16 @@ class HabitacionesWindow:
         # Precio
         precio_frame = ctk.CTkFrame(content, fg_color="transparent")
         precio_frame.pack(pady=(0, 10))
-        precio_frame.bind("<Button-1>", lambda e: self._seleccionar_habitacion(datos, card))
+        precio_frame.bind("<Button-1>", seleccionar)
 
-        precio_label = ctk.CTkLabel(
+        card.precio_label = ctk.CTkLabel(
             precio_frame,
-            text=f"${precio:,.2f}",
+            text="",
             font=("Segoe UI", 18, "bold"),
             text_color=self.COLORES['success']
         )
-        precio_label.pack(side="left")
-        precio_label.bind("<Button-1>", lambda e: self._seleccionar_habitacion(datos, card))
+        card.precio_label.pack(side="left")
+        card.precio_label.bind("<Button-1>", seleccionar)
 
         noche_label = ctk.CTkLabel(
             precio_frame,
@@ -337,14 +352,27 @@ class HabitacionesWindow:
             text_color=("#95A5A6", "#7F8C8D")
         )
         noche_label.pack(side="left", padx=(5, 0))
-        noche_label.bind("<Button-1>", lambda e: self._seleccionar_habitacion(datos, card))
+        noche_label.bind("<Button-1>", seleccionar)
 
         # Botones de acción
-        self._crear_botones_tarjeta(content, datos)
+        self._crear_botones_tarjeta(content, card)
 
         return card
 
-    def _crear_botones_tarjeta(self, parent, datos):
+    def _actualizar_tarjeta_habitacion(self, card, datos: Tuple):
+        """Rellena una tarjeta (nueva o reciclada) con los datos de una habitación"""
+        habitacion_id, numero, tipo, precio, estado = datos
+        card.datos = datos
+
+        card.badge.configure(
+            text=self._get_texto_estado(estado),
+            fg_color=self.COLORES.get(estado, "#95A5A6")
+        )
+        card.numero_label.configure(text=f"#{numero}")
+        card.tipo_label.configure(text=tipo)
+        card.precio_label.configure(text=f"${precio:,.2f}")
+
+    def _crear_botones_tarjeta(self, parent, card):
         """Crea los botones de acción en la tarjeta"""
         btn_frame = ctk.CTkFrame(parent, fg_color="transparent")
         btn_frame.pack(fill="x", pady=(10, 0))
@@ -359,7 +387,7 @@ class HabitacionesWindow:
             corner_radius=8,
             fg_color=self.COLORES['primary'],
             hover_color="#2980B9",
-            command=lambda: self.abrir_formulario_editar(datos)
+            command=lambda: self.abrir_formulario_editar(card.datos)
         )
         btn_editar.pack(side="left", expand=True, padx=(0, 5))
 
@@ -374,7 +402,7 @@ class HabitacionesWindow:
                 corner_radius=8,
                 fg_color=self.COLORES['danger'],
                 hover_color="#C0392B",
-                command=lambda: self.eliminar_habitacion(datos)
+                command=lambda: self.eliminar_habitacion(card.datos)
             )
             btn_eliminar.pack(side="left", expand=True, padx=(5, 0))
 
@@ -394,8 +422,9 @@ class HabitacionesWindow:
 
     def _mostrar_mensaje_vacio(self):
         """Muestra mensaje cuando no hay habitaciones"""
-        mensaje = ctk.CTkFrame(self.scroll_frame, fg_color="transparent")
-        mensaje.pack(expand=True, pady=100)
+        mensaje = ctk.CTkFrame(self.scroll_frame.interior, fg_color="transparent")
+        mensaje.place(relx=0.5, y=100, anchor="n")
+        self.mensaje_frame = mensaje
 
         ctk.CTkLabel(
             mensaje,
@@ -418,8 +447,9 @@ class HabitacionesWindow:
 
     def _mostrar_mensaje_sin_resultados(self):
         """Muestra mensaje cuando no hay resultados de búsqueda"""
-        mensaje = ctk.CTkFrame(self.scroll_frame, fg_color="transparent")
-        mensaje.pack(expand=True, pady=100)
+        mensaje = ctk.CTkFrame(self.scroll_frame.interior, fg_color="transparent")
+        mensaje.place(relx=0.5, y=100, anchor="n")
+        self.mensaje_frame = mensaje
 
         ctk.CTkLabel(
             mensaje,
@@ -483,7 +513,7 @@ class HabitacionesWindow:
         )
 
         if respuesta:
-            self.db.eliminar_habitacion(habitacion_id)
+            self.controller.eliminar_habitacion(habitacion_id)
             messagebox.showinfo("Éxito", "Habitación eliminada correctamente")
             self.cargar_habitaciones()
 
@@ -491,6 +521,7 @@ class HabitacionesWindow:
 class FormularioHabitacion:
     def __init__(self, parent, db, callback_refrescar, datos=None):
         self.db = db
+        self.controller = HabitacionesController.para(db)
         self.callback_refrescar = callback_refrescar
         self.datos = datos
 
@@ -723,10 +754,10 @@ class FormularioHabitacion:
         try:
             if self.datos:  # EDITAR
                 habitacion_id = self.datos[0]
-                exito = self.db.actualizar_habitacion(habitacion_id, numero, tipo, precio, estado)
+                exito = self.controller.actualizar_habitacion(habitacion_id, numero, tipo, precio, estado)
                 mensaje = "Habitación actualizada correctamente"
             else:  # AGREGAR
-                exito = self.db.agregar_habitacion(numero, tipo, precio, estado)
+                exito = self.controller.agregar_habitacion(numero, tipo, precio, estado)
                 mensaje = "Habitación agregada correctamente"
 
             if exito:
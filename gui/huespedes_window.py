@@ -2,16 +2,24 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from database.db_manager import DatabaseManager
+from controllers.huespedes_controller import HuespedesController
+from gui.busqueda import BusquedaIncremental, palabras
+from gui.pool_tarjetas import PoolTarjetas
 from typing import Optional, List, Tuple
 
 
 class HuespedesWindow:
-    def __init__(self, parent):
+    # Máximo de tarjetas por búsqueda (el resto se alcanza afinando el texto)
+    LIMITE_RESULTADOS = 120
+
+    def __init__(self, parent, db=None):
         self.parent = parent
-        self.db = DatabaseManager()
+        self.db = db if db is not None else DatabaseManager()
+        self.controller = HuespedesController.para(self.db)
 
         # Variables
         self.huesped_seleccionado = None
+        self.hay_huespedes = False
 
         # Colores consistentes con el diseño
         self.COLORES = {
@@ -111,7 +119,15 @@ class HuespedesWindow:
             corner_radius=10
         )
         self.entry_buscar.pack(side="left", padx=(0, 10))
-        self.entry_buscar.bind('<KeyRelease>', lambda e: self.aplicar_filtros())
+
+        # Búsqueda con debounce y refinamiento sobre los resultados anteriores
+        self.busqueda = BusquedaIncremental(
+            self.entry_buscar,
+            obtener=self._buscar_huespedes,
+            coincide=self._coincide_busqueda,
+            mostrar=self._mostrar_resultados,
+            limite=self.LIMITE_RESULTADOS
+        )
 
         btn_limpiar = ctk.CTkButton(
             search_frame,
@@ -161,48 +177,61 @@ class HuespedesWindow:
         for i in range(3):
             self.scroll_frame.columnconfigure(i, weight=1)
 
+        # Tarjetas reutilizables entre recargas
+        self.pool_tarjetas = PoolTarjetas(
+            self.scroll_frame,
+            crear=self._crear_tarjeta_huesped,
+            actualizar=self._actualizar_tarjeta_huesped
+        )
+
+    def refrescar(self):
+        """Recarga los datos al volver a mostrar la pantalla (caché del dashboard)"""
+        self.cargar_huespedes()
+
     def cargar_huespedes(self):
         """Carga y muestra los huéspedes"""
-        # Limpiar grid
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
+        self.busqueda.refrescar()
 
-        # Obtener huéspedes
-        huespedes = self.db.obtener_huespedes()
+    def _buscar_huespedes(self, busqueda: str) -> List[Tuple]:
+        """Busca en el índice de texto completo de la BD"""
+        huespedes = self.controller.buscar(busqueda, limite=self.LIMITE_RESULTADOS)
 
-        if not huespedes:
+        # Sin resultados: distinguir "no hay huéspedes" de "no hay coincidencias"
+        if huespedes or not busqueda:
+            self.hay_huespedes = bool(huespedes)
+        else:
+            self.hay_huespedes = self.controller.hay_huespedes()
+
+        return huespedes
+
+    def _mostrar_resultados(self, huespedes: List[Tuple]):
+        """Muestra los huéspedes encontrados o el mensaje correspondiente"""
+        # Limpiar grid: las tarjetas vuelven al pool, el resto se destruye
+        self.pool_tarjetas.liberar_todas()
+        for widget in self.scroll_frame.winfo_children():
+            if not self.pool_tarjetas.es_tarjeta(widget):
+                widget.destroy()
+
+        if not self.hay_huespedes:
             self._mostrar_mensaje_vacio()
             return
 
-        # Aplicar filtros
-        huespedes_filtrados = self._filtrar_huespedes(huespedes)
-
-        if not huespedes_filtrados:
+        if not huespedes:
             self._mostrar_mensaje_sin_resultados()
             return
 
         # Mostrar huéspedes en grid
-        self._mostrar_huespedes_grid(huespedes_filtrados)
-
-    def _filtrar_huespedes(self, huespedes: List[Tuple]) -> List[Tuple]:
-        """Filtra los huéspedes según criterios de búsqueda"""
-        busqueda = self.entry_buscar.get().strip().lower()
+        self._mostrar_huespedes_grid(huespedes)
 
-        if not busqueda:
-            return huespedes
+    def _coincide_busqueda(self, huesped: Tuple, busqueda: str) -> bool:
+        """Mismo criterio que buscar_huespedes: cada palabra es prefijo de algún campo"""
+        # huesped = (id, nombre, apellido, telefono, password, email)
+        campos = palabras(f"{huesped[1]} {huesped[2]} {huesped[3] or ''} {huesped[5] or ''}")
 
-        huespedes_filtrados = []
-
-        for huesped in huespedes:
-            # huesped = (id, nombre, apellido, email, telefono, password)
-            nombre_completo = f"{huesped[1]} {huesped[2]}".lower()
-            email = str(huesped[3]).lower() if huesped[3] else ""
-            telefono = str(huesped[4]).lower() if len(huesped) > 4 and huesped[4] else ""
-
-            if busqueda in nombre_completo or busqueda in email or busqueda in telefono:
-                huespedes_filtrados.append(huesped)
-
-        return huespedes_filtrados
+        return all(
+            any(campo.startswith(termino) for campo in campos)
+            for termino in palabras(busqueda)
+        )
 
     def _mostrar_huespedes_grid(self, huespedes: List[Tuple]):
         """Muestra los huéspedes en formato grid"""
@@ -210,7 +239,7 @@ class HuespedesWindow:
         col = 0
 
         for huesped in huespedes:
-            card = self._crear_tarjeta_huesped(huesped)
+            card = self.pool_tarjetas.obtener(huesped)
             card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
 
             col += 1
@@ -218,25 +247,24 @@ class HuespedesWindow:
                 col = 0
                 row += 1
 
-    def _crear_tarjeta_huesped(self, datos: Tuple):
-        """Crea una tarjeta visual para un huésped"""
-        huesped_id, nombre, apellido, documento, email, _ = datos
-
+    def _crear_tarjeta_huesped(self, parent):
+        """Crea una tarjeta de huésped vacía (se rellena con _actualizar_tarjeta_huesped)"""
         # Frame principal de la tarjeta
         card = ctk.CTkFrame(
-            self.scroll_frame,
+            parent,
             fg_color=self.COLORES['card_bg'],
             corner_radius=15,
             border_width=2,
             border_color=("#E0E0E0", "#4A4A4A")
         )
+        card.datos = None
 
         # Hover effect
         card.bind("<Enter>", lambda e: card.configure(border_color=self.COLORES['primary']))
         card.bind("<Leave>", lambda e: card.configure(border_color=("#E0E0E0", "#4A4A4A")))
 
         # Click para seleccionar
-        card.bind("<Button-1>", lambda e: self._seleccionar_huesped(datos, card))
+        card.bind("<Button-1>", lambda e: self._seleccionar_huesped(card.datos, card))
 
         # Container interno
         content = ctk.CTkFrame(card, fg_color="transparent")
@@ -260,25 +288,25 @@ class HuespedesWindow:
         ).place(relx=0.5, rely=0.5, anchor="center")
 
         # Nombre completo
-        nombre_completo = f"{nombre} {apellido}"
-        ctk.CTkLabel(
+        card.nombre_label = ctk.CTkLabel(
             content,
-            text=nombre_completo,
+            text="",
             font=("Segoe UI", 16, "bold"),
             wraplength=250
-        ).pack(pady=(0, 5))
+        )
+        card.nombre_label.pack(pady=(0, 5))
 
         # ID badge
-        id_badge = ctk.CTkLabel(
+        card.id_badge = ctk.CTkLabel(
             content,
-            text=f"ID: #{huesped_id}",
+            text="",
             font=("Segoe UI", 9, "bold"),
             fg_color=("#ECF0F1", "#2C3E50"),
             corner_radius=6,
             padx=10,
             pady=4
         )
-        id_badge.pack(pady=(0, 15))
+        card.id_badge.pack(pady=(0, 15))
 
         # Separador
         ctk.CTkFrame(
@@ -301,46 +329,63 @@ class HuespedesWindow:
             font=("Segoe UI", 14)
         ).pack(side="left", padx=(0, 8))
 
-        ctk.CTkLabel(
+        card.documento_label = ctk.CTkLabel(
             doc_frame,
-            text=documento,
+            text="",
             font=("Segoe UI", 11),
             anchor="w"
-        ).pack(side="left", fill="x", expand=True)
+        )
+        card.documento_label.pack(side="left", fill="x", expand=True)
 
-        # Email
-        if email:
-            email_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
-            email_frame.pack(fill="x")
-
-            ctk.CTkLabel(
-                email_frame,
-                text="📧",
-                font=("Segoe UI", 14)
-            ).pack(side="left", padx=(0, 8))
-
-            ctk.CTkLabel(
-                email_frame,
-                text=email,
-                font=("Segoe UI", 10),
-                text_color=("#7F8C8D", "#95A5A6"),
-                anchor="w",
-                wraplength=220
-            ).pack(side="left", fill="x", expand=True)
-        else:
-            ctk.CTkLabel(
-                info_frame,
-                text="Sin email registrado",
-                font=("Segoe UI", 9, "italic"),
-                text_color=("#95A5A6", "#7F8C8D")
-            ).pack()
+        # Email (se muestra este frame o el aviso "Sin email")
+        card.email_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
+
+        ctk.CTkLabel(
+            card.email_frame,
+            text="📧",
+            font=("Segoe UI", 14)
+        ).pack(side="left", padx=(0, 8))
+
+        card.email_label = ctk.CTkLabel(
+            card.email_frame,
+            text="",
+            font=("Segoe UI", 10),
+            text_color=("#7F8C8D", "#95A5A6"),
+            anchor="w",
+            wraplength=220
+        )
+        card.email_label.pack(side="left", fill="x", expand=True)
+
+        card.sin_email_label = ctk.CTkLabel(
+            info_frame,
+            text="Sin email registrado",
+            font=("Segoe UI", 9, "italic"),
+            text_color=("#95A5A6", "#7F8C8D")
+        )
 
         # Botones de acción
-        self._crear_botones_tarjeta(content, datos)
+        self._crear_botones_tarjeta(content, card)
 
         return card
 
-    def _crear_botones_tarjeta(self, parent, datos):
+    def _actualizar_tarjeta_huesped(self, card, datos: Tuple):
+        """Rellena una tarjeta de huésped con los datos de un huésped"""
+        huesped_id, nombre, apellido, documento, email, _ = datos
+
+        card.datos = datos
+        card.nombre_label.configure(text=f"{nombre} {apellido}")
+        card.id_badge.configure(text=f"ID: #{huesped_id}")
+        card.documento_label.configure(text=documento)
+
+        if email:
+            card.email_label.configure(text=email)
+            card.sin_email_label.pack_forget()
+            card.email_frame.pack(fill="x")
+        else:
+            card.email_frame.pack_forget()
+            card.sin_email_label.pack()
+
+    def _crear_botones_tarjeta(self, parent, card):
         """Crea los botones de acción en la tarjeta"""
         btn_frame = ctk.CTkFrame(parent, fg_color="transparent")
         btn_frame.pack(fill="x", pady=(10, 0))
@@ -355,7 +400,7 @@ class HuespedesWindow:
             corner_radius=8,
             fg_color=self.COLORES['primary'],
             hover_color="#2980B9",
-            command=lambda: self.abrir_formulario_editar(datos)
+            command=lambda: self.abrir_formulario_editar(card.datos)
         )
         btn_editar.pack(side="left", expand=True, padx=(0, 5))
 
@@ -369,7 +414,7 @@ class HuespedesWindow:
             corner_radius=8,
             fg_color=self.COLORES['danger'],
             hover_color="#C0392B",
-            command=lambda: self.eliminar_huesped(datos)
+            command=lambda: self.eliminar_huesped(card.datos)
         )
         btn_eliminar.pack(side="left", expand=True, padx=(5, 0))
 
@@ -474,7 +519,7 @@ class HuespedesWindow:
         )
 
         if respuesta:
-            self.db.eliminar_huesped(huesped_id)
+            self.controller.eliminar_huesped(huesped_id)
             messagebox.showinfo("Éxito", "Huésped eliminado correctamente")
             self.cargar_huespedes()
 
@@ -482,6 +527,7 @@ class HuespedesWindow:
 class FormularioHuesped:
     def __init__(self, parent, db, callback_refrescar, datos=None):
         self.db = db
+        self.controller = HuespedesController.para(db)
         self.callback_refrescar = callback_refrescar
         self.datos = datos
         self.callback = None
@@ -719,11 +765,11 @@ class FormularioHuesped:
             if not password:
                 password = self.datos[4]
 
-            ok = self.db.actualizar_huesped(
+            ok = self.controller.actualizar_huesped(
                 self.datos[0], nombre, apellido, telefono, password, email
             )
         else:
-            ok = self.db.agregar_huesped(
+            ok = self.controller.agregar_huesped(
                 nombre, apellido, telefono, password, email
             )
 
@@ -0,0 +1,61 @@
+# gui/indicador_carga.py
+import customtkinter as ctk
+
+
+class IndicadorCarga:
+    """Indicador "Cargando..." superpuesto al área de contenido.
+
+    Lleva la cuenta de las tareas en curso: se muestra mientras haya alguna y
+    solo si tardan más de `retardo_ms`, para no parpadear en consultas rápidas.
+    """
+
+    def __init__(self, parent, texto="Cargando...", retardo_ms=150):
+        self.parent = parent
+        self.retardo_ms = retardo_ms
+        self._activas = 0
+        self._pendiente = None
+
+        self.frame = ctk.CTkFrame(
+            parent,
+            corner_radius=12,
+            fg_color=("#FFFFFF", "#3a3a3a"),
+            border_width=2,
+            border_color=("#E0E0E0", "#4A4A4A")
+        )
+
+        ctk.CTkLabel(
+            self.frame,
+            text=texto,
+            font=("Segoe UI", 13, "bold")
+        ).pack(padx=30, pady=(15, 8))
+
+        self.barra = ctk.CTkProgressBar(self.frame, mode="indeterminate", width=180)
+        self.barra.pack(padx=30, pady=(0, 18))
+
+    def iniciar(self):
+        """Registra una tarea en curso"""
+        self._activas += 1
+        if self._activas == 1 and self.parent.winfo_exists():
+            self._pendiente = self.parent.after(self.retardo_ms, self._mostrar)
+
+    def terminar(self):
+        """Registra el fin de una tarea; se oculta al terminar la última"""
+        self._activas = max(self._activas - 1, 0)
+        if self._activas == 0:
+            self._ocultar()
+
+    def _mostrar(self):
+        self._pendiente = None
+        if not self.frame.winfo_exists():
+            return
+        self.frame.place(relx=0.5, rely=0.5, anchor="center")
+        self.frame.lift()
+        self.barra.start()
+
+    def _ocultar(self):
+        if self._pendiente is not None:
+            self.parent.after_cancel(self._pendiente)
+            self._pendiente = None
+        if self.frame.winfo_exists():
+            self.barra.stop()
+            self.frame.place_forget()
@@ -1,11 +1,11 @@
 # gui/login_window.py
 import customtkinter as ctk
 from tkinter import messagebox
-from gui.dashboard_window import DashboardWindow
 from database.db_manager import DatabaseManager
+from database.ejecutor import ejecutor_para
 from typing import Optional, Tuple
-from PIL import Image, ImageDraw
-import io
+import time
+from utils.arranque import medir_primer_frame
 
 # Configuración de tema
 ctk.set_appearance_mode("dark")
@@ -13,14 +13,14 @@ ctk.set_default_color_theme("blue")
 
 
 class LoginWindow:
-    def __init__(self, root):
+    def __init__(self, root, db: Optional[DatabaseManager] = None):
         self.root = root
         self.root.title("Sistema Hotel - Login")
         self.root.geometry("1000x650")
         self.root.resizable(False, False)
 
         # Variables
-        self.db: Optional[DatabaseManager] = None
+        self.db: Optional[DatabaseManager] = db
         self.intentos_fallidos = 0
         self.max_intentos = 3
         self.password_visible = False
@@ -35,6 +35,10 @@ class LoginWindow:
 
     def _inicializar_db(self):
         """Inicializa la conexión a la base de datos con manejo de errores"""
+        if self.db is not None:
+            # Conexión compartida creada en main.py
+            return
+
         try:
             self.db = DatabaseManager()
         except Exception as e:
@@ -357,25 +361,34 @@ class LoginWindow:
             self._bloquear_login()
             return
 
-        try:
-            empleado = self.db.validar_login(usuario, password)
+        # La consulta corre en segundo plano; el botón evita envíos repetidos
+        self.btn_login.configure(state="disabled", text="Verificando...")
+        ejecutor_para(self.db, self.root).enviar(
+            "validar_login", usuario, password,
+            al_terminar=self._resultado_login,
+            al_fallar=self._error_login,
+            dueno=self.btn_login
+        )
 
-            if empleado:
-                self._login_exitoso(empleado)
-            else:
-                self._login_fallido()
+    def _resultado_login(self, empleado):
+        """Procesa la respuesta de validar_login"""
+        self.btn_login.configure(state="normal", text="INGRESAR")
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al validar credenciales:\n{str(e)}")
+        if empleado:
+            self._login_exitoso(empleado)
+        else:
+            self._login_fallido()
+
+    def _error_login(self, e):
+        """Informa un error al validar las credenciales"""
+        self.btn_login.configure(state="normal", text="INGRESAR")
+        messagebox.showerror("Error", f"Error al validar credenciales:\n{str(e)}")
 
     def _login_exitoso(self, empleado):
         """Maneja un login exitoso"""
         empleado_id, nombre, apellido, puesto = empleado
         privilegio = self._obtener_privilegio(empleado_id)
 
-        if self.db:
-            self.db.cerrar()
-
         self.root.destroy()
         self._abrir_dashboard(nombre, apellido, puesto, privilegio)
 
@@ -397,10 +410,9 @@ class LoginWindow:
     def _obtener_privilegio(self, empleado_id: int) -> str:
         """Obtiene el privilegio del empleado"""
         try:
-            empleados = self.db.obtener_empleados()
-            for emp in empleados:
-                if emp[0] == empleado_id:
-                    return emp[7] if emp[7] else "Administrador"
+            emp = self.db.obtener_empleado_por_id(empleado_id)
+            if emp:
+                return emp[7] if emp[7] else "Administrador"
             return "Administrador"
         except Exception:
             return "Administrador"
@@ -408,16 +420,13 @@ class LoginWindow:
     def _abrir_dashboard(self, nombre: str, apellido: str, puesto: str, privilegio: str):
         """Abre la ventana del dashboard"""
         try:
+            inicio = time.perf_counter()
+            # Import diferido: el login no paga la carga del dashboard
+            from gui.dashboard_window import DashboardWindow
+
             root = ctk.CTk()
-            DashboardWindow(root, nombre, apellido, puesto, privilegio)
+            medir_primer_frame(root, "dashboard", inicio)
+            DashboardWindow(root, nombre, apellido, puesto, privilegio, self.db)
             root.mainloop()
         except Exception as e:
-            messagebox.showerror("Error", f"No se pudo abrir el dashboard:\n{str(e)}")
-
-    def __del__(self):
-        """Destructor para cerrar la conexión a la BD"""
-        if self.db:
-            try:
-                self.db.cerrar()
-            except Exception:
-                pass
\ No newline at end of file
+            messagebox.showerror("Error", f"No se pudo abrir el dashboard:\n{str(e)}")
\ No newline at end of file
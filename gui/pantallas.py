@@ -0,0 +1,92 @@
+# gui/pantallas.py
+import importlib
+import threading
+from collections import OrderedDict
+
+import customtkinter as ctk
+
+# Registro de pantallas del dashboard: nombre -> (módulo, clase).
+# El módulo se importa la primera vez que se abre la pantalla.
+PANTALLAS = {
+    "habitaciones": ("gui.habitaciones_window", "HabitacionesWindow"),
+    "empleados": ("gui.empleados_window", "EmpleadosWindow"),
+    "reservas": ("gui.reservas_window", "ReservasWindow"),
+    "huespedes": ("gui.huespedes_window", "HuespedesWindow"),
+    "reportes": ("gui.reportes_window", "ReportesWindow"),
+}
+
+
+def obtener_pantalla(nombre):
+    """Devuelve la clase de una pantalla, importando su módulo si hace falta"""
+    modulo, clase = PANTALLAS[nombre]
+    return getattr(importlib.import_module(modulo), clase)
+
+
+def precargar_pantallas(nombres=None):
+    """Importa en segundo plano los módulos de las pantallas.
+
+    Solo importa (no crea widgets), así que es seguro fuera del hilo de la
+    interfaz. Abrir una pantalla antes de que termine simplemente espera el
+    import en curso.
+    """
+    def precargar():
+        for nombre in nombres or PANTALLAS:
+            try:
+                obtener_pantalla(nombre)
+            except Exception:
+                # Si falla, el error se verá al abrir la pantalla
+                pass
+
+    hilo = threading.Thread(target=precargar, name="precarga-pantallas", daemon=True)
+    hilo.start()
+    return hilo
+
+
+class CachePantallas:
+    """Mantiene vivas las últimas pantallas abiertas del dashboard.
+
+    Cada pantalla se construye dentro de su propio marco; al cambiar de
+    sección el marco se oculta con pack_forget en lugar de destruirse. Al
+    volver a una pantalla en caché solo se recargan sus datos (refrescar()).
+    Con más de `maximo` pantallas se destruye la usada hace más tiempo.
+    """
+
+    def __init__(self, contenedor, maximo=3):
+        self.contenedor = contenedor
+        self.maximo = maximo
+        self._pantallas = OrderedDict()  # nombre -> (marco, pantalla)
+        self.actual = None
+
+    def mostrar(self, nombre, crear):
+        """Muestra la pantalla `nombre`; crear(marco) la construye si no está en caché"""
+        self.ocultar()
+
+        if nombre in self._pantallas:
+            self._pantallas.move_to_end(nombre)
+            marco, pantalla = self._pantallas[nombre]
+            marco.pack(fill="both", expand=True)
+            pantalla.refrescar()
+        else:
+            marco = ctk.CTkFrame(self.contenedor, fg_color="transparent")
+            marco.pack(fill="both", expand=True)
+            pantalla = crear(marco)
+            self._pantallas[nombre] = (marco, pantalla)
+            self._recortar()
+
+        self.actual = nombre
+        return pantalla
+
+    def ocultar(self):
+        """Oculta la pantalla visible (sigue en caché)"""
+        if self.actual in self._pantallas:
+            self._pantallas[self.actual][0].pack_forget()
+        self.actual = None
+
+    def contiene_marco(self, widget):
+        """Indica si el widget es el marco de una pantalla en caché"""
+        return any(marco is widget for marco, _ in self._pantallas.values())
+
+    def _recortar(self):
+        while len(self._pantallas) > self.maximo:
+            _, (marco, _) = self._pantallas.popitem(last=False)
+            marco.destroy()
@@ -0,0 +1,51 @@
+# gui/pool_tarjetas.py
+from typing import Callable, List
+
+
+class PoolTarjetas:
+    """Reutiliza las tarjetas de una lista en lugar de destruirlas y crearlas.
+
+    Las tarjetas se crean vacías una sola vez y se reconfiguran con los datos
+    de cada recarga; las que sobran quedan ocultas para la próxima. Tras la
+    primera carga, recargar una lista del mismo tamaño no crea widgets nuevos.
+
+    crear(parent) -> widget            crea una tarjeta vacía
+    actualizar(widget, datos)          la rellena con los datos de un elemento
+    """
+
+    def __init__(self, parent, crear: Callable, actualizar: Callable):
+        self.parent = parent
+        self.crear = crear
+        self.actualizar = actualizar
+        self._libres: List = []
+        self._en_uso: List = []
+        self._todas = set()
+
+    def obtener(self, datos):
+        """Devuelve una tarjeta con `datos` (sin colocar: pack/grid lo hace quien llama)"""
+        if self._libres:
+            card = self._libres.pop()
+        else:
+            card = self.crear(self.parent)
+            self._todas.add(card)
+        self.actualizar(card, datos)
+        self._en_uso.append(card)
+        return card
+
+    def liberar_todas(self):
+        """Oculta las tarjetas en uso y las deja disponibles"""
+        for card in self._en_uso:
+            gestor = card.winfo_manager()
+            if gestor == "pack":
+                card.pack_forget()
+            elif gestor == "grid":
+                card.grid_forget()
+            elif gestor == "place":
+                card.place_forget()
+        # Reutilizar primero las que estaban arriba: conserva el orden de apilado
+        self._libres.extend(reversed(self._en_uso))
+        self._en_uso = []
+
+    def es_tarjeta(self, widget) -> bool:
+        """Indica si el widget pertenece al pool"""
+        return widget in self._todas
@@ -0,0 +1,495 @@
+# gui/reportes_window.py
+import customtkinter as ctk
+from tkinter import filedialog, messagebox
+from datetime import date, timedelta
+from database.db_manager import DatabaseManager
+from database.ejecutor import ejecutor_para
+from database.exportador import exportar
+from database.analitica import NUMPY_DISPONIBLE, calcular_reporte
+from gui.indicador_carga import IndicadorCarga
+from utils import validaciones
+from utils.constantes import ESTADOS_RESERVA
+
+
+class ReportesWindow:
+    # Texto del combo -> (formato, extensión)
+    FORMATOS = {
+        "CSV": ("csv", ".csv"),
+        "JSON Lines": ("jsonl", ".jsonl"),
+    }
+
+    def __init__(self, parent, db=None):
+        self.parent = parent
+        self.db = db if db is not None else DatabaseManager()
+        # Exportaciones y reportes corren en un hilo de trabajo; la interfaz sigue respondiendo
+        self.ejecutor = ejecutor_para(self.db, parent)
+        self.exportando = False
+        self.calculando = False
+
+        self.COLORES = {
+            'card_bg': ("#FFFFFF", "#3a3a3a"),
+            'primary': "#3498DB",
+            'success': "#27AE60",
+        }
+
+        self._crear_interfaz()
+        self.indicador = IndicadorCarga(self.parent, "Procesando...")
+
+    def refrescar(self):
+        """Al volver a mostrar la pantalla no hay datos que recargar"""
+        pass
+
+    def _crear_interfaz(self):
+        """Crea la interfaz principal"""
+        main_container = ctk.CTkFrame(self.parent, fg_color="transparent")
+        main_container.pack(fill="both", expand=True, padx=30, pady=30)
+
+        self._crear_header(main_container)
+        self._crear_panel_indicadores(main_container)
+        self._crear_panel_exportacion(main_container)
+        if self.db.instrumentacion is not None:
+            self._crear_panel_consultas(main_container)
+
+    def _crear_header(self, parent):
+        """Crea el header con el título"""
+        header = ctk.CTkFrame(parent, fg_color="transparent")
+        header.pack(fill="x", pady=(0, 20))
+
+        ctk.CTkLabel(
+            header,
+            text="📊 Reportes",
+            font=("Segoe UI", 28, "bold"),
+            anchor="w"
+        ).pack(anchor="w")
+
+        ctk.CTkLabel(
+            header,
+            text="Ocupación, ingresos, exportación de datos y rendimiento de consultas",
+            font=("Segoe UI", 12),
+            text_color=("#7F8C8D", "#95A5A6"),
+            anchor="w"
+        ).pack(anchor="w", pady=(5, 0))
+
+    def _crear_panel_indicadores(self, parent):
+        """Crea el panel de ocupación, ADR y RevPAR por tipo de habitación"""
+        card = ctk.CTkFrame(parent, fg_color=self.COLORES['card_bg'], corner_radius=15)
+        card.pack(fill="x", pady=(0, 20))
+
+        content = ctk.CTkFrame(card, fg_color="transparent")
+        content.pack(fill="x", padx=25, pady=20)
+
+        ctk.CTkLabel(
+            content,
+            text="Ocupación e ingresos",
+            font=("Segoe UI", 16, "bold"),
+            anchor="w"
+        ).pack(anchor="w", pady=(0, 10))
+
+        if not NUMPY_DISPONIBLE:
+            ctk.CTkLabel(
+                content,
+                text="Instala NumPy (pip install numpy) para calcular los indicadores",
+                font=("Segoe UI", 12),
+                text_color=("#7F8C8D", "#95A5A6"),
+                anchor="w"
+            ).pack(anchor="w")
+            return
+
+        # Rango: por defecto el mes en curso
+        inicio_mes = date.today().replace(day=1)
+        fin_mes = (inicio_mes + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+
+        controles = ctk.CTkFrame(content, fg_color="transparent")
+        controles.pack(fill="x")
+
+        ctk.CTkLabel(controles, text="Desde:", font=("Segoe UI", 13, "bold")).pack(side="left", padx=(0, 10))
+        self.entry_reporte_desde = ctk.CTkEntry(controles, placeholder_text="AAAA-MM-DD", width=140, height=36)
+        self.entry_reporte_desde.insert(0, inicio_mes.isoformat())
+        self.entry_reporte_desde.pack(side="left")
+
+        ctk.CTkLabel(controles, text="Hasta:", font=("Segoe UI", 13, "bold")).pack(side="left", padx=(20, 10))
+        self.entry_reporte_hasta = ctk.CTkEntry(controles, placeholder_text="AAAA-MM-DD", width=140, height=36)
+        self.entry_reporte_hasta.insert(0, fin_mes.isoformat())
+        self.entry_reporte_hasta.pack(side="left")
+
+        self.btn_calcular = ctk.CTkButton(
+            controles,
+            text="📈 Calcular",
+            command=self.calcular,
+            font=("Segoe UI", 13, "bold"),
+            height=36,
+            width=140,
+            corner_radius=10,
+            fg_color=self.COLORES['primary']
+        )
+        self.btn_calcular.pack(side="left", padx=(20, 0))
+
+        self.tabla_indicadores = ctk.CTkFrame(content, fg_color="transparent")
+        self.tabla_indicadores.pack(fill="x", pady=(15, 0))
+
+    def calcular(self):
+        """Calcula los indicadores del rango en segundo plano"""
+        if self.calculando:
+            return
+
+        try:
+            desde = validaciones.fecha(self.entry_reporte_desde.get(), "desde")
+            hasta = validaciones.fecha(self.entry_reporte_hasta.get(), "hasta")
+        except ValueError as e:
+            messagebox.showerror("Fecha Inválida", str(e))
+            return
+
+        if hasta < desde:
+            messagebox.showerror("Rango Inválido", "La fecha 'hasta' es anterior a 'desde'")
+            return
+
+        self.calculando = True
+        self.btn_calcular.configure(state="disabled")
+        self.ejecutor.enviar(
+            calcular_reporte, desde, hasta,
+            al_terminar=self._mostrar_indicadores,
+            al_fallar=self._calculo_fallido,
+            dueno=self.parent,
+            indicador=self.indicador
+        )
+
+    def _mostrar_indicadores(self, reporte):
+        """Muestra la tabla resumen por tipo de habitación"""
+        self.calculando = False
+        self.btn_calcular.configure(state="normal")
+
+        for widget in self.tabla_indicadores.winfo_children():
+            widget.destroy()
+
+        encabezados = ("Tipo", "Ocupación", "ADR", "RevPAR", "Noches", "Ingresos")
+        for columna, texto in enumerate(encabezados):
+            ctk.CTkLabel(
+                self.tabla_indicadores,
+                text=texto,
+                font=("Segoe UI", 12, "bold"),
+                text_color=("#7F8C8D", "#95A5A6"),
+                anchor="w" if columna == 0 else "e",
+                width=120
+            ).grid(row=0, column=columna, sticky="ew", padx=5, pady=(0, 5))
+
+        for fila, (tipo, valores) in enumerate(reporte.resumen().items(), start=1):
+            fuente = ("Segoe UI", 12, "bold") if tipo == "Total" else ("Segoe UI", 12)
+            celdas = (
+                tipo,
+                f"{valores['ocupacion']:.1f}%",
+                f"${valores['adr']:,.2f}",
+                f"${valores['revpar']:,.2f}",
+                f"{valores['noches']:,}",
+                f"${valores['ingresos']:,.2f}",
+            )
+            for columna, texto in enumerate(celdas):
+                ctk.CTkLabel(
+                    self.tabla_indicadores,
+                    text=texto,
+                    font=fuente,
+                    anchor="w" if columna == 0 else "e",
+                    width=120
+                ).grid(row=fila, column=columna, sticky="ew", padx=5, pady=2)
+
+    def _calculo_fallido(self, error):
+        self.calculando = False
+        self.btn_calcular.configure(state="normal")
+        messagebox.showerror("Error", f"No se pudo calcular el reporte:\n\n{error}")
+
+    def _crear_panel_exportacion(self, parent):
+        """Crea el panel con los filtros y el botón de exportar"""
+        card = ctk.CTkFrame(parent, fg_color=self.COLORES['card_bg'], corner_radius=15)
+        card.pack(fill="x")
+
+        content = ctk.CTkFrame(card, fg_color="transparent")
+        content.pack(fill="x", padx=25, pady=20)
+        content.grid_columnconfigure(1, weight=1)
+
+        # Qué exportar
+        ctk.CTkLabel(content, text="Datos:", font=("Segoe UI", 13, "bold")).grid(
+            row=0, column=0, sticky="w", pady=8, padx=(0, 15))
+        self.selector_tipo = ctk.CTkSegmentedButton(
+            content,
+            values=["Reservas", "Huéspedes"],
+            command=lambda _: self._actualizar_filtros(),
+            font=("Segoe UI", 12)
+        )
+        self.selector_tipo.set("Reservas")
+        self.selector_tipo.grid(row=0, column=1, sticky="w", pady=8)
+
+        # Rango de fechas de entrada
+        ctk.CTkLabel(content, text="Entrada desde:", font=("Segoe UI", 13, "bold")).grid(
+            row=1, column=0, sticky="w", pady=8, padx=(0, 15))
+        fechas = ctk.CTkFrame(content, fg_color="transparent")
+        fechas.grid(row=1, column=1, sticky="w", pady=8)
+
+        self.entry_desde = ctk.CTkEntry(fechas, placeholder_text="AAAA-MM-DD", width=140, height=36)
+        self.entry_desde.pack(side="left")
+        ctk.CTkLabel(fechas, text="hasta", font=("Segoe UI", 12)).pack(side="left", padx=10)
+        self.entry_hasta = ctk.CTkEntry(fechas, placeholder_text="AAAA-MM-DD", width=140, height=36)
+        self.entry_hasta.pack(side="left")
+
+        # Estado
+        ctk.CTkLabel(content, text="Estado:", font=("Segoe UI", 13, "bold")).grid(
+            row=2, column=0, sticky="w", pady=8, padx=(0, 15))
+        self.combo_estado = ctk.CTkComboBox(
+            content,
+            values=["Todos", *ESTADOS_RESERVA],
+            width=180,
+            height=36,
+            state="readonly"
+        )
+        self.combo_estado.set("Todos")
+        self.combo_estado.grid(row=2, column=1, sticky="w", pady=8)
+
+        # Formato
+        ctk.CTkLabel(content, text="Formato:", font=("Segoe UI", 13, "bold")).grid(
+            row=3, column=0, sticky="w", pady=8, padx=(0, 15))
+        self.combo_formato = ctk.CTkComboBox(
+            content,
+            values=list(self.FORMATOS),
+            width=180,
+            height=36,
+            state="readonly"
+        )
+        self.combo_formato.set("CSV")
+        self.combo_formato.grid(row=3, column=1, sticky="w", pady=8)
+
+        # Acción y resultado
+        self.btn_exportar = ctk.CTkButton(
+            content,
+            text="💾 Exportar",
+            command=self.exportar,
+            font=("Segoe UI", 14, "bold"),
+            height=45,
+            width=200,
+            corner_radius=12,
+            fg_color=self.COLORES['success'],
+            hover_color="#229954"
+        )
+        self.btn_exportar.grid(row=4, column=0, columnspan=2, sticky="w", pady=(20, 5))
+
+        self.label_resultado = ctk.CTkLabel(
+            content,
+            text="",
+            font=("Segoe UI", 12),
+            text_color=("#7F8C8D", "#95A5A6"),
+            anchor="w"
+        )
+        self.label_resultado.grid(row=5, column=0, columnspan=2, sticky="w")
+
+    def _actualizar_filtros(self):
+        """Las fechas y el estado solo aplican a reservas"""
+        estado = "normal" if self.selector_tipo.get() == "Reservas" else "disabled"
+        self.entry_desde.configure(state=estado)
+        self.entry_hasta.configure(state=estado)
+        self.combo_estado.configure(state="readonly" if estado == "normal" else "disabled")
+
+    def exportar(self):
+        """Pide el archivo de destino y exporta en segundo plano"""
+        if self.exportando:
+            return
+
+        tipo = "reservas" if self.selector_tipo.get() == "Reservas" else "huespedes"
+        desde = hasta = estado = None
+
+        if tipo == "reservas":
+            try:
+                desde = self.entry_desde.get().strip() or None
+                hasta = self.entry_hasta.get().strip() or None
+                if desde:
+                    desde = validaciones.fecha(desde, "desde")
+                if hasta:
+                    hasta = validaciones.fecha(hasta, "hasta")
+            except ValueError as e:
+                messagebox.showerror("Fecha Inválida", str(e))
+                return
+
+            if desde and hasta and hasta < desde:
+                messagebox.showerror("Rango Inválido", "La fecha 'hasta' es anterior a 'desde'")
+                return
+
+            if self.combo_estado.get() != "Todos":
+                estado = self.combo_estado.get()
+
+        formato, extension = self.FORMATOS[self.combo_formato.get()]
+        ruta = filedialog.asksaveasfilename(
+            title="Guardar exportación",
+            defaultextension=extension,
+            initialfile=f"{tipo}{extension}",
+            filetypes=[(self.combo_formato.get(), f"*{extension}")]
+        )
+        if not ruta:
+            return
+
+        self.exportando = True
+        self.btn_exportar.configure(state="disabled", text="Exportando...")
+        self.label_resultado.configure(text="")
+
+        self.ejecutor.enviar(
+            exportar, tipo, ruta, formato, desde, hasta, estado,
+            al_terminar=lambda filas: self._exportacion_terminada(filas, ruta),
+            al_fallar=self._exportacion_fallida,
+            dueno=self.parent,
+            indicador=self.indicador
+        )
+
+    def _exportacion_terminada(self, filas, ruta):
+        self._reactivar()
+        self.label_resultado.configure(text=f"✓ {filas:,} filas exportadas a {ruta}")
+
+    def _exportacion_fallida(self, error):
+        self._reactivar()
+        messagebox.showerror("Error", f"No se pudo exportar:\n\n{error}")
+
+    def _reactivar(self):
+        self.exportando = False
+        self.btn_exportar.configure(state="normal", text="💾 Exportar")
+
+    def _crear_panel_consultas(self, parent):
+        """Crea el panel con las métricas de tiempo de las consultas"""
+        card = ctk.CTkFrame(parent, fg_color=self.COLORES['card_bg'], corner_radius=15)
+        card.pack(fill="x", pady=(20, 0))
+
+        content = ctk.CTkFrame(card, fg_color="transparent")
+        content.pack(fill="x", padx=25, pady=20)
+
+        ctk.CTkLabel(
+            content,
+            text="Rendimiento de consultas",
+            font=("Segoe UI", 16, "bold"),
+            anchor="w"
+        ).pack(anchor="w")
+
+        ctk.CTkLabel(
+            content,
+            text=f"Las consultas de más de {self.db.instrumentacion.umbral_ms:g} ms se anotan en "
+                 f"{self.db.instrumentacion.ruta_log or 'el registro'}",
+            font=("Segoe UI", 12),
+            text_color=("#7F8C8D", "#95A5A6"),
+            anchor="w"
+        ).pack(anchor="w", pady=(5, 10))
+
+        botones = ctk.CTkFrame(content, fg_color="transparent")
+        botones.pack(fill="x")
+
+        ctk.CTkButton(
+            botones,
+            text="🔍 Ver métricas",
+            command=lambda: VentanaMetricas(self.parent, self.db.instrumentacion),
+            font=("Segoe UI", 13, "bold"),
+            height=36,
+            width=160,
+            corner_radius=10,
+            fg_color=self.COLORES['primary']
+        ).pack(side="left")
+
+        ctk.CTkButton(
+            botones,
+            text="💾 Guardar métricas",
+            command=self.guardar_metricas,
+            font=("Segoe UI", 13, "bold"),
+            height=36,
+            width=180,
+            corner_radius=10,
+            fg_color=self.COLORES['success'],
+            hover_color="#229954"
+        ).pack(side="left", padx=(15, 0))
+
+        self.label_metricas = ctk.CTkLabel(
+            content,
+            text="",
+            font=("Segoe UI", 12),
+            text_color=("#7F8C8D", "#95A5A6"),
+            anchor="w"
+        )
+        self.label_metricas.pack(anchor="w", pady=(10, 0))
+
+    def guardar_metricas(self):
+        """Guarda las métricas acumuladas en un JSON junto al registro de consultas"""
+        try:
+            ruta = self.db.instrumentacion.volcar()
+        except OSError as e:
+            messagebox.showerror("Error", f"No se pudieron guardar las métricas:\n\n{e}")
+            return
+        self.label_metricas.configure(text=f"✓ Métricas guardadas en {ruta}")
+
+
+class VentanaMetricas:
+    """Tabla con las métricas por método de DatabaseManager"""
+
+    COLUMNAS = (
+        ("Método", None),
+        ("Llamadas", "llamadas"),
+        ("Media (ms)", "media_ms"),
+        ("p95 (ms)", "p95_ms"),
+        ("Máximo (ms)", "maximo_ms"),
+        ("Filas/llamada", "filas_por_llamada"),
+        ("Errores", "errores"),
+    )
+
+    def __init__(self, parent, instrumentacion):
+        self.instrumentacion = instrumentacion
+
+        self.ventana = ctk.CTkToplevel(parent)
+        self.ventana.title("Rendimiento de consultas")
+        self.ventana.geometry("900x600")
+        self.ventana.transient(parent)
+
+        container = ctk.CTkFrame(self.ventana, fg_color="transparent")
+        container.pack(fill="both", expand=True, padx=20, pady=20)
+
+        encabezado = ctk.CTkFrame(container, fg_color="transparent")
+        encabezado.pack(fill="x", pady=(0, 10))
+
+        self.label_periodo = ctk.CTkLabel(encabezado, text="", font=("Segoe UI", 12), anchor="w")
+        self.label_periodo.pack(side="left")
+
+        ctk.CTkButton(
+            encabezado,
+            text="🔄 Actualizar",
+            command=self.actualizar,
+            font=("Segoe UI", 12, "bold"),
+            height=32,
+            width=120,
+            corner_radius=8
+        ).pack(side="right")
+
+        self.tabla = ctk.CTkScrollableFrame(container, fg_color="transparent")
+        self.tabla.pack(fill="both", expand=True)
+
+        self.actualizar()
+
+    def actualizar(self):
+        """Vuelve a leer las métricas"""
+        for widget in self.tabla.winfo_children():
+            widget.destroy()
+
+        resumen = self.instrumentacion.resumen()
+        self.label_periodo.configure(
+            text=f"Desde {self.instrumentacion.desde:%Y-%m-%d %H:%M} · "
+                 f"{sum(m['llamadas'] for m in resumen.values()):,} llamadas (ordenado por tiempo total)"
+        )
+
+        for columna, (texto, _) in enumerate(self.COLUMNAS):
+            ctk.CTkLabel(
+                self.tabla,
+                text=texto,
+                font=("Segoe UI", 12, "bold"),
+                text_color=("#7F8C8D", "#95A5A6"),
+                anchor="w" if columna == 0 else "e"
+            ).grid(row=0, column=columna, sticky="ew", padx=8, pady=(0, 5))
+
+        for fila, (metodo, valores) in enumerate(resumen.items(), start=1):
+            for columna, (_, clave) in enumerate(self.COLUMNAS):
+                if clave is None:
+                    texto = metodo
+                else:
+                    valor = valores[clave]
+                    texto = "-" if valor is None else (f"{valor:,}" if isinstance(valor, int) else f"{valor:,.2f}")
+                ctk.CTkLabel(
+                    self.tabla,
+                    text=texto,
+                    font=("Segoe UI", 12),
+                    anchor="w" if columna == 0 else "e"
+                ).grid(row=fila, column=columna, sticky="ew", padx=8, pady=1)
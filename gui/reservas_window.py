@@ -3,18 +3,34 @@ import customtkinter as ctk
 from tkinter import messagebox
 from datetime import datetime, timedelta
 from database.db_manager import DatabaseManager
+from database.ejecutor import ejecutor_para
+from controllers.habitaciones_controller import HabitacionesController
+from controllers.reservas_controller import ReservasController
+from gui.busqueda import BusquedaIncremental
+from gui.indicador_carga import IndicadorCarga
+from gui.pool_tarjetas import PoolTarjetas
+from concurrent.futures import Future
 from typing import Optional, List, Tuple
 
 
 class ReservasWindow:
-    def __init__(self, parent, privilegio="Empleado"):
+    # Reservas por página; la siguiente se pide al acercarse al final del scroll
+    TAMANO_PAGINA = 40
+
+    def __init__(self, parent, privilegio="Empleado", db=None):
         self.parent = parent
         self.privilegio = privilegio
-        self.db = DatabaseManager()
+        self.db = db if db is not None else DatabaseManager()
+        self.controller = ReservasController.para(self.db)
+        # Las consultas corren en un hilo de trabajo; los resultados vuelven por after()
+        self.ejecutor = ejecutor_para(self.db, parent)
 
         # Variables
         self.reserva_seleccionada = None
         self.filtro_estado = "Todas"
+        self.cursor_pagina = None   # (fecha_entrada, id) de la última reserva mostrada
+        self.hay_mas = False
+        self.btn_cargar_mas = None
 
         # Colores consistentes con el diseño
         self.COLORES = {
@@ -46,6 +62,9 @@ class ReservasWindow:
         # Grid de reservas
         self._crear_grid_reservas(main_container)
 
+        # Indicador mientras hay consultas en curso
+        self.indicador = IndicadorCarga(main_container, "Cargando reservas...")
+
     def _crear_header(self, parent):
         """Crea el header con título y botón principal"""
         header = ctk.CTkFrame(parent, fg_color="transparent")
@@ -120,7 +139,16 @@ class ReservasWindow:
             corner_radius=10
         )
         self.entry_buscar.pack(side="left")
-        self.entry_buscar.bind('<KeyRelease>', lambda e: self.aplicar_filtros())
+
+        # Búsqueda con debounce y refinamiento sobre los resultados anteriores
+        self.busqueda = BusquedaIncremental(
+            self.entry_buscar,
+            obtener=self._buscar_reservas,
+            coincide=self._coincide_busqueda,
+            mostrar=self._mostrar_resultados,
+            limite=self.TAMANO_PAGINA,
+            ejecutor=self.ejecutor
+        )
 
         # Filtro por estado
         ctk.CTkLabel(
@@ -226,78 +254,170 @@ class ReservasWindow:
         )
         self.scroll_frame.pack(fill="both", expand=True)
 
+        # Tarjetas reutilizables entre recargas
+        self.pool_tarjetas = PoolTarjetas(
+            self.scroll_frame,
+            crear=self._crear_tarjeta_reserva,
+            actualizar=self._actualizar_tarjeta_reserva
+        )
+
+        # Interceptar la posición del scroll para pedir la siguiente página
+        # (CTkScrollableFrame no expone un evento propio para esto)
+        self.scroll_frame._parent_canvas.configure(yscrollcommand=self._al_desplazar)
+
+    def _al_desplazar(self, inicio, fin):
+        """Actualiza el scrollbar y carga más reservas cerca del final"""
+        self.scroll_frame._scrollbar.set(inicio, fin)
+        if self.hay_mas and float(fin) > 0.9:
+            # Fuera del callback de scroll: dibujar aquí volvería a dispararlo
+            self.hay_mas = False
+            self.scroll_frame.after_idle(self._cargar_pagina_siguiente)
+
+    def refrescar(self):
+        """Recarga los datos al volver a mostrar la pantalla (caché del dashboard)"""
+        self.cargar_reservas()
+
     def cargar_reservas(self):
         """Carga y muestra las reservas"""
-        # Limpiar grid
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
+        self.busqueda.refrescar()
+
+    def _buscar_reservas(self, busqueda: str) -> Future:
+        """Pide la primera página de reservas filtrada en la BD"""
+        return self._obtener_pagina(busqueda)
+
+    def _obtener_pagina(self, busqueda: str, despues_de=None, al_terminar=None) -> Future:
+        """Pide a la BD la página siguiente a despues_de con los filtros actuales"""
+        return self.ejecutor.enviar(
+            "obtener_reservas_pagina",
+            limite=self.TAMANO_PAGINA,
+            despues_de=despues_de,
+            estado=self._estado_filtro(),
+            texto=busqueda,
+            al_terminar=al_terminar,
+            dueno=self.scroll_frame,
+            indicador=self.indicador
+        )
 
-        # Obtener reservas
-        reservas = self.db.obtener_reservas()
+    def _estado_filtro(self) -> Optional[str]:
+        estado = self.combo_filtro_estado.get()
+        return None if estado == "Todas" else estado
 
-        if not reservas:
-            self._mostrar_mensaje_vacio()
-            return
+    def _coincide_busqueda(self, reserva: Tuple, busqueda: str) -> bool:
+        """Filtro en memoria usado al refinar una búsqueda"""
+        return busqueda in reserva[2].lower() or busqueda in str(reserva[4]).lower()
 
-        # Aplicar filtros
-        reservas_filtradas = self._filtrar_reservas(reservas)
+    def _mostrar_resultados(self, reservas: List[Tuple]):
+        """Muestra las reservas encontradas o el mensaje correspondiente"""
+        # Limpiar lista: las tarjetas vuelven al pool, el resto se destruye
+        self.pool_tarjetas.liberar_todas()
+        for widget in self.scroll_frame.winfo_children():
+            if not self.pool_tarjetas.es_tarjeta(widget):
+                widget.destroy()
+        self.btn_cargar_mas = None
+        self.hay_mas = False
+        self.scroll_frame._parent_canvas.yview_moveto(0)
 
-        if not reservas_filtradas:
-            self._mostrar_mensaje_sin_resultados()
+        if not reservas:
+            self._mostrar_mensaje_sin_reservas()
             return
 
         # Mostrar reservas
-        self._mostrar_reservas_lista(reservas_filtradas)
-
-    def _filtrar_reservas(self, reservas: List[Tuple]) -> List[Tuple]:
-        """Filtra las reservas según criterios"""
-        busqueda = self.entry_buscar.get().strip().lower()
-        estado_filtro = self.combo_filtro_estado.get()
-
-        reservas_filtradas = []
+        self._agregar_pagina(reservas)
 
-        for reserva in reservas:
-            # reserva = (id, huesped_id, huesped_nombre, habitacion_id,
-            #            habitacion_numero, tipo, fecha_entrada, fecha_salida, estado, total)
-            huesped = reserva[2].lower()
-            habitacion = str(reserva[4]).lower()
-            estado = reserva[8]
-
-            # Aplicar filtros
-            coincide_busqueda = busqueda in huesped or busqueda in habitacion if busqueda else True
-            coincide_estado = estado == estado_filtro if estado_filtro != "Todas" else True
+    def cargar_mas(self):
+        """Agrega la siguiente página de reservas al final de la lista"""
+        if not self.hay_mas:
+            return
+        # Evita pedir la misma página dos veces mientras se dibuja
+        self.hay_mas = False
+        self._cargar_pagina_siguiente()
+
+    def _mostrar_mensaje_sin_reservas(self):
+        """Muestra el mensaje de lista vacía o de búsqueda sin resultados"""
+        texto = BusquedaIncremental.normalizar(self.entry_buscar.get())
+        if not (texto or self._estado_filtro()):
+            self._mostrar_mensaje_vacio()
+            return
 
-            if coincide_busqueda and coincide_estado:
-                reservas_filtradas.append(reserva)
+        generacion = self.busqueda.generacion
 
-        return reservas_filtradas
+        def mostrar(existentes):
+            # Otra búsqueda ya reemplazó a esta
+            if generacion != self.busqueda.generacion:
+                return
+            if existentes:
+                self._mostrar_mensaje_sin_resultados()
+            else:
+                self._mostrar_mensaje_vacio()
+
+        self.ejecutor.enviar("obtener_reservas_pagina", limite=1,
+                             al_terminar=mostrar, dueno=self.scroll_frame)
+
+    def _cargar_pagina_siguiente(self):
+        """Pide la página que sigue al cursor y la agrega a la lista"""
+        texto = BusquedaIncremental.normalizar(self.entry_buscar.get())
+        generacion = self.busqueda.generacion
+
+        def agregar(reservas):
+            # Si cambió la búsqueda mientras tanto, esta página ya no corresponde
+            if generacion == self.busqueda.generacion:
+                self._agregar_pagina(reservas)
+
+        self._obtener_pagina(texto, self.cursor_pagina, al_terminar=agregar)
+
+    def _agregar_pagina(self, reservas: List[Tuple]):
+        """Dibuja una página de reservas y actualiza el cursor"""
+        if self.btn_cargar_mas is not None:
+            self.btn_cargar_mas.destroy()
+            self.btn_cargar_mas = None
+
+        self._mostrar_reservas_lista(reservas)
+
+        if reservas:
+            # reserva = (id, ..., fecha_entrada, ...): clave de la página siguiente
+            self.cursor_pagina = (reservas[-1][6], reservas[-1][0])
+        self.hay_mas = len(reservas) >= self.TAMANO_PAGINA
+
+        if self.hay_mas:
+            self.btn_cargar_mas = ctk.CTkButton(
+                self.scroll_frame,
+                text="Cargar más reservas",
+                command=self.cargar_mas,
+                height=36,
+                font=("Segoe UI", 12),
+                fg_color="transparent",
+                border_width=2,
+                border_color=self.COLORES['primary'],
+                text_color=self.COLORES['primary'],
+                hover_color=("#EBF5FB", "#2C3E50"),
+                corner_radius=10
+            )
+            self.btn_cargar_mas.pack(pady=(8, 16))
 
     def _mostrar_reservas_lista(self, reservas: List[Tuple]):
         """Muestra las reservas en formato de lista de tarjetas"""
         for reserva in reservas:
-            card = self._crear_tarjeta_reserva(reserva)
+            card = self.pool_tarjetas.obtener(reserva)
             card.pack(fill="x", pady=8)
 
-    def _crear_tarjeta_reserva(self, datos: Tuple):
-        """Crea una tarjeta visual para una reserva"""
-        (reserva_id, huesped_id, huesped_nombre, habitacion_id,
-         habitacion_numero, tipo, fecha_entrada, fecha_salida, estado, total) = datos
-
+    def _crear_tarjeta_reserva(self, parent):
+        """Crea una tarjeta de reserva vacía (se rellena con _actualizar_tarjeta_reserva)"""
         # Frame principal de la tarjeta
         card = ctk.CTkFrame(
-            self.scroll_frame,
+            parent,
             fg_color=self.COLORES['card_bg'],
             corner_radius=15,
             border_width=2,
             border_color=("#E0E0E0", "#4A4A4A")
         )
+        card.datos = None
 
         # Hover effect
         card.bind("<Enter>", lambda e: card.configure(border_color=self.COLORES['primary']))
         card.bind("<Leave>", lambda e: card.configure(border_color=("#E0E0E0", "#4A4A4A")))
 
         # Click para seleccionar
-        card.bind("<Button-1>", lambda e: self._seleccionar_reserva(datos, card))
+        card.bind("<Button-1>", lambda e: self._seleccionar_reserva(card.datos, card))
 
         # Container interno
         content = ctk.CTkFrame(card, fg_color="transparent")
@@ -316,41 +436,44 @@ class ReservasWindow:
         header_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
         header_frame.pack(anchor="w", pady=(0, 8))
 
-        ctk.CTkLabel(
+        card.id_label = ctk.CTkLabel(
             header_frame,
-            text=f"#{reserva_id}",
+            text="",
             font=("Segoe UI", 14, "bold"),
             text_color=("#7F8C8D", "#95A5A6")
-        ).pack(side="left", padx=(0, 15))
+        )
+        card.id_label.pack(side="left", padx=(0, 15))
 
         # Badge de estado
-        badge = ctk.CTkLabel(
+        card.badge = ctk.CTkLabel(
             header_frame,
-            text=self._get_texto_estado(estado),
+            text="",
             font=("Segoe UI", 9, "bold"),
-            fg_color=self.COLORES.get(estado, "#95A5A6"),
+            fg_color="#95A5A6",
             corner_radius=6,
             padx=12,
             pady=4
         )
-        badge.pack(side="left")
+        card.badge.pack(side="left")
 
         # Nombre del huésped
-        ctk.CTkLabel(
+        card.huesped_label = ctk.CTkLabel(
             info_frame,
-            text=f"👤 {huesped_nombre}",
+            text="",
             font=("Segoe UI", 16, "bold"),
             anchor="w"
-        ).pack(anchor="w", pady=(0, 5))
+        )
+        card.huesped_label.pack(anchor="w", pady=(0, 5))
 
         # Habitación
-        ctk.CTkLabel(
+        card.habitacion_label = ctk.CTkLabel(
             info_frame,
-            text=f"🛏️ Habitación #{habitacion_numero} - {tipo}",
+            text="",
             font=("Segoe UI", 12),
             text_color=("#7F8C8D", "#95A5A6"),
             anchor="w"
-        ).pack(anchor="w")
+        )
+        card.habitacion_label.pack(anchor="w")
 
         # === COLUMNA 2: Fechas ===
         fechas_frame = ctk.CTkFrame(content, fg_color="transparent")
@@ -367,11 +490,12 @@ class ReservasWindow:
             text_color=("#95A5A6", "#7F8C8D")
         ).pack(anchor="w")
 
-        ctk.CTkLabel(
+        card.entrada_label = ctk.CTkLabel(
             checkin_frame,
-            text=fecha_entrada,
+            text="",
             font=("Segoe UI", 12, "bold")
-        ).pack(anchor="w")
+        )
+        card.entrada_label.pack(anchor="w")
 
         # Check-out
         checkout_frame = ctk.CTkFrame(fechas_frame, fg_color="transparent")
@@ -384,11 +508,12 @@ class ReservasWindow:
             text_color=("#95A5A6", "#7F8C8D")
         ).pack(anchor="w")
 
-        ctk.CTkLabel(
+        card.salida_label = ctk.CTkLabel(
             checkout_frame,
-            text=fecha_salida,
+            text="",
             font=("Segoe UI", 12, "bold")
-        ).pack(anchor="w")
+        )
+        card.salida_label.pack(anchor="w")
 
         # === COLUMNA 3: Total y Acciones ===
         acciones_frame = ctk.CTkFrame(content, fg_color="transparent")
@@ -405,49 +530,70 @@ class ReservasWindow:
             text_color=("#95A5A6", "#7F8C8D")
         ).pack()
 
-        ctk.CTkLabel(
+        card.total_label = ctk.CTkLabel(
             total_frame,
-            text=f"${total:,.2f}" if total else "$0.00",
+            text="",
             font=("Segoe UI", 18, "bold"),
             text_color=self.COLORES['success']
-        ).pack()
+        )
+        card.total_label.pack()
 
-        # Botones de acción (solo para reservas activas)
-        if estado == "activa":
-            botones_frame = ctk.CTkFrame(acciones_frame, fg_color="transparent")
-            botones_frame.pack()
-
-            # Botón Check-out
-            btn_checkout = ctk.CTkButton(
-                botones_frame,
-                text="✅ Check-out",
-                command=lambda: self.hacer_checkout(datos),
+        # Botones de acción (se muestran solo para reservas activas)
+        card.botones_frame = ctk.CTkFrame(acciones_frame, fg_color="transparent")
+
+        # Botón Check-out
+        btn_checkout = ctk.CTkButton(
+            card.botones_frame,
+            text="✅ Check-out",
+            command=lambda: self.hacer_checkout(card.datos),
+            height=35,
+            width=120,
+            font=("Segoe UI", 11, "bold"),
+            corner_radius=8,
+            fg_color=self.COLORES['primary'],
+            hover_color="#2980B9"
+        )
+        btn_checkout.pack(pady=2)
+
+        # Botón Cancelar (solo admin)
+        if self.privilegio == "Administrador":
+            btn_cancelar = ctk.CTkButton(
+                card.botones_frame,
+                text="❌ Cancelar",
+                command=lambda: self.cancelar_reserva(card.datos),
                 height=35,
                 width=120,
                 font=("Segoe UI", 11, "bold"),
                 corner_radius=8,
-                fg_color=self.COLORES['primary'],
-                hover_color="#2980B9"
+                fg_color=self.COLORES['danger'],
+                hover_color="#C0392B"
             )
-            btn_checkout.pack(pady=2)
-
-            # Botón Cancelar (solo admin)
-            if self.privilegio == "Administrador":
-                btn_cancelar = ctk.CTkButton(
-                    botones_frame,
-                    text="❌ Cancelar",
-                    command=lambda: self.cancelar_reserva(datos),
-                    height=35,
-                    width=120,
-                    font=("Segoe UI", 11, "bold"),
-                    corner_radius=8,
-                    fg_color=self.COLORES['danger'],
-                    hover_color="#C0392B"
-                )
-                btn_cancelar.pack(pady=2)
+            btn_cancelar.pack(pady=2)
 
         return card
 
+    def _actualizar_tarjeta_reserva(self, card, datos: Tuple):
+        """Rellena una tarjeta de reserva con los datos de una reserva"""
+        (reserva_id, huesped_id, huesped_nombre, habitacion_id,
+         habitacion_numero, tipo, fecha_entrada, fecha_salida, estado, total) = datos
+
+        card.datos = datos
+        card.id_label.configure(text=f"#{reserva_id}")
+        card.badge.configure(
+            text=self._get_texto_estado(estado),
+            fg_color=self.COLORES.get(estado, "#95A5A6")
+        )
+        card.huesped_label.configure(text=f"👤 {huesped_nombre}")
+        card.habitacion_label.configure(text=f"🛏️ Habitación #{habitacion_numero} - {tipo}")
+        card.entrada_label.configure(text=fecha_entrada)
+        card.salida_label.configure(text=fecha_salida)
+        card.total_label.configure(text=f"${total:,.2f}" if total else "$0.00")
+
+        if estado == "activa":
+            card.botones_frame.pack()
+        else:
+            card.botones_frame.pack_forget()
+
     def _get_texto_estado(self, estado: str) -> str:
         """Retorna el texto formateado del estado"""
         estados = {
@@ -547,7 +693,7 @@ class ReservasWindow:
         )
 
         if respuesta:
-            self.db.finalizar_reserva(reserva_id)
+            self.controller.finalizar_reserva(reserva_id)
             messagebox.showinfo(
                 "Éxito",
                 "Check-out realizado correctamente.\nHabitación en limpieza."
@@ -585,7 +731,7 @@ class ReservasWindow:
         )
 
         if respuesta:
-            self.db.cancelar_reserva(reserva_id)
+            self.controller.cancelar_reserva(reserva_id)
             messagebox.showinfo("Éxito", "Reserva cancelada correctamente")
             self.cargar_reservas()
 
@@ -593,6 +739,7 @@ class ReservasWindow:
 class FormularioReserva:
     def __init__(self, parent, db, callback_refrescar):
         self.db = db
+        self.ejecutor = ejecutor_para(db, parent)
         self.callback_refrescar = callback_refrescar
 
         # Variables
@@ -776,19 +923,9 @@ class FormularioReserva:
             anchor="w"
         ).pack(anchor="w", pady=(0, 8))
 
-        # Cargar habitaciones disponibles
-        self.habitaciones_disponibles = self.db.obtener_habitaciones_disponibles()
-        opciones_hab = [
-            f"#{hab[1]} - {hab[2]} - ${hab[3]:,.2f}/noche"
-            for hab in self.habitaciones_disponibles
-        ]
-
-        if not opciones_hab:
-            opciones_hab = ["⚠️ No hay habitaciones disponibles"]
-
         self.combo_habitacion = ctk.CTkComboBox(
             parent,
-            values=opciones_hab,
+            values=[],
             height=50,
             font=("Segoe UI", 13),
             corner_radius=12,
@@ -798,14 +935,60 @@ class FormularioReserva:
         )
         self.combo_habitacion.pack(fill="x", pady=(0, 20))
 
-        if opciones_hab and opciones_hab[0] != "⚠️ No hay habitaciones disponibles":
-            self.combo_habitacion.set(opciones_hab[0])
+        # Cargar habitaciones libres para las fechas por defecto (hoy -> mañana)
+        hoy = datetime.now().date()
+        self._actualizar_habitaciones(hoy, hoy + timedelta(days=1))
+
+        if self.habitaciones_disponibles:
             # Trigger inicial del cálculo
             self.ventana.after(500, self.calcular_total_automatico)
 
         # Bind para recalcular cuando cambie la habitación
         self.combo_habitacion.configure(command=lambda e: self.calcular_total_automatico())
 
+    def _actualizar_habitaciones(self, fecha_entrada, fecha_salida):
+        """Carga las habitaciones libres en el rango y conserva la selección si sigue libre"""
+        seleccion_actual = self._habitacion_seleccionada()
+
+        if fecha_salida > fecha_entrada:
+            self.habitaciones_disponibles = HabitacionesController.para(self.db).disponibles_en(
+                fecha_entrada.strftime("%Y-%m-%d"),
+                fecha_salida.strftime("%Y-%m-%d")
+            )
+        else:
+            self.habitaciones_disponibles = []
+
+        self.opciones_habitacion = [
+            f"#{hab[1]} - {hab[2]} - ${hab[3]:,.2f}/noche"
+            for hab in self.habitaciones_disponibles
+        ]
+
+        if not self.opciones_habitacion:
+            self.combo_habitacion.configure(values=["⚠️ No hay habitaciones disponibles"])
+            self.combo_habitacion.set("⚠️ No hay habitaciones disponibles")
+            return
+
+        self.combo_habitacion.configure(values=self.opciones_habitacion)
+
+        ids = [hab[0] for hab in self.habitaciones_disponibles]
+        if seleccion_actual and seleccion_actual[0] in ids:
+            self.combo_habitacion.set(self.opciones_habitacion[ids.index(seleccion_actual[0])])
+        else:
+            self.combo_habitacion.set(self.opciones_habitacion[0])
+
+    def _habitacion_seleccionada(self):
+        """Devuelve la habitación elegida en el combo (o None)"""
+        opciones = getattr(self, 'opciones_habitacion', [])
+        valor = self.combo_habitacion.get()
+        if valor not in opciones:
+            return None
+        return self.habitaciones_disponibles[opciones.index(valor)]
+
+    def _al_cambiar_fechas(self):
+        """Recalcula habitaciones libres y total cuando cambian las fechas"""
+        self._actualizar_habitaciones(self.date_entrada.get_date(), self.date_salida.get_date())
+        self.calcular_total_automatico()
+
     def _crear_campos_fechas(self, parent):
         """Crea los campos de fechas con calendarios"""
         from tkcalendar import DateEntry
@@ -840,7 +1023,7 @@ class FormularioReserva:
             font=("Segoe UI", 12)
         )
         self.date_entrada.pack(fill="x")
-        self.date_entrada.bind("<<DateEntrySelected>>", lambda e: self.calcular_total_automatico())
+        self.date_entrada.bind("<<DateEntrySelected>>", lambda e: self._al_cambiar_fechas())
 
         # Check-out
         checkout_frame = ctk.CTkFrame(fechas_container, fg_color="transparent")
@@ -864,7 +1047,7 @@ class FormularioReserva:
             font=("Segoe UI", 12)
         )
         self.date_salida.pack(fill="x")
-        self.date_salida.bind("<<DateEntrySelected>>", lambda e: self.calcular_total_automatico())
+        self.date_salida.bind("<<DateEntrySelected>>", lambda e: self._al_cambiar_fechas())
 
     def _crear_seccion_total(self, parent):
         """Crea la sección de visualización del total"""
@@ -908,7 +1091,7 @@ class FormularioReserva:
         frame_botones.pack(fill="x", pady=(20, 0))
 
         # Botón Guardar
-        btn_guardar = ctk.CTkButton(
+        self.btn_guardar = btn_guardar = ctk.CTkButton(
             frame_botones,
             text="💾 Guardar Reserva",
             command=self.guardar,
@@ -1045,11 +1228,10 @@ class FormularioReserva:
                 return
 
             # Obtener habitación
-            indice = self.combo_habitacion.current()
-            if indice < 0 or indice >= len(self.habitaciones_disponibles):
+            habitacion = self._habitacion_seleccionada()
+            if habitacion is None:
                 return
 
-            habitacion = self.habitaciones_disponibles[indice]
             precio_noche = habitacion[3]
 
             # Obtener fechas del DateEntry
@@ -1100,9 +1282,9 @@ class FormularioReserva:
             self.entry_buscar.focus()
             return
 
-        # Validar habitación
-        if (not self.combo_habitacion.get() or
-                self.combo_habitacion.get() == "⚠️ No hay habitaciones disponibles"):
+        # Validar habitación (el combo es editable: el texto puede no ser ninguna)
+        habitacion = self._habitacion_seleccionada()
+        if habitacion is None:
             messagebox.showerror(
                 "Campo Requerido",
                 "Debe seleccionar una habitación"
@@ -1124,21 +1306,31 @@ class FormularioReserva:
         fecha_salida = self.date_salida.get_date().strftime("%Y-%m-%d")
 
         # Obtener IDs
-        indice = self.combo_habitacion.current()
-        habitacion_id = self.habitaciones_disponibles[indice][0]
-        habitacion_numero = self.habitaciones_disponibles[indice][1]
+        habitacion_id = habitacion[0]
+        habitacion_numero = habitacion[1]
         huesped_id = self.huesped_seleccionado[0]
         huesped_nombre = f"{self.huesped_seleccionado[1]} {self.huesped_seleccionado[2]}"
 
-        # Guardar en base de datos
-        exito = self.db.agregar_reserva(
+        # Guardar en base de datos (en segundo plano; el botón evita doble envío)
+        self.btn_guardar.configure(state="disabled", text="Guardando...")
+        self.ejecutor.enviar(
+            "agregar_reserva",
             huesped_id,
             habitacion_id,
             fecha_entrada,
             fecha_salida,
-            self.total_calculado
+            self.total_calculado,
+            al_terminar=lambda exito: self._reserva_guardada(
+                exito, huesped_nombre, habitacion_numero, fecha_entrada, fecha_salida),
+            al_fallar=lambda error: self._reserva_guardada(
+                False, huesped_nombre, habitacion_numero, fecha_entrada, fecha_salida),
+            dueno=self.ventana
         )
 
+    def _reserva_guardada(self, exito, huesped_nombre, habitacion_numero, fecha_entrada, fecha_salida):
+        """Informa el resultado de guardar la reserva"""
+        self.btn_guardar.configure(state="normal", text="💾 Guardar Reserva")
+
         if exito:
             messagebox.showinfo(
                 "✓ Reserva Creada",
@@ -1,10 +1,35 @@
+import sys
+
+# Los modelos (models/) usan @dataclass(slots=True)
+if sys.version_info < (3, 10):
+    sys.exit("Se requiere Python 3.10 o superior")
+
+from utils.arranque import medir_primer_frame
 import tkinter as tk
+from tkinter import messagebox
+from database.conexiones import GestorConexiones
 from gui.login_window import LoginWindow
 
 def main():
     root = tk.Tk()
-    app = LoginWindow(root)
-    root.mainloop()
+    medir_primer_frame(root, "login")
+
+    # Una sola conexión para todo el proceso, compartida por todas las ventanas
+    try:
+        gestor = GestorConexiones()
+    except Exception as e:
+        messagebox.showerror(
+            "Error de Conexión",
+            f"No se pudo conectar a la base de datos:\n{str(e)}"
+        )
+        root.destroy()
+        return
+
+    try:
+        app = LoginWindow(root, gestor.db)
+        root.mainloop()
+    finally:
+        gestor.cerrar()
 
 if __name__ == '__main__':
     main()
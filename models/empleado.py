@@ -0,0 +1,18 @@
+# models/empleado.py
+from dataclasses import dataclass
+from typing import Optional
+
+from models.registro import Registro
+
+
+@dataclass(frozen=True, slots=True)
+class Empleado(Registro):
+    """Fila de empleados"""
+    id: int
+    nombre: str
+    apellido: str
+    puesto: str
+    telefono: Optional[str]
+    usuario: Optional[str]
+    password: Optional[str]
+    privilegio: Optional[str]
@@ -0,0 +1,14 @@
+# models/habitacion.py
+from dataclasses import dataclass
+
+from models.registro import Registro
+
+
+@dataclass(frozen=True, slots=True)
+class Habitacion(Registro):
+    """Fila de habitaciones"""
+    id: int
+    numero: str
+    tipo: str
+    precio: float
+    estado: str
@@ -0,0 +1,20 @@
+# models/huesped.py
+from dataclasses import dataclass
+from typing import Optional
+
+from models.registro import Registro
+
+
+@dataclass(frozen=True, slots=True)
+class Huesped(Registro):
+    """Fila de huespedes"""
+    id: int
+    nombre: str
+    apellido: str
+    telefono: Optional[str]
+    password: Optional[str]
+    email: Optional[str]
+
+    @property
+    def nombre_completo(self) -> str:
+        return f"{self.nombre} {self.apellido}"
@@ -0,0 +1,40 @@
+# models/registro.py
+
+
+class Registro:
+    """Base de los modelos: construcción desde filas de sqlite y acceso por posición.
+
+    Los modelos son dataclasses con __slots__ (sin __dict__ por instancia).
+    Se pueden usar como row_factory de un cursor (desde_fila) o convertir una
+    lista de filas de una vez (lista). Mientras la interfaz migra a atributos,
+    siguen aceptando índices y desempaquetado como las tuplas: hab[3],
+    `id, nombre, *_ = huesped`.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def desde_fila(cls, cursor, fila):
+        """row_factory de sqlite3: cursor.row_factory = Modelo.desde_fila"""
+        return cls(*fila)
+
+    @classmethod
+    def uno(cls, fila):
+        """Convierte una fila (o None) en modelo"""
+        return cls(*fila) if fila is not None else None
+
+    @classmethod
+    def lista(cls, filas):
+        """Convierte una lista de filas (tuplas) en modelos"""
+        return [cls(*fila) for fila in filas]
+
+    def __getitem__(self, indice):
+        campos = self.__slots__[indice]
+        if isinstance(indice, slice):
+            return tuple(getattr(self, campo) for campo in campos)
+        return getattr(self, campos)
+
+    def __iter__(self):
+        return (getattr(self, campo) for campo in self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
@@ -0,0 +1,32 @@
+# models/reserva.py
+from dataclasses import dataclass
+from typing import Optional
+
+from models.registro import Registro
+
+
+@dataclass(frozen=True, slots=True)
+class Reserva(Registro):
+    """Fila de reservaciones"""
+    id: int
+    huesped_id: int
+    habitacion_id: int
+    fecha_entrada: str
+    fecha_salida: str
+    estado: str
+    total: Optional[float]
+
+
+@dataclass(frozen=True, slots=True)
+class ReservaDetalle(Registro):
+    """Reserva con el nombre del huésped y los datos de la habitación (listados)"""
+    id: int
+    huesped_id: int
+    huesped: str
+    habitacion_id: int
+    habitacion: str
+    tipo: str
+    fecha_entrada: str
+    fecha_salida: str
+    estado: str
+    total: Optional[float]
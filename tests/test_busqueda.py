@@ -0,0 +1,66 @@
+"""Búsqueda incremental (gui/busqueda.py) sin ventana: el entry es un doble mínimo"""
+import unittest
+from concurrent.futures import Future
+
+from gui.busqueda import BusquedaIncremental
+
+
+class _Entry:
+    def __init__(self, texto=""):
+        self.texto = texto
+
+    def get(self):
+        return self.texto
+
+    def bind(self, secuencia, funcion):
+        pass
+
+
+class _Ejecutor:
+    """Guarda el callback; el test entrega el resultado cuando quiere"""
+
+    def __init__(self):
+        self.pendientes = []
+
+    def entregar(self, futuro, al_terminar, dueno=None):
+        self.pendientes.append((futuro, al_terminar))
+
+
+class BusquedaIncrementalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.entry = _Entry("per")
+        self.ejecutor = _Ejecutor()
+        self.mostrados = []
+        self.busqueda = BusquedaIncremental(
+            self.entry, obtener=lambda texto: Future(), coincide=lambda e, t: t in e,
+            mostrar=self.mostrados.append, ejecutor=self.ejecutor)
+
+    def _terminar_pendiente(self, resultados):
+        futuro, al_terminar = self.ejecutor.pendientes.pop(0)
+        al_terminar(resultados)
+
+    def test_mismo_texto_no_invalida_lo_que_esta_en_curso(self):
+        self.busqueda.ejecutar()
+        self._terminar_pendiente(["perez"])
+
+        # Página siguiente pedida con la generación actual (como ReservasWindow)
+        generacion = self.busqueda.generacion
+        self.busqueda.ejecutar()  # mismo texto: no hace nada
+
+        self.assertEqual(self.busqueda.generacion, generacion)
+        self.assertEqual(self.ejecutor.pendientes, [])
+
+    def test_texto_nuevo_descarta_el_resultado_anterior(self):
+        self.busqueda.ejecutar()
+        self.entry.texto = "gom"
+        self.busqueda.ejecutar()
+
+        self._terminar_pendiente(["perez"])
+        self._terminar_pendiente(["gomez"])
+
+        self.assertEqual(self.mostrados, [["gomez"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
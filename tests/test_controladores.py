@@ -0,0 +1,64 @@
+"""Caché compartida de los controladores (controllers/base.py)"""
+import os
+import tempfile
+import unittest
+
+from controllers.habitaciones_controller import HabitacionesController
+from controllers.huespedes_controller import HuespedesController
+from controllers.reservas_controller import ReservasController
+from database.db_manager import DatabaseManager
+
+
+class CacheControladoresTest(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.carpeta.name, "hotel.db"))
+        self.huesped_id = self.db.agregar_huesped("Ana", "López", "5550001")
+        habitacion_id = self.db.obtener_habitacion_por_numero("201").id
+        self.db.agregar_reserva(self.huesped_id, habitacion_id, "2030-01-10", "2030-01-12", 3000.0)
+        self.reserva_id = self.db.obtener_reservas()[0].id
+
+    def tearDown(self):
+        self.db.cerrar()
+        self.carpeta.cleanup()
+
+    def test_actualizar_huesped_invalida_reservas_activas(self):
+        reservas = ReservasController.para(self.db)
+        self.assertEqual([r.huesped for r in reservas.obtener_activas()], ["Ana López"])
+
+        HuespedesController.para(self.db).actualizar_huesped(self.huesped_id, "Ana", "Ruiz", "5550001", "")
+
+        self.assertEqual([r.huesped for r in reservas.obtener_activas()], ["Ana Ruiz"])
+
+    def test_actualizar_huesped_invalida_busqueda(self):
+        huespedes = HuespedesController.para(self.db)
+        self.assertEqual([h.apellido for h in huespedes.buscar("Ana")], ["López"])
+
+        huespedes.actualizar_huesped(self.huesped_id, "Ana", "Ruiz", "5550001", "")
+
+        self.assertEqual([h.apellido for h in huespedes.buscar("Ana")], ["Ruiz"])
+
+    def test_cancelar_reserva_invalida_disponibles(self):
+        habitaciones = HabitacionesController.para(self.db)
+        libres = [h.numero for h in habitaciones.disponibles_en("2030-01-10", "2030-01-12")]
+        self.assertNotIn("201", libres)
+
+        ReservasController.para(self.db).cancelar_reserva(self.reserva_id)
+
+        libres = [h.numero for h in habitaciones.disponibles_en("2030-01-10", "2030-01-12")]
+        self.assertIn("201", libres)
+
+    def test_huesped_agregado_aparece_en_busqueda(self):
+        huespedes = HuespedesController.para(self.db)
+        self.assertEqual([h.apellido for h in huespedes.buscar("Gomez")], [])
+        version = self.db.version_tabla("huespedes")
+
+        self.db.agregar_huesped("Luis", "Gómez", "5550002")
+
+        self.assertNotEqual(self.db.version_tabla("huespedes"), version)
+        self.assertEqual([h.apellido for h in huespedes.buscar("Gomez")], ["Gómez"])
+
+
+if __name__ == "__main__":
+    unittest.main()
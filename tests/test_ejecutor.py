@@ -0,0 +1,50 @@
+"""Entrega de resultados del ejecutor (database/ejecutor.py) sin ventana"""
+import tkinter as tk
+import unittest
+from concurrent.futures import Future
+
+from database.ejecutor import EjecutorBD
+
+
+class _WidgetDestruido:
+    """Widget de una aplicación Tk ya destruida"""
+
+    def winfo_exists(self):
+        raise tk.TclError("can't invoke \"winfo\" command: application has been destroyed")
+
+
+class _IndicadorDestruido:
+    def __init__(self):
+        self.terminadas = 0
+
+    def terminar(self):
+        self.terminadas += 1
+        raise tk.TclError("invalid command name")
+
+
+class EntregaResultadoTest(unittest.TestCase):
+
+    def test_aplicacion_destruida_no_llama_callbacks_ni_lanza(self):
+        futuro = Future()
+        futuro.set_result(["fila"])
+        llamadas = []
+        indicador = _IndicadorDestruido()
+
+        EjecutorBD._entregar_resultado(futuro, llamadas.append, llamadas.append,
+                                       _WidgetDestruido(), indicador)
+
+        self.assertEqual(llamadas, [])
+        self.assertEqual(indicador.terminadas, 1)
+
+    def test_sin_dueno_entrega_el_resultado(self):
+        futuro = Future()
+        futuro.set_result(["fila"])
+        llamadas = []
+
+        EjecutorBD._entregar_resultado(futuro, llamadas.append, None, None, None)
+
+        self.assertEqual(llamadas, [["fila"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
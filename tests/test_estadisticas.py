@@ -0,0 +1,36 @@
+"""Contadores del dashboard (database/estadisticas.py) con escrituras de otra conexión"""
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from database.db_manager import DatabaseManager
+
+
+class EstadisticasTest(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.carpeta.name, "hotel.db")
+        self.db = DatabaseManager(self.ruta)
+
+    def tearDown(self):
+        self.db.cerrar()
+        self.carpeta.cleanup()
+
+    def test_cambio_de_otra_terminal_actualiza_contadores(self):
+        antes = self.db.obtener_estadisticas()
+
+        # Otra terminal: conexión propia, sin pasar por el DatabaseManager
+        otra = sqlite3.connect(self.ruta)
+        otra.execute("UPDATE habitaciones SET estado = 'ocupada' WHERE numero = '101'")
+        otra.commit()
+        otra.close()
+
+        despues = self.db.obtener_estadisticas()
+        self.assertEqual(despues['disponibles'], antes['disponibles'] - 1)
+        self.assertEqual(despues['ocupadas'], antes['ocupadas'] + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+"""Mapa de identidad (database/identidad.py) con escrituras de otra conexión"""
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from database.db_manager import DatabaseManager
+
+
+class MapaIdentidadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.carpeta.name, "hotel.db")
+        self.db = DatabaseManager(self.ruta)
+        self.huesped_id = self.db.agregar_huesped("Ana", "López", "5550001")
+
+    def tearDown(self):
+        self.db.cerrar()
+        self.carpeta.cleanup()
+
+    def test_cambio_de_otra_terminal_no_se_sirve_viejo(self):
+        self.assertEqual(self.db.obtener_huesped_por_id(self.huesped_id).apellido, "López")
+
+        # Otra terminal: conexión propia, sin pasar por el DatabaseManager
+        otra = sqlite3.connect(self.ruta)
+        otra.execute("UPDATE huespedes SET apellido = 'Ruiz' WHERE id = ?", (self.huesped_id,))
+        otra.commit()
+        otra.close()
+
+        self.assertEqual(self.db.obtener_huesped_por_id(self.huesped_id).apellido, "Ruiz")
+
+
+if __name__ == "__main__":
+    unittest.main()
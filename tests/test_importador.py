@@ -0,0 +1,49 @@
+"""Importación masiva (database/importador.py) a través de DatabaseManager.escribir_lote"""
+import os
+import tempfile
+import unittest
+
+from controllers.huespedes_controller import HuespedesController
+from database.db_manager import DatabaseManager
+from database.importador import importar
+
+
+class ImportadorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.carpeta.name, "hotel.db"))
+
+    def tearDown(self):
+        self.db.cerrar()
+        self.carpeta.cleanup()
+
+    def _csv(self, nombre, *lineas):
+        ruta = os.path.join(self.carpeta.name, nombre)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write("\n".join(lineas) + "\n")
+        return ruta
+
+    def test_lote_de_huespedes_invalida_la_cache_y_rechaza_repetidos(self):
+        huespedes = HuespedesController.para(self.db)
+        self.assertEqual(huespedes.buscar("Quiroga"), [])
+
+        ruta = self._csv("huespedes.csv", "nombre,apellido,telefono,email",
+                         "Eva,Quiroga,5559001,", "Leo,Quiroga,5559002,", "Otra,Quiroga,5559001,")
+        resultado = importar(self.db, "huespedes", ruta)
+
+        self.assertEqual(resultado.insertadas, 2)
+        self.assertEqual([r.linea for r in resultado.rechazos], [4])
+        self.assertEqual(sorted(h.nombre for h in huespedes.buscar("Quiroga")), ["Eva", "Leo"])
+
+    def test_habitaciones_importadas_cuentan_en_estadisticas(self):
+        disponibles = self.db.obtener_estadisticas()["disponibles"]
+
+        ruta = self._csv("habitaciones.csv", "numero,tipo,precio", "901,Doble,950", "902,Doble,950")
+        importar(self.db, "habitaciones", ruta)
+
+        self.assertEqual(self.db.obtener_estadisticas()["disponibles"], disponibles + 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
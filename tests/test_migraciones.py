@@ -0,0 +1,44 @@
+"""Migraciones versionadas (database/migraciones.py)"""
+import sqlite3
+import unittest
+from unittest import mock
+
+from database import migraciones
+
+
+class MigracionesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("CREATE TABLE reservaciones (id INTEGER PRIMARY KEY)")
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_migracion_que_falla_no_queda_a_medias(self):
+        pasos = [
+            (1, "Correcta", ["CREATE TABLE uno (x)"]),
+            (2, "Falla en la segunda sentencia", ["CREATE TABLE dos (x)", "CREATE TABLE uno (x)"]),
+        ]
+        with mock.patch.object(migraciones, "MIGRACIONES", pasos):
+            with self.assertRaises(sqlite3.OperationalError):
+                migraciones.migrar(self.conn)
+
+        self.assertEqual(migraciones.version_actual(self.conn), 1)
+        tablas = {fila[0] for fila in self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        self.assertIn("uno", tablas)
+        self.assertNotIn("dos", tablas)
+
+    def test_migraciones_reales_llegan_a_la_ultima_version(self):
+        self.conn.execute("CREATE TABLE huespedes (id INTEGER PRIMARY KEY, nombre, apellido, telefono, email)")
+        self.conn.execute("CREATE TABLE habitaciones (id INTEGER PRIMARY KEY, estado)")
+        self.conn.execute("ALTER TABLE reservaciones ADD COLUMN huesped_id")
+        for columna in ("habitacion_id", "fecha_entrada", "fecha_salida", "estado"):
+            self.conn.execute(f"ALTER TABLE reservaciones ADD COLUMN {columna}")
+
+        self.assertEqual(migraciones.migrar(self.conn), migraciones.MIGRACIONES[-1][0])
+        self.assertFalse(self.conn.in_transaction)
+
+
+if __name__ == "__main__":
+    unittest.main()
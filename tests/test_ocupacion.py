@@ -0,0 +1,80 @@
+"""Matriz de ocupación (database/ocupacion.py) y su uso en database.analitica"""
+import os
+import tempfile
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+
+from database import analitica
+from database.db_manager import DatabaseManager
+from database.importador import importar
+from database.ocupacion import MatrizOcupacion
+
+
+def _dia(desplazamiento):
+    return (date.today() + timedelta(days=desplazamiento)).isoformat()
+
+
+class MatrizOcupacionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.carpeta.name, "hotel.db"))
+        self.db.agregar_huesped("Ana", "López", "5550001")
+        # Primera lectura: la matriz se genera completa
+        self.db.calendario_habitacion(1, _dia(10), _dia(20))
+
+    def tearDown(self):
+        self.db.cerrar()
+        self.carpeta.cleanup()
+
+    def test_lote_importado_se_aplica_sin_reconstruir(self):
+        ruta = os.path.join(self.carpeta.name, "reservas.csv")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write("habitacion,huesped_telefono,fecha_entrada,fecha_salida,estado\n")
+            archivo.write(f"101,5550001,{_dia(10)},{_dia(12)},activa\n")
+            archivo.write(f"102,5550001,{_dia(11)},{_dia(14)},activa\n")
+            archivo.write(f"101,5550001,{_dia(15)},{_dia(16)},activa\n")
+
+        with mock.patch.object(MatrizOcupacion, "_reconstruir", autospec=True,
+                               side_effect=MatrizOcupacion._reconstruir) as reconstruir:
+            self.assertEqual(importar(self.db, "reservas", ruta).insertadas, 3)
+            calendario = self.db.calendario_habitacion(
+                self.db.obtener_habitacion_por_numero("101").id, _dia(10), _dia(17))
+
+        reconstruir.assert_not_called()
+        self.assertEqual(calendario, ["activa", "activa", "libre", "libre", "libre", "activa", "libre"])
+
+    @unittest.skipUnless(analitica.NUMPY_DISPONIBLE, "requiere NumPy")
+    def test_reporte_cuenta_noches_de_la_matriz(self):
+        habitacion_id = self.db.obtener_habitacion_por_numero("101").id
+        self.db.agregar_reserva(1, habitacion_id, _dia(10), _dia(13), 3000.0)
+
+        with mock.patch.object(self.db, "ocupacion_por_dia", wraps=self.db.ocupacion_por_dia) as por_dia:
+            reporte = analitica.calcular_reporte(self.db, _dia(10), _dia(14))
+
+        por_dia.assert_called()
+        self.assertEqual(reporte.resumen()["Total"]["noches"], 3)
+        self.assertAlmostEqual(reporte.resumen()["Total"]["adr"], 1000.0)
+
+    @unittest.skipUnless(analitica.NUMPY_DISPONIBLE, "requiere NumPy")
+    def test_noche_con_finalizada_y_activa_cuenta_una_vez(self):
+        habitacion_id = self.db.obtener_habitacion_por_numero("101").id
+        self.db.agregar_reserva(1, habitacion_id, _dia(10), _dia(13), 3000.0)
+        # Finalizada importada que se cruza en las noches 11 y 12 (a 500 por noche)
+        ruta = os.path.join(self.carpeta.name, "historico.csv")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write("habitacion,huesped_telefono,fecha_entrada,fecha_salida,total,estado\n")
+            archivo.write(f"101,5550001,{_dia(11)},{_dia(15)},2000,finalizada\n")
+        importar(self.db, "reservas", ruta)
+
+        resumen = analitica.calcular_reporte(self.db, _dia(10), _dia(14)).resumen()["Total"]
+
+        # Noches 10-12 de la activa (1000 c/u) y 13-14 de la finalizada (500 c/u)
+        self.assertEqual(resumen["noches"], 5)
+        self.assertAlmostEqual(resumen["ingresos"], 4000.0)
+        self.assertAlmostEqual(resumen["adr"], 800.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
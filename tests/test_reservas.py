@@ -0,0 +1,36 @@
+"""Reservas dobles (DatabaseManager.agregar_reserva / actualizar_reserva)"""
+import os
+import tempfile
+import unittest
+
+from database.db_manager import DatabaseManager
+
+
+class SolapamientoReservasTest(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.carpeta.name, "hotel.db"))
+        self.huesped_id = self.db.agregar_huesped("Ana", "López", "5550001")
+        self.habitacion_id = self.db.obtener_habitacion_por_numero("201").id
+        self.db.agregar_reserva(self.huesped_id, self.habitacion_id, "2030-01-10", "2030-01-12", 3000.0)
+        self.db.agregar_reserva(self.huesped_id, self.habitacion_id, "2030-01-15", "2030-01-17", 3000.0)
+        self.segunda = max(r.id for r in self.db.obtener_reservas())
+
+    def tearDown(self):
+        self.db.cerrar()
+        self.carpeta.cleanup()
+
+    def test_actualizar_sobre_otra_reserva_activa_se_rechaza(self):
+        self.assertFalse(self.db.actualizar_reserva(self.segunda, self.huesped_id, self.habitacion_id,
+                                                    "2030-01-11", "2030-01-16", "activa", 7500.0))
+        self.assertEqual(self.db.obtener_reserva_por_id(self.segunda).fecha_entrada, "2030-01-15")
+
+    def test_actualizar_sin_cruce_no_choca_consigo_misma(self):
+        self.assertTrue(self.db.actualizar_reserva(self.segunda, self.huesped_id, self.habitacion_id,
+                                                   "2030-01-14", "2030-01-17", "activa", 4500.0))
+        self.assertEqual(self.db.obtener_reserva_por_id(self.segunda).fecha_entrada, "2030-01-14")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+"""Planes de consulta (database/verificar_planes.py) sobre un hotel con datos"""
+import os
+import tempfile
+import unittest
+
+from database.db_manager import DatabaseManager
+from database.generador import generar
+from database.verificar_planes import _capturar_sentencias, verificar
+
+
+class VerificarPlanesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.db = DatabaseManager(os.path.join(self.carpeta.name, "hotel.db"))
+
+    def tearDown(self):
+        self.db.cerrar()
+        self.carpeta.cleanup()
+
+    def test_ninguna_consulta_recorre_tablas_completas(self):
+        # Con datos, como en producción (la base vacía de main() no tiene reservas)
+        generar(self.db, habitaciones=40, huespedes=500, anios=1, hoy="2025-01-01")
+
+        self.assertEqual(verificar(self.db), [])
+
+    def test_instrumentacion_sigue_capturando_despues(self):
+        self.assertTrue(_capturar_sentencias(self.db, "obtener_habitaciones", ()))
+
+        self.db.instrumentacion.umbral_ms = 0
+        with self.assertLogs("database.lentas") as registro:
+            self.db.obtener_habitaciones()
+        self.assertIn("SELECT * FROM habitaciones", registro.output[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+# utils/arranque.py
+import os
+import sys
+import time
+
+# Referencia para medir desde el inicio del proceso (main.py importa este módulo primero)
+INICIO_PROCESO = time.perf_counter()
+
+# Si está definida, los tiempos se imprimen en stderr
+VARIABLE_MEDICION = "HOTEL_MEDIR_ARRANQUE"
+
+# ventana -> segundos hasta su primer frame
+TIEMPOS = {}
+_observadores = []
+
+
+def registrar_observador(funcion):
+    """Registra funcion(nombre, segundos), llamada al medir cada ventana"""
+    _observadores.append(funcion)
+
+
+def medir_primer_frame(ventana, nombre, inicio=None):
+    """Mide el tiempo hasta que `ventana` se dibuja por primera vez.
+
+    La ventana cuenta como dibujada cuando se mapea y Tk termina las tareas
+    pendientes (after_idle). inicio es un time.perf_counter(); por defecto,
+    el arranque del proceso.
+    """
+    inicio = INICIO_PROCESO if inicio is None else inicio
+
+    def registrar():
+        segundos = time.perf_counter() - inicio
+        TIEMPOS[nombre] = segundos
+
+        if os.environ.get(VARIABLE_MEDICION):
+            print(f"[arranque] {nombre}: primer frame en {segundos * 1000:.0f} ms", file=sys.stderr)
+        for funcion in _observadores:
+            funcion(nombre, segundos)
+
+    medida = []
+
+    def al_mapear(event):
+        # <Map> se repite al minimizar/restaurar: solo cuenta el primero
+        if event.widget is ventana and not medida:
+            medida.append(True)
+            ventana.after_idle(registrar)
+
+    ventana.bind("<Map>", al_mapear, add="+")
@@ -0,0 +1,8 @@
+# utils/constantes.py
+
+# Valores admitidos en las columnas con opciones fijas
+TIPOS_HABITACION = ("Sencilla", "Doble", "Familiar", "Deluxe")
+ESTADOS_HABITACION = ("disponible", "ocupada", "limpieza", "mantenimiento")
+ESTADOS_RESERVA = ("activa", "finalizada", "cancelada")
+
+FORMATO_FECHA = "%Y-%m-%d"
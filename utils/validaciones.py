@@ -0,0 +1,117 @@
+# utils/validaciones.py
+"""Validación de datos de entrada (formularios e importación masiva).
+
+Cada función recibe valores tal como llegan (texto de un Entry, una celda de
+CSV o un valor JSON), devuelve el valor normalizado y lanza ValueError con un
+mensaje para el usuario si no es válido.
+"""
+from datetime import datetime
+
+from utils.constantes import (
+    ESTADOS_HABITACION, ESTADOS_RESERVA, FORMATO_FECHA, TIPOS_HABITACION
+)
+
+
+def _texto(valor):
+    return "" if valor is None else str(valor).strip()
+
+
+def requerido(valor, campo):
+    """Texto no vacío"""
+    texto = _texto(valor)
+    if not texto:
+        raise ValueError(f"El campo {campo} es obligatorio")
+    return texto
+
+
+def opcional(valor):
+    """Texto, vacío si no viene"""
+    return _texto(valor)
+
+
+def numero_positivo(valor, campo):
+    """Número mayor a 0 (acepta coma decimal)"""
+    texto = requerido(valor, campo).replace(",", ".")
+    try:
+        numero = float(texto)
+    except ValueError:
+        raise ValueError(f"El campo {campo} debe ser un número") from None
+    if numero <= 0:
+        raise ValueError(f"El campo {campo} debe ser mayor a 0")
+    return numero
+
+
+def entero(valor, campo):
+    """Número entero"""
+    texto = requerido(valor, campo)
+    try:
+        return int(texto)
+    except ValueError:
+        raise ValueError(f"El campo {campo} debe ser un número entero") from None
+
+
+def fecha(valor, campo):
+    """Fecha AAAA-MM-DD (se devuelve como texto, igual que se guarda)"""
+    texto = requerido(valor, campo)
+    try:
+        return datetime.strptime(texto, FORMATO_FECHA).strftime(FORMATO_FECHA)
+    except ValueError:
+        raise ValueError(f"El campo {campo} debe tener el formato AAAA-MM-DD") from None
+
+
+def opcion(valor, campo, opciones, por_defecto=None):
+    """Uno de los valores de `opciones`, sin distinguir mayúsculas"""
+    texto = _texto(valor)
+    if not texto and por_defecto is not None:
+        return por_defecto
+    for valida in opciones:
+        if texto.lower() == valida.lower():
+            return valida
+    raise ValueError(f"El campo {campo} debe ser uno de: {', '.join(opciones)}")
+
+
+def email(valor):
+    """Email opcional con forma básica usuario@dominio"""
+    texto = opcional(valor)
+    if texto and ("@" not in texto or texto.startswith("@") or "." not in texto.split("@")[-1]):
+        raise ValueError(f"Email inválido: {texto}")
+    return texto
+
+
+def validar_habitacion(datos):
+    """(numero, tipo, precio, estado) desde un dict con esas claves"""
+    return (
+        requerido(datos.get("numero"), "numero"),
+        opcion(datos.get("tipo"), "tipo", TIPOS_HABITACION),
+        numero_positivo(datos.get("precio"), "precio"),
+        opcion(datos.get("estado"), "estado", ESTADOS_HABITACION, por_defecto="disponible"),
+    )
+
+
+def validar_huesped(datos):
+    """(nombre, apellido, telefono, email) desde un dict con esas claves"""
+    return (
+        requerido(datos.get("nombre"), "nombre"),
+        requerido(datos.get("apellido"), "apellido"),
+        requerido(datos.get("telefono"), "telefono"),
+        email(datos.get("email")),
+    )
+
+
+def validar_reserva(datos):
+    """Valida los campos propios de una reserva.
+
+    Devuelve (fecha_entrada, fecha_salida, total o None, estado); el huésped y
+    la habitación se resuelven contra la base de datos.
+    """
+    entrada = fecha(datos.get("fecha_entrada"), "fecha_entrada")
+    salida = fecha(datos.get("fecha_salida"), "fecha_salida")
+    if salida <= entrada:
+        raise ValueError("La fecha de salida debe ser posterior a la de entrada")
+
+    total = None
+    if _texto(datos.get("total")):
+        total = numero_positivo(datos.get("total"), "total")
+
+    estado = opcion(datos.get("estado"), "estado", ESTADOS_RESERVA, por_defecto="activa")
+    return entrada, salida, total, estado